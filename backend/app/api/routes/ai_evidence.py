@@ -1,19 +1,22 @@
 """
 AI Evidence Validation & Client Concierge API (Next Layer).
-Extraction implemented; analyze/aggregates/tasks/assistant stubs per docs/next layer/.
+Extraction implemented (queued, drained by services/extraction_worker.py); analyze/aggregates/tasks/assistant stubs per docs/next layer/.
+Batch analysis of a whole assessment runs as a background job (services/evidence_analysis_jobs.py).
 """
 import logging
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.session import get_db
-from app.core.auth import get_current_user
-from app.models.models import User, EvidenceFile, Assessment, TenantMember, Control
+from app.core.auth import get_current_user, find_membership
+from app.db import loaders
+from app.models.models import User, Assessment, BackgroundJob
 from app.models.ai_evidence import EvidenceExtraction, EvidenceAssessmentResult, ControlExpectationSpec, ClientNote
 from app.schemas.ai_evidence import (
     EvidenceExtractionRequest,
     EvidenceExtractionStatusDTO,
     EvidenceAnalyzeRequest,
+    EvidenceBatchAnalyzeRequest,
     EvidenceAssessmentResultDTO,
     ControlEvidenceAggregateDTO,
     ClientTaskDTO,
@@ -24,9 +27,13 @@ from app.schemas.ai_evidence import (
     AssistantChatResponse,
 )
 from app.services.audit import log_event
-from app.services.evidence_extraction import get_or_create_extraction, run_extraction
-from app.services.claude_analyst import analyze_evidence_with_claude
-from app.services.evidence_aggregator import recompute_control_aggregates, get_aggregates_dict
+from app.services.evidence_extraction import get_or_create_extraction
+from app.services.extraction_worker import notify_pending
+from app.services.claude_analyst import PROMPT_VERSION
+from app.services.analysis_cache import analyze_with_cache
+from app.services.evidence_analysis_jobs import EVIDENCE_ANALYZE_JOB
+from app.services.job_queue import enqueue_job, get_active_job
+from app.services.evidence_aggregator import recompute_control_aggregates, apply_result_deltas, get_aggregates_dict
 from app.core.config import settings
 
 router = APIRouter(tags=["ai-evidence"])
@@ -40,25 +47,12 @@ async def _require_evidence_and_assessment_membership(
     assessment_id: str,
 ) -> tuple[str, str]:
     """Load assessment and evidence file; verify evidence belongs to assessment tenant and user is member. Returns (tenant_id, assessment_id)."""
-    r = await db.execute(select(Assessment).where(Assessment.id == assessment_id))
-    assessment = r.scalar_one_or_none()
+    assessment = await loaders.get_assessment(db, assessment_id)
     if not assessment:
         raise HTTPException(status_code=404, detail="Assessment not found")
-    r = await db.execute(
-        select(TenantMember).where(
-            TenantMember.tenant_id == assessment.tenant_id,
-            TenantMember.user_id == current_user.id,
-        )
-    )
-    if not r.scalar_one_or_none():
+    if not await find_membership(db, assessment.tenant_id, current_user.id):
         raise HTTPException(status_code=403, detail="Not a member of this tenant")
-    r = await db.execute(
-        select(EvidenceFile).where(
-            EvidenceFile.id == evidence_file_id,
-            EvidenceFile.tenant_id == assessment.tenant_id,
-        )
-    )
-    if not r.scalar_one_or_none():
+    if not await loaders.get_evidence_file(db, evidence_file_id, assessment.tenant_id):
         raise HTTPException(status_code=404, detail="Evidence file not found or not in this tenant")
     return assessment.tenant_id, assessment_id
 
@@ -68,6 +62,7 @@ async def _require_evidence_and_assessment_membership(
 @router.post(
     "/evidence/{evidence_file_id}/extract",
     response_model=dict,
+    status_code=202,
     summary="Request evidence extraction",
 )
 async def request_extraction(
@@ -76,35 +71,42 @@ async def request_extraction(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """POST /api/v1/evidence/{id}/extract — create/get extraction, run synchronously, return status."""
+    """POST /api/v1/evidence/{id}/extract — create/get extraction and queue it for the extraction workers.
+    Content already extracted for another assessment is returned as extracted right away.
+    Poll GET /evidence/{id}/extraction until status is extracted | extract_failed."""
     tenant_id, assessment_id = await _require_evidence_and_assessment_membership(
         db, current_user, evidence_file_id, body.assessment_id
     )
     ext, _ = await get_or_create_extraction(
         db, evidence_file_id, tenant_id, assessment_id, force_reextract=body.force_reextract
     )
-    await run_extraction(db, ext.id)
     await db.commit()
     await db.refresh(ext)
-    res = ext.extraction_result or {}
+    if ext.status == "extract_pending":
+        notify_pending()
+    return {
+        "success": True,
+        "data": _extraction_payload(ext, evidence_file_id),
+        "error": ext.error_message,
+    }
+
+
+def _extraction_payload(ext: EvidenceExtraction, evidence_file_id: str) -> dict:
+    res = ext.result or {}
     # Avoid returning full extracted_text in response; keep summary + short preview
     meta = {k: v for k, v in res.items() if k != "extracted_text"}
     if res.get("extracted_text"):
         txt = res["extracted_text"]
         meta["preview"] = (txt[:500] + "…") if len(txt) > 500 else txt
     return {
-        "success": ext.status == "extracted",
-        "data": {
-            "extraction_id": ext.id,
-            "evidence_file_id": evidence_file_id,
-            "status": ext.status,
-            "language_detected": res.get("language_detected"),
-            "has_text": res.get("has_text"),
-            "has_tables": res.get("has_tables"),
-            "metadata": meta,
-            "updated_at": ext.updated_at.isoformat() if ext.updated_at else None,
-        },
-        "error": ext.error_message,
+        "extraction_id": ext.id,
+        "evidence_file_id": evidence_file_id,
+        "status": ext.status,
+        "language_detected": res.get("language_detected"),
+        "has_text": res.get("has_text"),
+        "has_tables": res.get("has_tables"),
+        "metadata": meta,
+        "updated_at": ext.updated_at.isoformat() if ext.updated_at else None,
     }
 
 
@@ -136,23 +138,9 @@ async def get_extraction(
     ext = r.scalar_one_or_none()
     if not ext:
         raise HTTPException(status_code=404, detail="Extraction not found")
-    res = ext.extraction_result or {}
-    meta = {k: v for k, v in res.items() if k != "extracted_text"}
-    if res.get("extracted_text"):
-        txt = res["extracted_text"]
-        meta["preview"] = (txt[:500] + "…") if len(txt) > 500 else txt
     return {
         "success": True,
-        "data": {
-            "extraction_id": ext.id,
-            "evidence_file_id": evidence_file_id,
-            "status": ext.status,
-            "language_detected": res.get("language_detected"),
-            "has_text": res.get("has_text"),
-            "has_tables": res.get("has_tables"),
-            "metadata": meta,
-            "updated_at": ext.updated_at.isoformat() if ext.updated_at else None,
-        },
+        "data": _extraction_payload(ext, evidence_file_id),
         "error": ext.error_message,
     }
 
@@ -170,7 +158,7 @@ async def request_analyze(
     db: AsyncSession = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
-    """POST /api/v1/evidence/{id}/analyze — run Claude analyst, store EvidenceAssessmentResult."""
+    """POST /api/v1/evidence/{id}/analyze — run Claude analyst (cached by document hash), store EvidenceAssessmentResult."""
     tenant_id, assessment_id = await _require_evidence_and_assessment_membership(
         db, current_user, evidence_file_id, body.assessment_id
     )
@@ -187,15 +175,14 @@ async def request_analyze(
         .limit(1)
     )
     ext = r.scalar_one_or_none()
-    if not ext or not ext.extraction_result:
+    if not ext or not ext.result:
         raise HTTPException(
             status_code=400,
             detail="No successful extraction found. Run POST /evidence/{id}/extract first.",
         )
-    extracted_text = (ext.extraction_result or {}).get("extracted_text") or ""
+    extracted_text = (ext.result or {}).get("extracted_text") or ""
     # Control
-    rc = await db.execute(select(Control).where(Control.id == body.control_id))
-    control = rc.scalar_one_or_none()
+    control = await loaders.get_control(db, body.control_id)
     if not control:
         raise HTTPException(status_code=404, detail="Control not found")
     # Optional expectation spec
@@ -204,12 +191,15 @@ async def request_analyze(
     )
     spec = rspec.scalar_one_or_none()
     guidance = (spec.guidance_text if spec else None) or ""
-    # Run Claude
-    result = analyze_evidence_with_claude(
+    # Run Claude (or reuse a cached result for the same text/control/guidance/prompt/model)
+    result, cache_hit = await analyze_with_cache(
+        db,
+        tenant_id=tenant_id,
         extracted_text=extracted_text,
         control_code=(control.hipaa_control_id or control.id)[:64],
         control_title=(control.title or "")[:256],
         expectation_guidance=guidance or None,
+        force_reanalyze=body.force_reanalyze,
     )
     # Persist
     ear = EvidenceAssessmentResult(
@@ -220,26 +210,19 @@ async def request_analyze(
         extraction_id=ext.id,
         provider="anthropic",
         model=settings.LLM_MODEL,
-        prompt_version="1.0",
+        prompt_version=PROMPT_VERSION,
         status=result["status"],
         overall_strength=result.get("overall_strength"),
         confidence=result.get("confidence"),
         result_payload=result,
     )
     db.add(ear)
+    await db.flush()
+    # Result and its aggregate delta are committed together
+    await apply_result_deltas(db, [ear])
     await db.commit()
     await db.refresh(ear)
 
-    try:
-        await recompute_control_aggregates(
-            assessment_id=assessment_id,
-            tenant_id=tenant_id,
-            db=db,
-            control_id=str(body.control_id),
-        )
-    except Exception:
-        pass
-
     return {
         "success": True,
         "data": {
@@ -250,12 +233,99 @@ async def request_analyze(
             "overall_strength": ear.overall_strength,
             "confidence": ear.confidence,
             "document_type_detected": result.get("document_type_detected"),
+            "cached": cache_hit,
             "created_at": ear.created_at.isoformat() if ear.created_at else None,
         },
         "error": None,
     }
 
 
+async def _require_assessment_membership(db: AsyncSession, current_user: User, assessment_id: str) -> Assessment:
+    assessment = await loaders.get_assessment(db, assessment_id)
+    if not assessment:
+        raise HTTPException(status_code=404, detail="Assessment not found")
+    if not await find_membership(db, assessment.tenant_id, current_user.id):
+        raise HTTPException(status_code=403, detail="Not a member of this tenant")
+    return assessment
+
+
+def _analysis_job_payload(job: BackgroundJob) -> dict:
+    return {
+        "job_id": job.id,
+        "assessment_id": job.entity_id,
+        "status": job.status,
+        "progress": job.progress or {},
+        "attempts": job.attempts,
+        "result": job.result if job.status == "completed" else None,
+        "created_at": job.created_at.isoformat() if job.created_at else None,
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+    }
+
+
+@router.post(
+    "/assessments/{assessment_id}/evidence/analyze",
+    response_model=dict,
+    status_code=202,
+    summary="Analyze all extracted evidence of an assessment (background job)",
+)
+async def request_batch_analyze(
+    assessment_id: str,
+    body: EvidenceBatchAnalyzeRequest,
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    """POST — enqueue analysis of every (extracted file, linked control) pair; poll GET with job_id."""
+    assessment = await _require_assessment_membership(db, current_user, assessment_id)
+    if not settings.CLAUDE_ANALYST_ENABLED or not settings.ANTHROPIC_API_KEY:
+        raise HTTPException(status_code=503, detail="AI analyst is disabled or not configured.")
+
+    job = await get_active_job(db, EVIDENCE_ANALYZE_JOB, "assessment", assessment_id)
+    if job is None:
+        job = await enqueue_job(
+            db,
+            tenant_id=assessment.tenant_id,
+            job_type=EVIDENCE_ANALYZE_JOB,
+            entity_type="assessment",
+            entity_id=assessment_id,
+            payload={"force_reanalyze": body.force_reanalyze},
+            requested_by_user_id=current_user.id,
+            progress={"total": None, "done": 0},
+        )
+        await log_event(
+            db, "evidence_analysis_started",
+            tenant_id=assessment.tenant_id, user_id=current_user.id,
+            entity_type="assessment", entity_id=assessment_id,
+            payload={"job_id": job.id, "force_reanalyze": body.force_reanalyze},
+        )
+    return {"success": True, "data": _analysis_job_payload(job), "error": None}
+
+
+@router.get(
+    "/assessments/{assessment_id}/evidence/analyze",
+    response_model=dict,
+    summary="Batch evidence analysis job status",
+)
+async def get_batch_analyze_status(
+    assessment_id: str,
+    job_id: str = Query(..., description="Job id returned by POST"),
+    db: AsyncSession = Depends(get_db),
+    current_user: User = Depends(get_current_user),
+):
+    assessment = await _require_assessment_membership(db, current_user, assessment_id)
+    r = await db.execute(
+        select(BackgroundJob).where(
+            BackgroundJob.id == job_id,
+            BackgroundJob.tenant_id == assessment.tenant_id,
+            BackgroundJob.job_type == EVIDENCE_ANALYZE_JOB,
+            BackgroundJob.entity_id == assessment_id,
+        )
+    )
+    job = r.scalar_one_or_none()
+    if not job:
+        raise HTTPException(status_code=404, detail="Analysis job not found")
+    return {"success": True, "data": _analysis_job_payload(job), "error": job.error}
+
+
 @router.get(
     "/assessments/{assessment_id}/controls/{control_id}/evidence-results",
     response_model=dict,
@@ -270,18 +340,7 @@ async def get_evidence_results(
 ):
     """GET /api/v1/assessments/{id}/controls/{id}/evidence-results — list EvidenceAssessmentResult for assessment+control."""
     # Resolve tenant and membership via assessment
-    r = await db.execute(select(Assessment).where(Assessment.id == assessment_id))
-    assessment = r.scalar_one_or_none()
-    if not assessment:
-        raise HTTPException(status_code=404, detail="Assessment not found")
-    r = await db.execute(
-        select(TenantMember).where(
-            TenantMember.tenant_id == assessment.tenant_id,
-            TenantMember.user_id == current_user.id,
-        )
-    )
-    if not r.scalar_one_or_none():
-        raise HTTPException(status_code=403, detail="Not a member of this tenant")
+    await _require_assessment_membership(db, current_user, assessment_id)
     q = (
         select(EvidenceAssessmentResult)
         .where(
@@ -328,18 +387,7 @@ async def recompute_aggregates(
     current_user: User = Depends(get_current_user),
 ):
     """POST recompute-evidence-aggregates — пересчитать все агрегаты по контролам для assessment."""
-    r = await db.execute(select(Assessment).where(Assessment.id == assessment_id))
-    assessment = r.scalar_one_or_none()
-    if not assessment:
-        raise HTTPException(status_code=404, detail="Assessment not found")
-    r = await db.execute(
-        select(TenantMember).where(
-            TenantMember.tenant_id == assessment.tenant_id,
-            TenantMember.user_id == current_user.id,
-        )
-    )
-    if not r.scalar_one_or_none():
-        raise HTTPException(status_code=403, detail="Not a member of this tenant")
+    assessment = await _require_assessment_membership(db, current_user, assessment_id)
 
     aggregates = await recompute_control_aggregates(
         assessment_id=assessment_id,
@@ -377,18 +425,7 @@ async def get_evidence_aggregates(
     current_user: User = Depends(get_current_user),
 ):
     """GET evidence-aggregates — список агрегатов по всем контролам для assessment."""
-    r = await db.execute(select(Assessment).where(Assessment.id == assessment_id))
-    assessment = r.scalar_one_or_none()
-    if not assessment:
-        raise HTTPException(status_code=404, detail="Assessment not found")
-    r = await db.execute(
-        select(TenantMember).where(
-            TenantMember.tenant_id == assessment.tenant_id,
-            TenantMember.user_id == current_user.id,
-        )
-    )
-    if not r.scalar_one_or_none():
-        raise HTTPException(status_code=403, detail="Not a member of this tenant")
+    assessment = await _require_assessment_membership(db, current_user, assessment_id)
 
     agg_dict = await get_aggregates_dict(
         assessment_id=assessment_id,
@@ -468,13 +505,7 @@ async def patch_task(
 # ── Client notes (assistant alerts, red highlight) ──────────────────────────────
 
 async def _require_tenant_membership(db: AsyncSession, current_user: User, tenant_id: str) -> None:
-    r = await db.execute(
-        select(TenantMember).where(
-            TenantMember.tenant_id == tenant_id,
-            TenantMember.user_id == current_user.id,
-        )
-    )
-    if not r.scalar_one_or_none():
+    if not await find_membership(db, tenant_id, current_user.id):
         raise HTTPException(status_code=403, detail="Not a member of this tenant")
 
 
@@ -560,9 +591,7 @@ async def create_note(
 ):
     await _require_tenant_membership(db, current_user, tenant_id)
     if body.assessment_id:
-        r = await db.execute(select(Assessment).where(Assessment.id == body.assessment_id))
-        a = r.scalar_one_or_none()
-        if not a or a.tenant_id != tenant_id:
+        if not await loaders.get_assessment(db, body.assessment_id, tenant_id):
             raise HTTPException(status_code=400, detail="Assessment not in this tenant")
     note = ClientNote(tenant_id=tenant_id, assessment_id=body.assessment_id, control_id=body.control_id,
                       note_type=body.note_type or "action_required", title=body.title, body=body.body,
@@ -722,18 +751,11 @@ async def assistant_chat(
     try:
         tenant_id = body.context_id if body.context_type == "tenant" else None
         if not tenant_id and body.assessment_id:
-            r = await db.execute(select(Assessment).where(Assessment.id == body.assessment_id))
-            a = r.scalar_one_or_none()
+            a = await loaders.get_assessment(db, body.assessment_id)
             if a:
                 tenant_id = a.tenant_id
         if tenant_id:
-            r = await db.execute(
-                select(TenantMember).where(
-                    TenantMember.tenant_id == tenant_id,
-                    TenantMember.user_id == current_user.id,
-                )
-            )
-            if not r.scalar_one_or_none():
+            if not await find_membership(db, tenant_id, current_user.id):
                 return _assistant_chat_error_payload(
                     body, "Доступ запрещён: вы не являетесь участником этого тенанта."
                 )
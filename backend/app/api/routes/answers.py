@@ -1,7 +1,7 @@
 """
 Answers routes — Phase 2
 PUT  /tenants/{tenant_id}/assessments/{assessment_id}/answers/{question_id}  — upsert
-PATCH /tenants/{tenant_id}/assessments/{assessment_id}/answers/batch          — batch upsert
+PATCH /tenants/{tenant_id}/assessments/{assessment_id}/answers/batch          — batch upsert (autosave)
 GET   /tenants/{tenant_id}/assessments/{assessment_id}/answers                — list (optional ?control_id=HIPAA-GV-01)
 Per spec: Validation_Rules_v1 section 3 + API spec section 5
 """
@@ -9,15 +9,20 @@ from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from app.db.session import get_db
-from app.models.models import Assessment, Answer, Question, Control, TenantMember
+from app.models.models import Assessment, Answer, TenantMember
 from app.core.auth import get_current_user, get_membership
 from app.models.models import User
 from app.schemas.schemas import (
     UpsertAnswerRequest, BatchUpsertAnswersRequest,
     BatchUpsertAnswersResponse, AnswerDTO, AnswerWithQuestionDTO,
+    AnswerVersion, AnswerConflict,
 )
 from app.services.audit import log_event
 from app.services.answer_validator import validate_answer_value
+from app.services.engine import mark_controls_dirty
+from app.services.reference_data import QuestionRef, get_reference_cache
+from app.services.answer_store import AnswerWrite, save_answers
+from app.db import loaders
 
 router = APIRouter(
     prefix="/tenants/{tenant_id}/assessments/{assessment_id}/answers",
@@ -26,13 +31,7 @@ router = APIRouter(
 
 
 async def _get_assessment_or_404(assessment_id: str, tenant_id: str, db: AsyncSession) -> Assessment:
-    result = await db.execute(
-        select(Assessment).where(
-            Assessment.id == assessment_id,
-            Assessment.tenant_id == tenant_id,
-        )
-    )
-    a = result.scalar_one_or_none()
+    a = await loaders.get_assessment(db, assessment_id, tenant_id)
     if not a:
         raise HTTPException(status_code=404, detail="Assessment not found")
     return a
@@ -47,6 +46,39 @@ def _check_editable(assessment: Assessment) -> None:
         )
 
 
+def _validated_value(question: QuestionRef | None, value, label: str = "") -> dict:
+    """In-memory validation against cached question metadata; label names the item in batch errors."""
+    if not question:
+        raise HTTPException(status_code=404, detail=f"Question{label} not found for this framework")
+    if not question.is_active:
+        raise HTTPException(status_code=400, detail=f"Question{label} is inactive")
+
+    # Validate value per answer_type
+    value_dict = value.model_dump(exclude_none=True)
+    validate_answer_value(question.answer_type, value_dict)
+
+    # Validate select options
+    if question.answer_type == "select" and question.options:
+        choices = question.options.get("choices", [])
+        if value_dict.get("choice") not in choices:
+            raise HTTPException(
+                status_code=422,
+                detail=f"Invalid choice{' for question' + label if label else ''}. Allowed: {choices}"
+            )
+    return value_dict
+
+
+def _conflict_dto(answer: Answer, base_version: int | None) -> AnswerConflict:
+    return AnswerConflict(
+        question_id=answer.question_id,
+        base_version=base_version,
+        current_version=answer.version,
+        current_value=answer.value,
+        updated_by_user_id=answer.updated_by_user_id,
+        updated_at=answer.updated_at,
+    )
+
+
 def _answer_value_to_string(value: dict) -> str | None:
     """Serialize answer value dict to a single string for UI."""
     if not value:
@@ -72,17 +104,17 @@ async def list_answers(
 
     if control_id:
         # Return questions for this control with their current answer values
-        q_result = await db.execute(
-            select(Question, Control.hipaa_control_id)
-            .join(Control, Control.id == Question.control_id)
-            .where(
-                Question.framework_id == assessment.framework_id,
-                Question.is_active == True,
-                Control.hipaa_control_id == control_id,
-            )
-            .order_by(Question.question_code)
-        )
-        rows = q_result.all()
+        cache = get_reference_cache()
+        hipaa_by_control: dict[str, str | None] = {}
+        for version in await cache.controlset_versions(db, assessment.framework_id):
+            for c in (await cache.controls(db, version.id)).controls:
+                hipaa_by_control[c.id] = c.hipaa_control_id
+        questions = await cache.questions(db, assessment.framework_id)
+        rows = [
+            (q, hipaa_by_control[q.control_id])
+            for q in questions.active()
+            if hipaa_by_control.get(q.control_id) == control_id
+        ]
         if not rows:
             return []
         question_ids = [q.id for q, _ in rows]
@@ -107,6 +139,7 @@ async def list_answers(
                     question_type=question.answer_type,
                     options=choices,
                     answer_value=value_str,
+                    answer_version=answer.version if answer else None,
                     control_id=hipaa_id,
                 )
             )
@@ -129,59 +162,28 @@ async def upsert_answer(
     membership: TenantMember = Depends(get_membership),
     db: AsyncSession = Depends(get_db),
 ):
+    """base_version (optional): 409 with the current answer if it changed since that version."""
     assessment = await _get_assessment_or_404(assessment_id, tenant_id, db)
     _check_editable(assessment)
 
     # Validate question exists and belongs to this framework
-    q_result = await db.execute(
-        select(Question).where(
-            Question.id == question_id,
-            Question.framework_id == assessment.framework_id,
-        )
-    )
-    question = q_result.scalar_one_or_none()
-    if not question:
-        raise HTTPException(status_code=404, detail="Question not found for this framework")
-    if not question.is_active:
-        raise HTTPException(status_code=400, detail="Question is inactive")
-
-    # Validate value per answer_type
-    value_dict = body.value.model_dump(exclude_none=True)
-    validate_answer_value(question.answer_type, value_dict)
+    questions = await get_reference_cache().questions(db, assessment.framework_id)
+    question = questions.by_id.get(question_id)
+    value_dict = _validated_value(question, body.value)
 
-    # Validate select options
-    if question.answer_type == "select" and question.options:
-        choices = question.options.get("choices", [])
-        if value_dict.get("choice") not in choices:
-            raise HTTPException(
-                status_code=422,
-                detail=f"Invalid choice. Allowed: {choices}"
-            )
-
-    # Upsert
-    existing = await db.execute(
-        select(Answer).where(
-            Answer.assessment_id == assessment_id,
-            Answer.question_id == question_id,
-        )
+    saved = await save_answers(
+        db, tenant_id, assessment_id, current_user.id,
+        [AnswerWrite(question_id, value_dict, body.base_version)],
     )
-    answer = existing.scalar_one_or_none()
-
-    if answer:
-        answer.value = value_dict
-        answer.updated_by_user_id = current_user.id
-    else:
-        answer = Answer(
-            tenant_id=tenant_id,
-            assessment_id=assessment_id,
-            question_id=question_id,
-            value=value_dict,
-            updated_by_user_id=current_user.id,
+    if saved.conflicts:
+        answer, base_version = saved.conflicts[0]
+        raise HTTPException(
+            status_code=409,
+            detail=_conflict_dto(answer, base_version).model_dump(mode="json"),
         )
-        db.add(answer)
-
-    await db.flush()
-    return AnswerDTO.model_validate(answer)
+    if saved.written:
+        await mark_controls_dirty(db, tenant_id, assessment_id, [question.control_id], reason="answer")
+    return AnswerDTO.model_validate((saved.written or saved.unchanged)[0])
 
 
 @router.patch("/batch", response_model=BatchUpsertAnswersResponse)
@@ -195,8 +197,10 @@ async def batch_upsert_answers(
     db: AsyncSession = Depends(get_db),
 ):
     """
-    Batch upsert — for UI form save.
-    All items validated; fails fast on first invalid item.
+    Batch upsert — for UI form save and autosave.
+    All items validated in memory first; fails fast on the first invalid item. Valid batches are
+    written with one upsert. Items with base_version that changed since are not written and come
+    back in `conflicts`; `versions` holds the new version of every saved or unchanged answer.
     """
     assessment = await _get_assessment_or_404(assessment_id, tenant_id, db)
     _check_editable(assessment)
@@ -204,73 +208,35 @@ async def batch_upsert_answers(
     if not body.answers:
         return BatchUpsertAnswersResponse(updated_count=0)
 
-    # Load all questions for this framework at once
-    q_ids = [item.question_id for item in body.answers]
-    q_result = await db.execute(
-        select(Question).where(
-            Question.id.in_(q_ids),
-            Question.framework_id == assessment.framework_id,
+    # Questions of this framework come from the reference cache
+    questions_map = (await get_reference_cache().questions(db, assessment.framework_id)).by_id
+    writes = [
+        AnswerWrite(
+            item.question_id,
+            _validated_value(questions_map.get(item.question_id), item.value, f" '{item.question_id}'"),
+            item.base_version,
         )
-    )
-    questions_map = {q.id: q for q in q_result.scalars().all()}
+        for item in body.answers
+    ]
 
-    # Load existing answers
-    existing_result = await db.execute(
-        select(Answer).where(
-            Answer.assessment_id == assessment_id,
-            Answer.question_id.in_(q_ids),
-        )
-    )
-    existing_map = {a.question_id: a for a in existing_result.scalars().all()}
-
-    updated_count = 0
-    for item in body.answers:
-        question = questions_map.get(item.question_id)
-        if not question:
-            raise HTTPException(
-                status_code=404,
-                detail=f"Question '{item.question_id}' not found for this framework"
-            )
-        if not question.is_active:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Question '{item.question_id}' is inactive"
-            )
-
-        value_dict = item.value.model_dump(exclude_none=True)
-        validate_answer_value(question.answer_type, value_dict)
+    saved = await save_answers(db, tenant_id, assessment_id, current_user.id, writes)
 
-        if question.answer_type == "select" and question.options:
-            choices = question.options.get("choices", [])
-            if value_dict.get("choice") not in choices:
-                raise HTTPException(
-                    status_code=422,
-                    detail=f"Invalid choice for question '{item.question_id}'. Allowed: {choices}"
-                )
-
-        existing = existing_map.get(item.question_id)
-        if existing:
-            existing.value = value_dict
-            existing.updated_by_user_id = current_user.id
-        else:
-            new_answer = Answer(
-                tenant_id=tenant_id,
-                assessment_id=assessment_id,
-                question_id=item.question_id,
-                value=value_dict,
-                updated_by_user_id=current_user.id,
-            )
-            db.add(new_answer)
-
-        updated_count += 1
-
-    await db.flush()
+    if saved.written:
+        await mark_controls_dirty(
+            db, tenant_id, assessment_id,
+            [questions_map[a.question_id].control_id for a in saved.written],
+            reason="answer",
+        )
 
     await log_event(
         db, "answers_batch_upserted",
         tenant_id=tenant_id, user_id=current_user.id,
         entity_type="assessment", entity_id=assessment_id,
-        payload={"count": updated_count},
+        payload={"count": len(saved.written), "conflicts": len(saved.conflicts)},
     )
 
-    return BatchUpsertAnswersResponse(updated_count=updated_count)
+    return BatchUpsertAnswersResponse(
+        updated_count=len(saved.written),
+        versions=[AnswerVersion(question_id=a.question_id, version=a.version) for a in saved.written + saved.unchanged],
+        conflicts=[_conflict_dto(a, base) for a, base in saved.conflicts],
+    )
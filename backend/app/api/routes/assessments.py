@@ -21,6 +21,7 @@ from app.schemas.schemas import (
 from app.services.audit import log_event
 from app.services.submit_gate import run_submit_gate
 from app.services.audit_workflow import initialize_workflow
+from app.db import loaders
 
 router = APIRouter(prefix="/tenants/{tenant_id}/assessments", tags=["assessments"])
 
@@ -28,13 +29,7 @@ router = APIRouter(prefix="/tenants/{tenant_id}/assessments", tags=["assessments
 # ── Helpers ───────────────────────────────────────────────────────────────────
 
 async def _get_assessment_or_404(assessment_id: str, tenant_id: str, db: AsyncSession) -> Assessment:
-    result = await db.execute(
-        select(Assessment).where(
-            Assessment.id == assessment_id,
-            Assessment.tenant_id == tenant_id,
-        )
-    )
-    a = result.scalar_one_or_none()
+    a = await loaders.get_assessment(db, assessment_id, tenant_id)
     if not a:
         raise HTTPException(status_code=404, detail="Assessment not found")
     return a
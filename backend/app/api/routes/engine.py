@@ -2,6 +2,7 @@
 Engine routes — Phase 3
 POST /tenants/{tenant_id}/assessments/{assessment_id}/engine/run
 GET  /tenants/{tenant_id}/assessments/{assessment_id}/engine/status
+POST /tenants/{tenant_id}/assessments/{assessment_id}/engine/cancel
 GET  /tenants/{tenant_id}/assessments/{assessment_id}/results/controls
 GET  /tenants/{tenant_id}/assessments/{assessment_id}/results/gaps
 GET  /tenants/{tenant_id}/assessments/{assessment_id}/results/risks
@@ -9,16 +10,15 @@ GET  /tenants/{tenant_id}/assessments/{assessment_id}/results/remediation
 
 Per spec: internal_user only for run; all members can read results.
 Idempotency: replace outputs on re-run.
+Runs execute in the background job queue (services/job_queue.py); status is read from background_jobs.
 """
-import uuid
-from datetime import datetime, timezone
-from fastapi import APIRouter, Depends, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 from app.db.session import get_db
 from app.models.models import (
     Assessment, ControlResult, Gap, Risk, RemediationAction,
-    TenantMember, Answer
+    TenantMember, Answer, BackgroundJob,
 )
 from app.core.auth import get_current_user, get_membership, require_internal
 from app.models.models import User
@@ -27,29 +27,51 @@ from app.schemas.schemas import (
     EngineRunResponse,
 )
 from app.services.audit import log_event
-from app.services.engine import run_engine
+from app.services.engine_jobs import ENGINE_RUN_JOB
+from app.services.job_queue import enqueue_job, get_active_job, request_cancel
+from app.db import loaders
 
 router = APIRouter(prefix="/tenants/{tenant_id}/assessments/{assessment_id}", tags=["engine"])
 
-# In-memory run status store (v1 — sufficient for sync runs)
-# In v2 replace with Redis or DB-backed job table
-_run_status: dict[str, dict] = {}
-
 
 async def _get_assessment_or_404(assessment_id: str, tenant_id: str, db: AsyncSession) -> Assessment:
-    result = await db.execute(
-        select(Assessment).where(
-            Assessment.id == assessment_id,
-            Assessment.tenant_id == tenant_id,
-        )
-    )
-    a = result.scalar_one_or_none()
+    a = await loaders.get_assessment(db, assessment_id, tenant_id)
     if not a:
         raise HTTPException(status_code=404, detail="Assessment not found")
     return a
 
 
-@router.post("/engine/run", response_model=EngineRunResponse)
+async def _get_run_or_404(run_id: str, assessment_id: str, tenant_id: str, db: AsyncSession) -> BackgroundJob:
+    result = await db.execute(
+        select(BackgroundJob).where(
+            BackgroundJob.id == run_id,
+            BackgroundJob.tenant_id == tenant_id,
+            BackgroundJob.job_type == ENGINE_RUN_JOB,
+            BackgroundJob.entity_id == assessment_id,
+        )
+    )
+    job = result.scalar_one_or_none()
+    if not job:
+        raise HTTPException(status_code=404, detail="Run ID not found")
+    return job
+
+
+def _run_response(job: BackgroundJob, assessment: Assessment) -> EngineRunResponse:
+    return EngineRunResponse(
+        run_id=job.id,
+        assessment_id=assessment.id,
+        status=job.status,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        controlset_version_id=assessment.controlset_version_id,
+        ruleset_version_id=assessment.ruleset_version_id,
+        error=job.error,
+        attempts=job.attempts,
+        stats=job.result,
+    )
+
+
+@router.post("/engine/run", response_model=EngineRunResponse, status_code=202)
 async def engine_run(
     tenant_id: str,
     assessment_id: str,
@@ -57,6 +79,7 @@ async def engine_run(
     membership: TenantMember = Depends(get_membership),
     db: AsyncSession = Depends(get_db),
 ):
+    """Enqueue an engine run. Returns run_id immediately; poll GET /engine/status?run_id=..."""
     require_internal(membership)
 
     assessment = await _get_assessment_or_404(assessment_id, tenant_id, db)
@@ -82,78 +105,28 @@ async def engine_run(
     if answer_count.scalar_one() == 0:
         raise HTTPException(status_code=422, detail="Assessment has no answers. Cannot run engine.")
 
-    run_id = str(uuid.uuid4())
-    started_at = datetime.now(timezone.utc)
-
-    _run_status[run_id] = {
-        "run_id": run_id,
-        "assessment_id": assessment_id,
-        "status": "running",
-        "started_at": started_at,
-        "finished_at": None,
-        "controlset_version_id": assessment.controlset_version_id,
-        "ruleset_version_id": assessment.ruleset_version_id,
-        "error": None,
-    }
+    # One active run per assessment: repeated clicks return the pending run
+    job = await get_active_job(db, ENGINE_RUN_JOB, "assessment", assessment_id)
+    if job:
+        return _run_response(job, assessment)
+
+    job = await enqueue_job(
+        db,
+        tenant_id=tenant_id,
+        job_type=ENGINE_RUN_JOB,
+        entity_type="assessment",
+        entity_id=assessment_id,
+        requested_by_user_id=current_user.id,
+    )
 
     await log_event(
         db, "engine_run_started",
         tenant_id=tenant_id, user_id=current_user.id,
         entity_type="assessment", entity_id=assessment_id,
-        payload={"run_id": run_id},
+        payload={"run_id": job.id},
     )
 
-    # Run synchronously (v1 — per spec note: sync acceptable)
-    try:
-        stats = await run_engine(assessment, db)
-        finished_at = datetime.now(timezone.utc)
-
-        _run_status[run_id].update({
-            "status": "completed",
-            "finished_at": finished_at,
-            "stats": stats,
-        })
-
-        await log_event(
-            db, "engine_run_completed",
-            tenant_id=tenant_id, user_id=current_user.id,
-            entity_type="assessment", entity_id=assessment_id,
-            payload={
-                "run_id": run_id,
-                "pass": stats["pass"],
-                "fail": stats["fail"],
-                "partial": stats["partial"],
-                "unknown": stats["unknown"],
-                "gaps": stats["gaps"],
-            },
-        )
-
-    except Exception as e:
-        finished_at = datetime.now(timezone.utc)
-        _run_status[run_id].update({
-            "status": "failed",
-            "finished_at": finished_at,
-            "error": str(e),
-        })
-
-        await log_event(
-            db, "engine_run_failed",
-            tenant_id=tenant_id, user_id=current_user.id,
-            entity_type="assessment", entity_id=assessment_id,
-            payload={"run_id": run_id, "error": str(e)},
-        )
-        raise HTTPException(status_code=500, detail=f"Engine run failed: {e}")
-
-    return EngineRunResponse(
-        run_id=run_id,
-        assessment_id=assessment_id,
-        status=_run_status[run_id]["status"],
-        started_at=started_at,
-        finished_at=finished_at,
-        controlset_version_id=assessment.controlset_version_id,
-        ruleset_version_id=assessment.ruleset_version_id,
-        error=None,
-    )
+    return _run_response(job, assessment)
 
 
 @router.get("/engine/status", response_model=EngineRunResponse)
@@ -164,20 +137,35 @@ async def engine_status(
     membership: TenantMember = Depends(get_membership),
     db: AsyncSession = Depends(get_db),
 ):
-    status = _run_status.get(run_id)
-    if not status or status["assessment_id"] != assessment_id:
-        raise HTTPException(status_code=404, detail="Run ID not found")
+    assessment = await _get_assessment_or_404(assessment_id, tenant_id, db)
+    job = await _get_run_or_404(run_id, assessment_id, tenant_id, db)
+    return _run_response(job, assessment)
 
-    return EngineRunResponse(
-        run_id=run_id,
-        assessment_id=assessment_id,
-        status=status["status"],
-        started_at=status.get("started_at"),
-        finished_at=status.get("finished_at"),
-        controlset_version_id=status.get("controlset_version_id"),
-        ruleset_version_id=status.get("ruleset_version_id"),
-        error=status.get("error"),
+
+@router.post("/engine/cancel", response_model=EngineRunResponse)
+async def engine_cancel(
+    tenant_id: str,
+    assessment_id: str,
+    run_id: str,
+    current_user: User = Depends(get_current_user),
+    membership: TenantMember = Depends(get_membership),
+    db: AsyncSession = Depends(get_db),
+):
+    """Cancel a queued run at once; a running run is cancelled by its worker (status becomes 'cancelled')."""
+    require_internal(membership)
+    assessment = await _get_assessment_or_404(assessment_id, tenant_id, db)
+    job = await _get_run_or_404(run_id, assessment_id, tenant_id, db)
+    if job.status not in ("queued", "running"):
+        raise HTTPException(status_code=409, detail=f"Run is already {job.status}.")
+
+    await request_cancel(db, job)
+    await log_event(
+        db, "engine_run_cancel_requested",
+        tenant_id=tenant_id, user_id=current_user.id,
+        entity_type="assessment", entity_id=assessment_id,
+        payload={"run_id": job.id},
     )
+    return _run_response(job, assessment)
 
 
 @router.get("/results/controls", response_model=list[ControlResultDTO])
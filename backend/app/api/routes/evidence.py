@@ -28,7 +28,11 @@ from app.schemas.schemas import (
 )
 from app.services.audit import log_event
 from app.services import storage
+from app.services.engine import mark_controls_dirty
+from app.services.evidence_aggregator import recompute_control_aggregates
+from app.models.ai_evidence import EvidenceAssessmentResult
 from app.core.config import settings
+from app.db import loaders
 
 router = APIRouter(prefix="/tenants/{tenant_id}", tags=["evidence"])
 
@@ -63,13 +67,7 @@ def _validate_tags(tags: list[str] | None) -> None:
 
 
 async def _get_assessment_or_404(assessment_id: str, tenant_id: str, db: AsyncSession) -> Assessment:
-    result = await db.execute(
-        select(Assessment).where(
-            Assessment.id == assessment_id,
-            Assessment.tenant_id == tenant_id,
-        )
-    )
-    a = result.scalar_one_or_none()
+    a = await loaders.get_assessment(db, assessment_id, tenant_id)
     if not a:
         raise HTTPException(status_code=404, detail="Assessment not found")
     return a
@@ -141,6 +139,7 @@ async def register_evidence_file(
         content_type=body.content_type,
         size_bytes=body.size_bytes,
         storage_key=body.storage_key,
+        # sha256 is filled in by the extraction worker from the download it parses anyway
         tags=body.tags or [],
     )
     db.add(evidence)
@@ -277,9 +276,39 @@ async def delete_evidence_file(
         raise HTTPException(status_code=404, detail="Evidence file not found")
     file_name = evidence.file_name
     storage_key = evidence.storage_key
+
+    # Links cascade with the file — engine outputs of linked controls become stale
+    links_result = await db.execute(
+        select(EvidenceLink.assessment_id, EvidenceLink.control_id).where(
+            EvidenceLink.evidence_file_id == evidence_file_id,
+            EvidenceLink.control_id.is_not(None),
+        )
+    )
+    dirty_by_assessment: dict[str, set[str]] = {}
+    for linked_assessment_id, linked_control_id in links_result.all():
+        dirty_by_assessment.setdefault(linked_assessment_id, set()).add(linked_control_id)
+
+    # Analysis results cascade with the file too — aggregates are only ever incremented,
+    # so the affected (assessment, control) pairs are recomputed in this transaction
+    analyzed_result = await db.execute(
+        select(EvidenceAssessmentResult.assessment_id, EvidenceAssessmentResult.control_id)
+        .where(
+            EvidenceAssessmentResult.evidence_file_id == evidence_file_id,
+            EvidenceAssessmentResult.tenant_id == tenant_id,
+        )
+        .distinct()
+    )
+    analyzed_pairs = analyzed_result.all()
+
     await db.delete(evidence)
     await db.flush()
-    storage.delete_object(storage_key)
+    for analyzed_assessment_id, analyzed_control_id in analyzed_pairs:
+        await recompute_control_aggregates(
+            str(analyzed_assessment_id), tenant_id, db, control_id=str(analyzed_control_id)
+        )
+    for linked_assessment_id, control_ids in dirty_by_assessment.items():
+        await mark_controls_dirty(db, tenant_id, linked_assessment_id, control_ids, reason="evidence_link")
+    await storage.delete_object(storage_key)
     await log_event(
         db, "evidence_deleted",
         tenant_id=tenant_id, user_id=current_user.id,
@@ -320,22 +349,13 @@ async def create_evidence_link(
         )
 
     # Validate evidence file belongs to tenant
-    ef_result = await db.execute(
-        select(EvidenceFile).where(
-            EvidenceFile.id == body.evidence_file_id,
-            EvidenceFile.tenant_id == tenant_id,
-        )
-    )
-    evidence_file = ef_result.scalar_one_or_none()
+    evidence_file = await loaders.get_evidence_file(db, body.evidence_file_id, tenant_id)
     if not evidence_file:
         raise HTTPException(status_code=404, detail="Evidence file not found in this tenant")
 
     # Validate optional control_id
     if body.control_id:
-        ctrl_result = await db.execute(
-            select(Control).where(Control.id == body.control_id)
-        )
-        if not ctrl_result.scalar_one_or_none():
+        if not await loaders.get_control(db, body.control_id):
             raise HTTPException(status_code=404, detail="Control not found")
 
     # Validate optional question_id
@@ -356,6 +376,8 @@ async def create_evidence_link(
     )
     db.add(link)
     await db.flush()
+    if body.control_id:
+        await mark_controls_dirty(db, tenant_id, assessment_id, [body.control_id], reason="evidence_link")
 
     await log_event(
         db, "evidence_linked",
@@ -1,11 +1,10 @@
 from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 from app.db.session import get_db
-from app.models.models import Framework, Control, Question, ControlsetVersion
 from app.core.auth import get_current_user
 from app.models.models import User
 from app.schemas.schemas import FrameworkDTO, ControlDTO, QuestionDTO
+from app.services.reference_data import get_reference_cache
 
 router = APIRouter(prefix="/frameworks", tags=["frameworks"])
 
@@ -15,8 +14,8 @@ async def list_frameworks(
     _: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(select(Framework))
-    return [FrameworkDTO.model_validate(f) for f in result.scalars().all()]
+    frameworks = await get_reference_cache().frameworks(db)
+    return [FrameworkDTO.model_validate(f) for f in frameworks]
 
 
 @router.get("/{framework_id}/controls", response_model=list[ControlDTO])
@@ -26,33 +25,23 @@ async def list_controls(
     _: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    query = select(Control).where(Control.framework_id == framework_id)
-
+    cache = get_reference_cache()
+    versions = await cache.controlset_versions(db, framework_id)
     if version:
-        result = await db.execute(
-            select(ControlsetVersion).where(
-                ControlsetVersion.framework_id == framework_id,
-                ControlsetVersion.version == version,
-            )
-        )
-        csv = result.scalar_one_or_none()
-        if csv:
-            query = query.where(Control.controlset_version_id == csv.id)
+        csv = next((v for v in versions if v.version == version), None)
     else:
         # Default to active version
-        result = await db.execute(
-            select(ControlsetVersion).where(
-                ControlsetVersion.framework_id == framework_id,
-                ControlsetVersion.is_active == True,
-            )
-        )
-        csv = result.scalar_one_or_none()
-        if csv:
-            query = query.where(Control.controlset_version_id == csv.id)
+        csv = next((v for v in versions if v.is_active), None)
 
-    query = query.order_by(Control.control_code)
-    result = await db.execute(query)
-    return [ControlDTO.model_validate(c) for c in result.scalars().all()]
+    if csv:
+        controls = (await cache.controls(db, csv.id)).controls
+    else:
+        # No matching version: every control of the framework
+        controls = []
+        for v in versions:
+            controls.extend((await cache.controls(db, v.id)).controls)
+        controls.sort(key=lambda c: c.control_code)
+    return [ControlDTO.model_validate(c) for c in controls]
 
 
 @router.get("/{framework_id}/questions", response_model=list[QuestionDTO])
@@ -63,12 +52,9 @@ async def list_questions(
     _: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    query = select(Question).where(Question.framework_id == framework_id)
+    questions = (await get_reference_cache().questions(db, framework_id)).questions
     if active:
-        query = query.where(Question.is_active == True)
+        questions = [q for q in questions if q.is_active]
     if control_id:
-        query = query.where(Question.control_id == control_id)
-
-    query = query.order_by(Question.question_code)
-    result = await db.execute(query)
-    return [QuestionDTO.model_validate(q) for q in result.scalars().all()]
+        questions = [q for q in questions if q.control_id == control_id]
+    return [QuestionDTO.model_validate(q) for q in questions]
@@ -1,18 +1,32 @@
 """
-Internal-only routes (admin), e.g. seed demo client.
+Internal-only routes (admin), e.g. seed demo client, reference data and auth cache metrics.
 """
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_db
 from app.core.auth import get_current_user
+from app.core import auth_cache
 from app.models.models import User, TenantMember
 from sqlalchemy import select
 from app.services.seed_demo import run_seed_demo_client
+from app.services.reference_data import get_reference_cache, bump_reference_data_version
 
 router = APIRouter(prefix="/internal", tags=["internal"])
 
 
+async def _require_internal_user(current_user: User, db: AsyncSession, detail: str) -> None:
+    # Require that current user has internal_user role in at least one tenant
+    r = await db.execute(
+        select(TenantMember).where(
+            TenantMember.user_id == current_user.id,
+            TenantMember.role == "internal_user",
+        ).limit(1)
+    )
+    if not r.scalar_one_or_none():
+        raise HTTPException(status_code=403, detail=detail)
+
+
 @router.post("/seed-demo-client")
 async def seed_demo_client(
     current_user: User = Depends(get_current_user),
@@ -22,18 +36,41 @@ async def seed_demo_client(
     Create demo client "Valley Creek Family Practice" with ~60% compliance.
     Only internal users (admin) can call this. Run seed.py first.
     """
-    # Require that current user has internal_user role in at least one tenant
-    r = await db.execute(
-        select(TenantMember).where(
-            TenantMember.user_id == current_user.id,
-            TenantMember.role == "internal_user",
-        )
-    )
-    if not r.scalar_one_or_none():
-        raise HTTPException(status_code=403, detail="Only internal users can seed the demo client.")
-
+    await _require_internal_user(current_user, db, "Only internal users can seed the demo client.")
     result = await run_seed_demo_client(db)
     if result.get("error"):
         raise HTTPException(status_code=400, detail=result["error"])
     await db.commit()
     return result
+
+
+@router.get("/reference-cache")
+async def reference_cache_metrics(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Reference data cache of this process: hits, misses, hit_rate, invalidations, version."""
+    await _require_internal_user(current_user, db, "Only internal users can view cache metrics.")
+    return get_reference_cache().metrics()
+
+
+@router.post("/reference-cache/invalidate")
+async def reference_cache_invalidate(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Bump the reference data version: every process reloads frameworks/controls/rules/questions."""
+    await _require_internal_user(current_user, db, "Only internal users can invalidate the cache.")
+    await bump_reference_data_version(db)
+    await db.commit()
+    return get_reference_cache().metrics()
+
+
+@router.get("/auth-cache")
+async def auth_cache_metrics(
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    """Auth cache of this process: user and membership hits, misses, hit_rate, evictions."""
+    await _require_internal_user(current_user, db, "Only internal users can view cache metrics.")
+    return auth_cache.metrics()
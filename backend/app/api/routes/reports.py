@@ -1,10 +1,13 @@
 """
 Reports routes — Phase 3/4
 POST /tenants/{tenant_id}/assessments/{assessment_id}/reports/packages   — create package
-POST /tenants/{tenant_id}/reports/packages/{package_id}/generate          — generate files
+POST /tenants/{tenant_id}/reports/packages/{package_id}/generate          — enqueue generation job
+GET  /tenants/{tenant_id}/reports/packages/{package_id}/generation        — generation job progress
+GET  /tenants/{tenant_id}/reports/packages/{package_id}/generation/events — progress as SSE
 GET  /tenants/{tenant_id}/reports/packages/{package_id}                   — get package
 POST /tenants/{tenant_id}/reports/packages/{package_id}/publish           — publish (internal)
-GET  /tenants/{tenant_id}/reports/packages/{package_id}/download          — ZIP download URL
+GET  /tenants/{tenant_id}/reports/packages/{package_id}/download          — download URL (cached ZIP or executive summary)
+GET  /tenants/{tenant_id}/reports/packages/{package_id}/bundle            — streamed ZIP of all files
 GET  /tenants/{tenant_id}/reports/files/{file_id}/download-url            — single file URL
 
 Per spec:
@@ -13,32 +16,39 @@ Per spec:
   - publish = immutable
   - all downloads logged to audit_events
 """
-import io
+import asyncio
 import uuid
-import zipfile
 from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
-from fastapi.responses import Response
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi.responses import Response, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
-from app.db.session import get_db
+from app.db.session import get_db, AsyncSessionLocal
 from app.models.models import (
     Assessment, Tenant, ReportPackage, ReportFile,
     ControlResult, Gap, Risk, RemediationAction,
-    TenantMember
+    TenantMember, BackgroundJob,
 )
 from app.core.auth import get_current_user, get_membership, require_internal
 from app.models.models import User
 from app.schemas.schemas import (
     CreateReportPackageRequest, ReportPackageDTO, ReportFileDTO,
-    GenerateReportPackageRequest, GenerateReportPackageResponse, ReportFileItem,
+    GenerateReportPackageRequest, ReportGenerationJobDTO,
     PublishReportPackageRequest, PublishReportPackageResponse,
     DownloadUrlResponse,
 )
 from app.services.audit import log_event
 from app.services import storage
-from app.services.report_generator import generate_all_reports
+from app.services.report_jobs import (
+    REPORT_GENERATE_JOB, REQUIRED_FILE_TYPES, CONTENT_TYPES, initial_progress,
+)
+from app.services.job_queue import ACTIVE_STATUSES, enqueue_job, get_active_job
+from app.services.report_bundle import (
+    BUNDLE_CONTENT_TYPE, bundle_file_name, bundle_storage_key, stream_package_zip,
+)
+from app.core.config import settings
 from app.services.compliance_history import record_published_score, get_compliance_timeline
 from app.services.engine import run_engine
 from app.services.claude_document_requests import (
@@ -46,59 +56,26 @@ from app.services.claude_document_requests import (
     resolve_control_id_by_code,
 )
 from app.models.models import Notification
+from app.db import loaders
 
 router = APIRouter(prefix="/tenants/{tenant_id}", tags=["reports"])
 
-# File type → format mapping
-REQUIRED_FILE_TYPES = {
-    "executive_summary": "PDF",
-    "gap_register": "XLSX",
-    "risk_register": "XLSX",
-    "roadmap": "XLSX",
-    "evidence_checklist": "XLSX",
-}
-
-CONTENT_TYPES = {
-    "PDF": "application/pdf",
-    "XLSX": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-    "DOCX": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-}
-
-FILE_EXTENSIONS = {"PDF": "pdf", "XLSX": "xlsx", "DOCX": "docx"}
-
-
 async def _get_assessment_or_404(assessment_id: str, tenant_id: str, db: AsyncSession) -> Assessment:
-    result = await db.execute(
-        select(Assessment).where(
-            Assessment.id == assessment_id,
-            Assessment.tenant_id == tenant_id,
-        )
-    )
-    a = result.scalar_one_or_none()
+    a = await loaders.get_assessment(db, assessment_id, tenant_id)
     if not a:
         raise HTTPException(status_code=404, detail="Assessment not found")
     return a
 
 
 async def _get_package_or_404(package_id: str, tenant_id: str, db: AsyncSession) -> ReportPackage:
-    result = await db.execute(
-        select(ReportPackage).where(
-            ReportPackage.id == package_id,
-            ReportPackage.tenant_id == tenant_id,
-        )
-    )
-    pkg = result.scalar_one_or_none()
+    pkg = await loaders.get_report_package(db, package_id, tenant_id)
     if not pkg:
         raise HTTPException(status_code=404, detail="Report package not found")
     return pkg
 
 
 async def _get_tenant_or_404(tenant_id: str, db: AsyncSession) -> Tenant:
-    from app.models.models import Tenant as TenantModel
-    result = await db.execute(
-        select(TenantModel).where(TenantModel.id == tenant_id)
-    )
-    t = result.scalar_one_or_none()
+    t = await loaders.get_tenant(db, tenant_id)
     if not t:
         raise HTTPException(status_code=404, detail="Tenant not found")
     return t
@@ -163,11 +140,42 @@ async def create_report_package(
     return ReportPackageDTO.model_validate(pkg)
 
 
-# ── Generate Files ─────────────────────────────────────────────────────────────
+# ── Generate Files (background job) ────────────────────────────────────────────
+
+def _generation_job_dto(job: BackgroundJob) -> ReportGenerationJobDTO:
+    return ReportGenerationJobDTO(
+        job_id=job.id,
+        report_package_id=job.entity_id,
+        status=job.status,
+        progress=job.progress or {},
+        error=job.error,
+        attempts=job.attempts,
+        created_at=job.created_at,
+        started_at=job.started_at,
+        finished_at=job.finished_at,
+        result=job.result if job.status == "completed" else None,
+    )
+
+
+async def _get_generation_job_or_404(job_id: str, package_id: str, tenant_id: str, db: AsyncSession) -> BackgroundJob:
+    result = await db.execute(
+        select(BackgroundJob).where(
+            BackgroundJob.id == job_id,
+            BackgroundJob.tenant_id == tenant_id,
+            BackgroundJob.job_type == REPORT_GENERATE_JOB,
+            BackgroundJob.entity_id == package_id,
+        )
+    )
+    job = result.scalar_one_or_none()
+    if not job:
+        raise HTTPException(status_code=404, detail="Generation job not found")
+    return job
+
 
 @router.post(
     "/reports/packages/{package_id}/generate",
-    response_model=GenerateReportPackageResponse,
+    response_model=ReportGenerationJobDTO,
+    status_code=202,
 )
 async def generate_report_package(
     tenant_id: str,
@@ -177,6 +185,7 @@ async def generate_report_package(
     membership: TenantMember = Depends(get_membership),
     db: AsyncSession = Depends(get_db),
 ):
+    """Enqueue generation. Poll GET .../generation?job_id=... or subscribe to .../generation/events (SSE)."""
     require_internal(membership)
 
     pkg = await _get_package_or_404(package_id, tenant_id, db)
@@ -187,107 +196,86 @@ async def generate_report_package(
             detail="Cannot regenerate a published report package. Create a new package instead."
         )
 
-    assessment = await _get_assessment_or_404(pkg.assessment_id, tenant_id, db)
-    tenant = await _get_tenant_or_404(tenant_id, db)
+    await _get_assessment_or_404(pkg.assessment_id, tenant_id, db)
+
+    # One active generation per package: repeated clicks return the pending job
+    job = await get_active_job(db, REPORT_GENERATE_JOB, "report_package", package_id)
+    if job:
+        return _generation_job_dto(job)
+
+    job = await enqueue_job(
+        db,
+        tenant_id=tenant_id,
+        job_type=REPORT_GENERATE_JOB,
+        entity_type="report_package",
+        entity_id=package_id,
+        payload={"include_ai": body.include_ai_summary, "ai_tone": body.ai_tone},
+        requested_by_user_id=current_user.id,
+        progress=initial_progress(),
+    )
 
     await log_event(
         db, "report_generation_started",
         tenant_id=tenant_id, user_id=current_user.id,
         entity_type="report_package", entity_id=package_id,
-        payload={"include_ai": body.include_ai_summary, "ai_tone": body.ai_tone},
+        payload={"job_id": job.id, "include_ai": body.include_ai_summary, "ai_tone": body.ai_tone},
     )
 
-    try:
-        # Run engine first so report and percentage reflect latest answers + evidence
-        await run_engine(assessment, db)
-        await db.flush()
-
-        # Delete existing files for this package (re-generate)
-        existing_files = await db.execute(
-            select(ReportFile).where(ReportFile.package_id == package_id)
-        )
-        for f in existing_files.scalars().all():
-            storage.delete_object(f.storage_key)
-            await db.delete(f)
-        await db.flush()
-
-        # Generate all artifacts
-        report_bytes = await generate_all_reports(
-            assessment=assessment,
-            tenant=tenant,
-            db=db,
-            include_ai=body.include_ai_summary,
-            ai_tone=body.ai_tone or "neutral",
-        )
+    return _generation_job_dto(job)
 
-        now = datetime.now(timezone.utc)
-        file_records = []
 
-        for file_type, data in report_bytes.items():
-            fmt = REQUIRED_FILE_TYPES.get(file_type, "XLSX")
-            ext = FILE_EXTENSIONS[fmt]
-            content_type = CONTENT_TYPES[fmt]
-            file_name = f"{file_type}_{assessment.id[:8]}.{ext}"
-            storage_key = storage.generate_report_key(
-                tenant_id, pkg.assessment_id, file_type, fmt
-            )
-
-            # Upload to MinIO
-            storage.upload_bytes(storage_key, data, content_type)
-
-            rf = ReportFile(
-                package_id=package_id,
-                tenant_id=tenant_id,
-                file_type=file_type,
-                format=fmt,
-                storage_key=storage_key,
-                file_name=file_name,
-                size_bytes=len(data),
-            )
-            db.add(rf)
-            await db.flush()
-
-            file_records.append(ReportFileItem(
-                id=rf.id,
-                file_type=file_type,
-                format=fmt,
-                file_name=file_name,
-                size_bytes=len(data),
-            ))
-
-        # Validate required files present (per spec: Validation_Rules_v1 section 7.2)
-        generated_types = {r.file_type for r in file_records}
-        required_types = set(REQUIRED_FILE_TYPES.keys())
-        missing = required_types - generated_types
-        if missing:
-            raise ValueError(f"Required file types not generated: {missing}")
-
-        # Transition to generated
-        pkg.status = "generated"
-        pkg.updated_at = now
-
-        await log_event(
-            db, "report_generation_completed",
-            tenant_id=tenant_id, user_id=current_user.id,
-            entity_type="report_package", entity_id=package_id,
-            payload={"file_count": len(file_records)},
-        )
+@router.get(
+    "/reports/packages/{package_id}/generation",
+    response_model=ReportGenerationJobDTO,
+)
+async def get_report_generation_status(
+    tenant_id: str,
+    package_id: str,
+    job_id: str,
+    membership: TenantMember = Depends(get_membership),
+    db: AsyncSession = Depends(get_db),
+):
+    require_internal(membership)
+    job = await _get_generation_job_or_404(job_id, package_id, tenant_id, db)
+    return _generation_job_dto(job)
 
-        return GenerateReportPackageResponse(
-            report_package_id=package_id,
-            status="generated",
-            generated_at=now,
-            files=file_records,
-        )
 
-    except Exception as e:
-        await log_event(
-            db, "report_generation_failed",
-            tenant_id=tenant_id, user_id=current_user.id,
-            entity_type="report_package", entity_id=package_id,
-            payload={"error": str(e)},
-        )
-        raise HTTPException(status_code=500, detail=f"Report generation failed: {e}")
+@router.get("/reports/packages/{package_id}/generation/events")
+async def stream_report_generation_events(
+    tenant_id: str,
+    package_id: str,
+    job_id: str,
+    request: Request,
+    membership: TenantMember = Depends(get_membership),
+    db: AsyncSession = Depends(get_db),
+):
+    """Server-Sent Events: one `progress` event per change, closed after the terminal state
+    (or after a `gone` event if the job is deleted while streaming)."""
+    require_internal(membership)
+    await _get_generation_job_or_404(job_id, package_id, tenant_id, db)
+
+    async def _events():
+        last = None
+        while not await request.is_disconnected():
+            async with AsyncSessionLocal() as session:
+                job = await session.get(BackgroundJob, job_id)
+            if job is None:
+                # Job (or its package/tenant) deleted mid-stream: tell the client and close
+                yield f"event: gone\ndata: {{\"job_id\": \"{job_id}\"}}\n\n"
+                return
+            dto = _generation_job_dto(job).model_dump_json()
+            if dto != last:
+                last = dto
+                yield f"event: progress\ndata: {dto}\n\n"
+            if job.status not in ACTIVE_STATUSES:
+                break
+            await asyncio.sleep(1)
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 # ── List Packages ──────────────────────────────────────────────────────────────
@@ -514,9 +502,22 @@ async def download_report_package(
     if membership.role == "client_user" and pkg.status != "published":
         raise HTTPException(status_code=403, detail="Only published packages can be downloaded.")
 
-    # For v1: return presigned URL to the first file (executive summary) or a pre-built zip.
-    # True ZIP streaming requires a separate job/endpoint; v1 returns executive summary URL.
-    # TODO v2: generate ZIP in background, store in MinIO, return signed URL.
+    # Cached ZIP bundle of a published package if one exists (built by GET .../bundle);
+    # otherwise the executive summary. Full archives stream from GET .../bundle.
+    if pkg.status == "published" and settings.REPORT_BUNDLE_CACHE_ENABLED:
+        bundle_key = bundle_storage_key(pkg)
+        if await storage.head_object(bundle_key):
+            await log_event(
+                db, "report_package_downloaded",
+                tenant_id=tenant_id, user_id=current_user.id,
+                entity_type="report_package", entity_id=package_id,
+                payload={"package_version": pkg.package_version, "assessment_id": pkg.assessment_id, "bundle": True},
+            )
+            return DownloadUrlResponse(
+                download_url=storage.create_presigned_download_url(bundle_key, file_name=bundle_file_name(pkg)),
+                expires_at=storage.get_presign_expiry_datetime(),
+            )
+
     files_result = await db.execute(
         select(ReportFile).where(
             ReportFile.package_id == package_id,
@@ -527,17 +528,6 @@ async def download_report_package(
     if not exec_file:
         raise HTTPException(status_code=404, detail="No files found in this package.")
 
-    # Build in-memory ZIP from all package files
-    files_all = await db.execute(
-        select(ReportFile).where(ReportFile.package_id == package_id)
-    )
-    all_files = files_all.scalars().all()
-
-    zip_key = storage.generate_report_key(
-        tenant_id, pkg.assessment_id, f"package_v{pkg.package_version}_bundle", "ZIP"
-    ).replace(".zip", ".zip")
-
-    # Generate presigned download for executive summary as primary download
     download_url = storage.create_presigned_download_url(
         exec_file.storage_key,
         file_name=exec_file.file_name,
@@ -554,6 +544,56 @@ async def download_report_package(
     return DownloadUrlResponse(download_url=download_url, expires_at=expires_at)
 
 
+# ── Download Package Bundle (streamed ZIP) ────────────────────────────────────
+
+@router.get("/reports/packages/{package_id}/bundle", response_class=StreamingResponse)
+async def download_report_package_bundle(
+    tenant_id: str,
+    package_id: str,
+    current_user: User = Depends(get_current_user),
+    membership: TenantMember = Depends(get_membership),
+    db: AsyncSession = Depends(get_db),
+):
+    """ZIP of all package files streamed from storage. Published packages reuse a cached bundle."""
+    pkg = await _get_package_or_404(package_id, tenant_id, db)
+
+    if membership.role == "client_user" and pkg.status != "published":
+        raise HTTPException(status_code=403, detail="Only published packages can be downloaded.")
+
+    files_result = await db.execute(
+        select(ReportFile).where(ReportFile.package_id == package_id).order_by(ReportFile.file_type)
+    )
+    files = files_result.scalars().all()
+    if not files:
+        raise HTTPException(status_code=404, detail="No files found in this package.")
+
+    # Published = immutable: serve the cached bundle (one GET) or build it and store it
+    cache_key = None
+    if pkg.status == "published" and settings.REPORT_BUNDLE_CACHE_ENABLED:
+        cache_key = bundle_storage_key(pkg)
+
+    if cache_key and await storage.head_object(cache_key):
+        body = storage.iter_object_chunks(cache_key)
+    else:
+        body = stream_package_zip(
+            [(f.file_name, f.storage_key, f.created_at) for f in files],
+            cache_key=cache_key,
+        )
+
+    await log_event(
+        db, "report_package_downloaded",
+        tenant_id=tenant_id, user_id=current_user.id,
+        entity_type="report_package", entity_id=package_id,
+        payload={"package_version": pkg.package_version, "assessment_id": pkg.assessment_id, "bundle": True},
+    )
+
+    return StreamingResponse(
+        body,
+        media_type=BUNDLE_CONTENT_TYPE,
+        headers={"Content-Disposition": f'attachment; filename="{bundle_file_name(pkg)}"'},
+    )
+
+
 # ── Download Single File ───────────────────────────────────────────────────────
 
 @router.get(
@@ -607,18 +647,72 @@ async def download_report_file(
 
 # ── Download Single File (stream through backend, no MinIO URL in browser) ──────
 
+def _parse_byte_range(header: Optional[str], size: int) -> Optional[tuple[int, int]]:
+    """
+    Single "bytes=" range → inclusive (start, end), clamped to size.
+    None = serve the whole object (no header, multi-range or unparseable — RFC 9110 lets us ignore it).
+    Raises 416 when the range is syntactically valid but outside the object.
+    """
+    if not header or not header.startswith("bytes=") or "," in header:
+        return None
+    first, _, last = header[len("bytes="):].strip().partition("-")
+    try:
+        if first == "":
+            suffix = int(last)
+            if suffix <= 0:
+                raise ValueError
+            start, end = max(size - suffix, 0), size - 1
+        else:
+            start = int(first)
+            end = int(last) if last else size - 1
+    except ValueError:
+        return None
+    if start >= size:
+        raise HTTPException(
+            status_code=416,
+            detail="Requested range not satisfiable",
+            headers={"Content-Range": f"bytes */{size}"},
+        )
+    if start > end:
+        return None
+    return start, min(end, size - 1)
+
+
+def _not_modified(request: Request, etag: Optional[str], last_modified: Optional[datetime]) -> bool:
+    """If-None-Match takes precedence over If-Modified-Since (RFC 9110 §13.2.2)."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        if not etag:
+            return False
+        tags = {t.strip().removeprefix("W/") for t in if_none_match.split(",")}
+        return "*" in tags or etag.removeprefix("W/") in tags
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return last_modified.replace(microsecond=0) <= since
+    return False
+
+
 @router.get(
     "/reports/files/{file_id}/download",
-    response_class=Response,
+    response_class=StreamingResponse,
 )
 async def download_report_file_stream(
     tenant_id: str,
     file_id: str,
+    request: Request,
     current_user: User = Depends(get_current_user),
     membership: TenantMember = Depends(get_membership),
     db: AsyncSession = Depends(get_db),
 ):
-    """Stream file through backend so the browser gets it from the API (works when MinIO is not reachable from the client)."""
+    """
+    Stream file through backend so the browser gets it from the API (works when MinIO is not reachable from the client).
+    The S3 body is relayed in STORAGE_STREAM_CHUNK_BYTES chunks; supports a single Range,
+    If-Range, and ETag / Last-Modified revalidation (304).
+    """
     file_result = await db.execute(
         select(ReportFile).where(
             ReportFile.id == file_id,
@@ -637,18 +731,52 @@ async def download_report_file_stream(
         raise HTTPException(status_code=403, detail="Only files from published packages can be downloaded.")
 
     try:
-        data = storage.get_object_bytes(report_file.storage_key)
+        meta = await storage.head_object(report_file.storage_key)
     except Exception as e:
         raise HTTPException(status_code=502, detail=f"Storage error: {e}")
+    if meta is None:
+        raise HTTPException(status_code=404, detail="Report file is missing from storage")
+
+    size = int(meta["ContentLength"])
+    etag = meta.get("ETag")
+    last_modified = meta.get("LastModified")
+    headers = {
+        "Accept-Ranges": "bytes",
+        "Cache-Control": "private, no-cache",
+        "Content-Disposition": f'attachment; filename="{report_file.file_name}"',
+    }
+    if etag:
+        headers["ETag"] = etag
+    if last_modified:
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
 
-    content_type = (
-        "application/pdf" if report_file.format == "PDF"
-        else "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
-    )
-    return Response(
-        content=data,
-        media_type=content_type,
-        headers={
-            "Content-Disposition": f'attachment; filename="{report_file.file_name}"',
-        },
+    if _not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+
+    byte_range = _parse_byte_range(request.headers.get("range"), size)
+    if_range = request.headers.get("if-range")
+    if byte_range and if_range and if_range != etag and if_range != headers.get("Last-Modified"):
+        byte_range = None  # representation changed since the partial download began → send it whole
+
+    try:
+        _, chunks = await storage.open_object_stream(
+            report_file.storage_key,
+            byte_range=f"bytes={byte_range[0]}-{byte_range[1]}" if byte_range else None,
+            if_match=etag,
+        )
+    except Exception as e:
+        raise HTTPException(status_code=502, detail=f"Storage error: {e}")
+
+    if byte_range:
+        start, end = byte_range
+        headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+        headers["Content-Length"] = str(end - start + 1)
+    else:
+        headers["Content-Length"] = str(size)
+
+    return StreamingResponse(
+        chunks,
+        status_code=206 if byte_range else 200,
+        media_type=CONTENT_TYPES.get(report_file.format, "application/octet-stream"),
+        headers=headers,
     )
@@ -6,10 +6,9 @@ POST /api/v1/tenants/{tenant_id}/templates/{control_id}
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
 
 from app.db.session import get_db
-from app.models.models import Tenant
+from app.db import loaders
 from app.core.auth import get_membership
 from app.services.template_generator import (
     CONTROL_TEMPLATE_MAP,
@@ -39,8 +38,7 @@ async def list_templates(
     db: AsyncSession = Depends(get_db),
 ):
     """List all 41 controls with has_template: true/false (true for 15 named templates)."""
-    result = await db.execute(select(Tenant).where(Tenant.id == tenant_id))
-    tenant = result.scalar_one_or_none()
+    tenant = await loaders.get_tenant(db, tenant_id)
     if not tenant:
         raise HTTPException(status_code=404, detail="Tenant not found")
     items = [
@@ -58,8 +56,7 @@ async def generate_template_pdf(
     db: AsyncSession = Depends(get_db),
 ):
     """Generate and return pre-filled PDF for the control (ReportLab, watermark, Summit Range header/footer)."""
-    result = await db.execute(select(Tenant).where(Tenant.id == tenant_id))
-    tenant = result.scalar_one_or_none()
+    tenant = await loaders.get_tenant(db, tenant_id)
     if not tenant:
         raise HTTPException(status_code=404, detail="Tenant not found")
     if control_id not in ALL_41_CONTROL_IDS:
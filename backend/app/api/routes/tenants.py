@@ -2,8 +2,10 @@ from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 from app.db.session import get_db
+from app.db import loaders
 from app.models.models import Tenant, TenantMember, User, EvidenceFile, AuditEvent
 from app.core.auth import get_current_user, get_membership, require_internal, hash_password
+from app.core import auth_cache
 from app.schemas.schemas import (
     CreateTenantRequest, UpdateTenantRequest, TenantDTO, TenantSummaryDTO,
     AddTenantMemberRequest, UpdateMemberRequest, TenantMemberDTO, UserDTO
@@ -63,8 +65,7 @@ async def get_tenant(
     membership: TenantMember = Depends(get_membership),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(select(Tenant).where(Tenant.id == tenant_id))
-    tenant = result.scalar_one_or_none()
+    tenant = await loaders.get_tenant(db, tenant_id)
     if not tenant:
         raise HTTPException(status_code=404, detail="Tenant not found")
     return TenantDTO.model_validate(tenant)
@@ -79,8 +80,7 @@ async def get_tenant_summary(
     membership: TenantMember = Depends(get_membership),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(select(Tenant).where(Tenant.id == tenant_id))
-    if not result.scalar_one_or_none():
+    if not await loaders.get_tenant(db, tenant_id):
         raise HTTPException(status_code=404, detail="Tenant not found")
 
     # Load all evidence for tenant
@@ -131,8 +131,7 @@ async def update_tenant(
     db: AsyncSession = Depends(get_db),
 ):
     require_internal(membership)
-    result = await db.execute(select(Tenant).where(Tenant.id == tenant_id))
-    tenant = result.scalar_one_or_none()
+    tenant = await loaders.get_tenant(db, tenant_id)
     if not tenant:
         raise HTTPException(status_code=404, detail="Tenant not found")
 
@@ -252,4 +251,11 @@ async def update_member(
         user = result2.scalar_one()
         user.status = body.status
 
+    # Commit before dropping cached auth so a concurrent request cannot re-cache the old row
+    await db.commit()
+    if body.status:
+        auth_cache.invalidate_user(member.user_id)
+    elif body.role:
+        auth_cache.invalidate_membership(member.user_id, tenant_id)
+
     return TenantMemberDTO.model_validate(member)
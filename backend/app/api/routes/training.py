@@ -14,7 +14,8 @@ from sqlalchemy import select
 from sqlalchemy.orm import selectinload
 
 from app.db.session import get_db
-from app.models.models import Tenant, User, TenantMember
+from app.db import loaders
+from app.models.models import User, TenantMember
 from app.models.training import TrainingModule, TrainingAssignment, TrainingQuestion, TrainingCompletion
 from app.core.auth import get_current_user, get_membership
 from app.schemas.schemas import (
@@ -31,8 +32,7 @@ router = APIRouter(prefix="/tenants/{tenant_id}", tags=["training"])
 
 
 async def _get_tenant(tenant_id: str, db: AsyncSession):
-    r = await db.execute(select(Tenant).where(Tenant.id == tenant_id))
-    t = r.scalar_one_or_none()
+    t = await loaders.get_tenant(db, tenant_id)
     if not t:
         raise HTTPException(status_code=404, detail="Tenant not found")
     return t
@@ -174,7 +174,7 @@ async def complete_assignment(
         score_percent=score,
     )
     storage_key = storage.generate_certificate_key(tenant_id, assignment.id)
-    storage.upload_bytes(storage_key, pdf_bytes, "application/pdf")
+    await storage.upload_bytes(storage_key, pdf_bytes, "application/pdf")
     assignment.certificate_storage_key = storage_key
     await db.flush()
     return TrainingAssignmentDTO.model_validate(assignment)
@@ -16,6 +16,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from app.db.session import get_db
+from app.db import loaders
 from app.models.models import Tenant, User, TenantMember, EvidenceFile
 from app.models.training import TrainingModule
 from app.models.workforce import Employee, EmployeeTrainingAssignment, TrainingCertificate, WorkforceImportLog
@@ -24,11 +25,14 @@ from app.schemas.schemas import (
     CreateEmployeeRequest, UpdateEmployeeRequest, EmployeeDTO,
     CreateEmployeeAssignmentRequest, EmployeeAssignmentDTO,
     CompleteEmployeeAssignmentRequest, TrainingCertificateDTO,
-    CertificateVerifyResponse, WorkforceStatsDTO, WorkforceImportResultDTO,
+    CertificateVerifyResponse, WorkforceStatsDTO, WorkforceImportResultDTO, WorkforceImportLogDTO,
     CertificateResponse,
 )
 from app.services.certificate_generator import generate_workforce_certificate_pdf
 from app.services import storage
+from app.services.workforce_import import (
+    CSV_TEMPLATE_HEADERS, WorkforceImportError, fail_stale_imports, import_employees_csv,
+)
 
 router = APIRouter(prefix="/tenants/{tenant_id}", tags=["workforce"])
 
@@ -37,8 +41,7 @@ HIPAA_PR_06 = "HIPAA-PR-06"
 
 
 async def _get_tenant(tenant_id: str, db: AsyncSession) -> Tenant:
-    r = await db.execute(select(Tenant).where(Tenant.id == tenant_id))
-    t = r.scalar_one_or_none()
+    t = await loaders.get_tenant(db, tenant_id)
     if not t:
         raise HTTPException(status_code=404, detail="Tenant not found")
     return t
@@ -175,7 +178,6 @@ async def delete_employee(
 
 # ── CSV import / export / template ─────────────────────────────────────────────
 
-CSV_TEMPLATE_HEADERS = ["email", "first_name", "last_name", "department", "role_title"]
 
 
 @router.get("/workforce/csv-template", response_class=PlainTextResponse)
@@ -199,67 +201,59 @@ async def import_csv(
     membership: TenantMember = Depends(get_membership),
     db: AsyncSession = Depends(get_db),
 ):
+    """Streaming import (bulk upsert per chunk). Progress of a large file: GET /workforce/import-logs/{import_id}."""
     await _get_tenant(tenant_id, db)
-    content = await file.read()
     try:
-        text = content.decode("utf-8-sig")
-    except Exception:
-        text = content.decode("latin-1")
-    reader = csv.DictReader(io.StringIO(text))
-    if not reader.fieldnames or set(reader.fieldnames) < set(CSV_TEMPLATE_HEADERS):
-        raise HTTPException(status_code=400, detail="CSV must include columns: email, first_name, last_name, department, role_title")
-    created = updated = skipped = 0
-    errors: list[dict] = []
-    for i, row in enumerate(reader):
-        row_num = i + 2
-        email = (row.get("email") or "").strip()
-        first_name = (row.get("first_name") or "").strip()
-        last_name = (row.get("last_name") or "").strip()
-        if not email or not first_name or not last_name:
-            skipped += 1
-            errors.append({"row": row_num, "error": "Missing email, first_name, or last_name"})
-            continue
-        existing = await db.execute(
-            select(Employee).where(Employee.tenant_id == tenant_id, Employee.email == email)
-        )
-        emp = existing.scalar_one_or_none()
-        if emp:
-            emp.first_name = first_name
-            emp.last_name = last_name
-            emp.department = (row.get("department") or "").strip() or None
-            emp.role_title = (row.get("role_title") or "").strip() or None
-            updated += 1
-        else:
-            emp = Employee(
-                tenant_id=tenant_id,
-                email=email,
-                first_name=first_name,
-                last_name=last_name,
-                department=(row.get("department") or "").strip() or None,
-                role_title=(row.get("role_title") or "").strip() or None,
-            )
-            db.add(emp)
-            created += 1
-    await db.flush()
-    log = WorkforceImportLog(
-        tenant_id=tenant_id,
-        imported_by=membership.user_id,
-        filename=file.filename,
-        total_rows=created + updated + skipped,
-        created_count=created,
-        updated_count=updated,
-        skipped_count=skipped,
-        errors=errors if errors else None,
-    )
-    db.add(log)
-    await db.commit()
+        log = await import_employees_csv(db, tenant_id, membership.user_id, file.filename, file.file)
+    except (WorkforceImportError, csv.Error) as e:
+        raise HTTPException(status_code=400, detail=str(e))
     return WorkforceImportResultDTO(
-        total_rows=created + updated + skipped,
-        created_count=created,
-        updated_count=updated,
-        skipped_count=skipped,
-        errors={"rows": errors} if errors else None,
+        import_id=log.id,
+        total_rows=log.total_rows,
+        created_count=log.created_count,
+        updated_count=log.updated_count,
+        skipped_count=log.skipped_count,
+        errors={"rows": log.errors} if log.errors else None,
+    )
+
+
+@router.get("/workforce/import-logs", response_model=list[WorkforceImportLogDTO])
+async def list_import_logs(
+    tenant_id: str,
+    limit: int = 20,
+    membership: TenantMember = Depends(get_membership),
+    db: AsyncSession = Depends(get_db),
+):
+    """Recent imports, newest first; a running import shows processed_rows so far."""
+    await _get_tenant(tenant_id, db)
+    await fail_stale_imports(db, tenant_id)
+    r = await db.execute(
+        select(WorkforceImportLog)
+        .where(WorkforceImportLog.tenant_id == tenant_id)
+        .order_by(WorkforceImportLog.created_at.desc())
+        .limit(max(1, min(limit, 100)))
+    )
+    return [WorkforceImportLogDTO.model_validate(log) for log in r.scalars().all()]
+
+
+@router.get("/workforce/import-logs/{import_id}", response_model=WorkforceImportLogDTO)
+async def get_import_log(
+    tenant_id: str,
+    import_id: str,
+    membership: TenantMember = Depends(get_membership),
+    db: AsyncSession = Depends(get_db),
+):
+    await fail_stale_imports(db, tenant_id)
+    r = await db.execute(
+        select(WorkforceImportLog).where(
+            WorkforceImportLog.id == import_id,
+            WorkforceImportLog.tenant_id == tenant_id,
+        )
     )
+    log = r.scalar_one_or_none()
+    if not log:
+        raise HTTPException(status_code=404, detail="Import not found")
+    return WorkforceImportLogDTO.model_validate(log)
 
 
 @router.get("/workforce/export-csv", response_class=StreamingResponse)
@@ -385,7 +379,7 @@ async def complete_assignment(
         module_version=getattr(module, "version", None),
     )
     storage_key = storage.generate_certificate_key(tenant_id, a.id)
-    storage.upload_bytes(storage_key, pdf_bytes, "application/pdf")
+    await storage.upload_bytes(storage_key, pdf_bytes, "application/pdf")
 
     cert = TrainingCertificate(
         tenant_id=tenant_id,
@@ -415,6 +409,7 @@ async def complete_assignment(
         content_type="application/pdf",
         size_bytes=len(pdf_bytes),
         storage_key=storage_key,
+        sha256=hashlib.sha256(pdf_bytes).hexdigest(),
         tags=["workforce-certificate", HIPAA_PR_06],
     )
     db.add(evidence_file)
@@ -9,6 +9,7 @@ from sqlalchemy import select
 from app.core.config import settings
 from app.db.session import get_db
 from app.models.models import User, TenantMember
+from app.core import auth_cache
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 bearer_scheme = HTTPBearer()
@@ -55,15 +56,39 @@ async def get_current_user(
     if not user_id:
         raise HTTPException(status_code=401, detail="Invalid token payload")
 
+    # Active users come from the short-lived auth cache (see core/auth_cache.py)
+    cached = auth_cache.get_user(user_id)
+    if cached is not None:
+        return User(**cached)
+
     result = await db.execute(select(User).where(User.id == user_id))
     user = result.scalar_one_or_none()
     if not user or user.status != "active":
         raise HTTPException(status_code=401, detail="User not found or disabled")
+    auth_cache.put_user(user)
     return user
 
 
 # ── Dependency: resolve tenant membership ─────────────────────────────────────
 
+async def find_membership(db: AsyncSession, tenant_id: str, user_id: str) -> Optional[TenantMember]:
+    """TenantMember of user_id in tenant_id or None; cached memberships are detached copies."""
+    cached = auth_cache.get_member(user_id, tenant_id)
+    if cached is not None:
+        return TenantMember(**cached)
+
+    result = await db.execute(
+        select(TenantMember).where(
+            TenantMember.tenant_id == tenant_id,
+            TenantMember.user_id == user_id,
+        )
+    )
+    membership = result.scalar_one_or_none()
+    if membership is not None:
+        auth_cache.put_member(membership)
+    return membership
+
+
 async def get_membership(
     tenant_id: str,
     current_user: User = Depends(get_current_user),
@@ -73,13 +98,7 @@ async def get_membership(
     Validates that current_user is an active member of tenant_id.
     Returns the TenantMember record (contains role).
     """
-    result = await db.execute(
-        select(TenantMember).where(
-            TenantMember.tenant_id == tenant_id,
-            TenantMember.user_id == current_user.id,
-        )
-    )
-    membership = result.scalar_one_or_none()
+    membership = await find_membership(db, tenant_id, current_user.id)
     if not membership:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
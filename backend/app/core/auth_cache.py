@@ -0,0 +1,115 @@
+"""
+Per-process cache for request authentication.
+get_current_user and get_membership run on every tenant-scoped call; instead of two SELECTs per
+request they keep short-lived snapshots:
+  - user_id → active User columns (password_hash is never cached);
+  - (user_id, tenant_id) → TenantMember columns.
+Only positive results are cached (disabled users and non-members always hit the database).
+Entries expire after AUTH_CACHE_TTL_SECONDS; at most AUTH_CACHE_MAX_ENTRIES per map, least
+recently used evicted first. Code that changes a user's status or a membership calls
+invalidate_user / invalidate_membership after committing; other processes (and changes made
+outside the API, e.g. scripts) catch up within the TTL.
+Each request gets fresh transient User / TenantMember instances built from the snapshot, so a
+route mutating them cannot leak into other requests (they are not attached to any session).
+"""
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from app.core.config import settings
+
+USER_COLUMNS = ("id", "email", "full_name", "status", "created_at", "updated_at")
+MEMBER_COLUMNS = ("id", "tenant_id", "user_id", "role", "created_at")
+
+
+class TTLCache:
+    """Small LRU map with a per-entry deadline. Not shared across processes."""
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.stats["misses"] += 1
+            return None
+        self._entries.move_to_end(key)
+        self.stats["hits"] += 1
+        return entry[1]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def pop(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def discard_where(self, predicate) -> None:
+        for key in [k for k in self._entries if predicate(k)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def metrics(self) -> dict:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_rate": round(self.stats["hits"] / lookups, 4) if lookups else None,
+            "entries": len(self._entries),
+        }
+
+
+_users = TTLCache(settings.AUTH_CACHE_TTL_SECONDS, settings.AUTH_CACHE_MAX_ENTRIES)
+_members = TTLCache(settings.AUTH_CACHE_TTL_SECONDS, settings.AUTH_CACHE_MAX_ENTRIES)
+
+
+def _enabled() -> bool:
+    return settings.AUTH_CACHE_ENABLED and settings.AUTH_CACHE_TTL_SECONDS > 0
+
+
+def get_user(user_id: str) -> Optional[dict]:
+    return _users.get(user_id) if _enabled() else None
+
+
+def put_user(user) -> None:
+    if _enabled() and user.status == "active":
+        _users.set(user.id, {c: getattr(user, c) for c in USER_COLUMNS})
+
+
+def get_member(user_id: str, tenant_id: str) -> Optional[dict]:
+    return _members.get((user_id, tenant_id)) if _enabled() else None
+
+
+def put_member(member) -> None:
+    if _enabled():
+        _members.set((member.user_id, member.tenant_id), {c: getattr(member, c) for c in MEMBER_COLUMNS})
+
+
+def invalidate_user(user_id: str) -> None:
+    """User status/profile changed: drop the user and all of their memberships."""
+    _users.pop(user_id)
+    _members.discard_where(lambda key: key[0] == user_id)
+
+
+def invalidate_membership(user_id: str, tenant_id: str) -> None:
+    _members.pop((user_id, tenant_id))
+
+
+def clear() -> None:
+    _users.clear()
+    _members.clear()
+
+
+def metrics() -> dict:
+    return {"users": _users.metrics(), "memberships": _members.metrics()}
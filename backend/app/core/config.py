@@ -34,6 +34,11 @@ class Settings(BaseSettings):
     STORAGE_BUCKET: str = "hipaa-evidence"
     STORAGE_REGION: str = "us-east-1"
     STORAGE_PRESIGN_EXPIRY: int = 3600  # seconds
+    STORAGE_MAX_POOL_CONNECTIONS: int = 32  # HTTP pool of the shared client = storage I/O threads
+    STORAGE_CONNECT_TIMEOUT: int = 5  # seconds
+    STORAGE_READ_TIMEOUT: int = 60  # seconds
+    STORAGE_STREAM_CHUNK_BYTES: int = 256 * 1024  # proxy / ZIP streaming chunk size
+    REPORT_BUNDLE_CACHE_ENABLED: bool = True  # store ZIP of published (immutable) packages for reuse
 
     # File limits
     MAX_UPLOAD_SIZE_BYTES: int = 25 * 1024 * 1024  # 25 MB
@@ -50,6 +55,18 @@ class Settings(BaseSettings):
     LLM_ENABLED: bool = False  # set True when key is configured
     LLM_MODEL: str = "claude-opus-4-6"
     CLAUDE_ANALYST_ENABLED: bool = False  # Next Layer: evidence validation
+    ANTHROPIC_BASE_URL: str = ""  # override API endpoint (e.g. local stub server); empty = SDK default
+    CLAUDE_ANALYST_CONCURRENCY: int = 4  # evidence analyses in flight per process
+    CLAUDE_ANALYST_REQUESTS_PER_MINUTE: int = 50
+    CLAUDE_ANALYST_TOKENS_PER_MINUTE: int = 40000  # input + output, estimated up front and corrected from usage
+    CLAUDE_ANALYST_MAX_RETRIES: int = 4
+    CLAUDE_ANALYST_BACKOFF_SECONDS: float = 1.0  # full-jitter exponential backoff base
+    CLAUDE_ANALYST_BACKOFF_MAX_SECONDS: float = 30.0
+    CLAUDE_ANALYST_TIMEOUT_SECONDS: float = 120.0
+    CLAUDE_ANALYST_MAX_CONTROLS_PER_CALL: int = 8  # controls evaluated per request for one document (1 = one call per pair)
+    CLAUDE_ANALYSIS_CACHE_ENABLED: bool = True  # reuse analyst results for identical text/control/guidance/prompt/model
+    CLAUDE_ANALYSIS_CACHE_TTL_DAYS: int = 30
+    CLAUDE_ANALYSIS_CACHE_MAX_ENTRIES: int = 50000  # least recently used entries evicted above this
 
     # OpenAI (ChatGPT Concierge — чат ассистента). Только OPENAI_*, не путать с Anthropic.
     OPENAI_API_KEY: str = ""
@@ -67,6 +84,52 @@ class Settings(BaseSettings):
     INGEST_BASE_URL: str = ""
     INGEST_API_KEY: str = ""
 
+    # Background jobs (engine runs, report generation) — DB-backed queue, see services/job_queue.py
+    JOB_WORKERS_ENABLED: bool = True  # False: API only enqueues, a separate process drains
+    JOB_WORKER_CONCURRENCY: int = 4
+    JOB_TENANT_CONCURRENCY: int = 1  # running jobs per tenant
+    JOB_MAX_ATTEMPTS: int = 3
+    JOB_POLL_INTERVAL_SECONDS: float = 1.0
+    JOB_HEARTBEAT_SECONDS: float = 5.0
+    JOB_RETRY_BACKOFF_SECONDS: float = 10.0  # doubled per attempt
+    JOB_STALE_AFTER_SECONDS: float = 120.0
+
+    # Evidence text extraction workers (services/extraction_worker.py) — drain extract_pending rows
+    EXTRACTION_WORKERS_ENABLED: bool = True
+    EXTRACTION_WORKER_CONCURRENCY: int = 2  # files parsed at once (one child process each)
+    EXTRACTION_TIMEOUT_SECONDS: float = 120.0  # per file; the parser process is killed after this
+    EXTRACTION_MEMORY_LIMIT_MB: int = 1024  # RLIMIT_AS of the parser process (0 = unlimited)
+    EXTRACTION_POLL_INTERVAL_SECONDS: float = 2.0
+    EXTRACTION_STALE_AFTER_SECONDS: float = 600.0  # 'extracting' rows older than this go back to pending
+    EXTRACTION_CHAR_BUDGET: int = 48000  # stop extracting text after this many characters (0 = no limit)
+    EXTRACTION_PDF_SAMPLE_SECTIONS: bool = False  # split the budget between beginning, middle and end
+    EXTRACTION_TABLE_MAX_ROWS: int = 200  # rows per DOCX table / XLSX sheet included as TSV; the rest is summarized
+    EXTRACTION_TABLE_MAX_COLS: int = 30
+    # Local OCR for image evidence and scanned PDF pages (pytesseract + tesseract-ocr binary)
+    EXTRACTION_OCR_ENABLED: bool = False
+    EXTRACTION_OCR_LANG: str = "eng"
+    EXTRACTION_OCR_MAX_SIDE: int = 3000  # px; larger images are downscaled before OCR
+    EXTRACTION_OCR_MAX_PDF_PAGES: int = 20  # scanned pages OCR'd per PDF (0 = no OCR for PDFs)
+    EXTRACTION_OCR_CACHE_DIR: str = "/tmp/evidence-ocr-cache"  # OCR text per image sha256 ("" = no cache)
+
+    # Workforce CSV import — services/workforce_import.py
+    WORKFORCE_IMPORT_CHUNK_ROWS: int = 1000  # rows validated and upserted per statement (progress committed per chunk)
+    WORKFORCE_IMPORT_MAX_ERRORS: int = 500  # per-row errors kept in WorkforceImportLog.errors
+    WORKFORCE_IMPORT_STALE_AFTER_SECONDS: int = 600  # running import without progress this long → failed (process died)
+
+    # Auth cache: active users and tenant memberships per process — core/auth_cache.py
+    AUTH_CACHE_ENABLED: bool = True
+    AUTH_CACHE_TTL_SECONDS: float = 30.0  # upper bound for changes made by other processes to show up
+    AUTH_CACHE_MAX_ENTRIES: int = 10000
+
+    # In-process reference data cache (frameworks, controls, rules, questions) — services/reference_data.py
+    REFERENCE_CACHE_ENABLED: bool = True
+    REFERENCE_CACHE_CHECK_SECONDS: float = 10.0  # how often reference_data_version is re-read
+
+    # Report rendering (ReportLab/openpyxl) — see report_generator.run_renderer
+    REPORT_RENDER_EXECUTOR: str = "process"  # process | thread | inline
+    REPORT_RENDER_POOL_SIZE: int = 4  # 0 = render inline on the event loop
+
     # Submit gate
     SUBMIT_COMPLETENESS_THRESHOLD: float = 0.70
     CRITICAL_QUESTION_CODES: list[str] = [
@@ -0,0 +1,51 @@
+"""
+Request-scoped entity loaders.
+
+Each request (and each background job) works in its own AsyncSession, and the session's identity
+map already is a request-scoped cache: session.get() returns an instance loaded earlier in the
+same session without a query. Routes, their helpers and the services they call load
+Assessment / Tenant / Control / EvidenceFile / ReportPackage by primary key through these
+loaders instead of select(...).where(id == ...), which always round-trips, so each entity is
+fetched at most once per request.
+
+tenant_id (optional) scopes the lookup: an entity of another tenant is reported as missing.
+Rows needing a fresh read or a lock (with_for_update, populate_existing) do not use these.
+"""
+from __future__ import annotations
+
+from typing import Optional, TypeVar
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.models import Assessment, Control, EvidenceFile, ReportPackage, Tenant
+
+T = TypeVar("T")
+
+
+async def _get_scoped(db: AsyncSession, model: type[T], entity_id: Optional[str], tenant_id: Optional[str]) -> Optional[T]:
+    if not entity_id:
+        return None
+    obj = await db.get(model, entity_id)
+    if obj is None or (tenant_id is not None and obj.tenant_id != tenant_id):
+        return None
+    return obj
+
+
+async def get_assessment(db: AsyncSession, assessment_id: Optional[str], tenant_id: Optional[str] = None) -> Optional[Assessment]:
+    return await _get_scoped(db, Assessment, assessment_id, tenant_id)
+
+
+async def get_tenant(db: AsyncSession, tenant_id: Optional[str]) -> Optional[Tenant]:
+    return await _get_scoped(db, Tenant, tenant_id, None)
+
+
+async def get_control(db: AsyncSession, control_id: Optional[str]) -> Optional[Control]:
+    return await _get_scoped(db, Control, control_id, None)
+
+
+async def get_evidence_file(db: AsyncSession, evidence_file_id: Optional[str], tenant_id: Optional[str] = None) -> Optional[EvidenceFile]:
+    return await _get_scoped(db, EvidenceFile, evidence_file_id, tenant_id)
+
+
+async def get_report_package(db: AsyncSession, package_id: Optional[str], tenant_id: Optional[str] = None) -> Optional[ReportPackage]:
+    return await _get_scoped(db, ReportPackage, package_id, tenant_id)
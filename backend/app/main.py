@@ -3,6 +3,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
 from app.api.routes import auth, tenants, frameworks, audit, assessments, answers, evidence, engine, reports, templates, training, notifications, internal, workforce, ingest, ai_evidence, workflow
 from app.api.internal.ingest_proxy import router as ingest_proxy_router
+from app.services import extraction_worker, job_queue, storage
+from app.services.report_generator import shutdown_render_pool
 
 app = FastAPI(
     title=settings.APP_NAME,
@@ -52,6 +54,22 @@ app.include_router(ingest_proxy_router, prefix="/api/v1")
 app.include_router(ai_evidence.router, prefix="/api/v1")
 
 
+@app.on_event("startup")
+async def start_job_workers():
+    if settings.JOB_WORKERS_ENABLED:
+        await job_queue.start_workers()
+    if settings.EXTRACTION_WORKERS_ENABLED:
+        await extraction_worker.start_workers()
+
+
+@app.on_event("shutdown")
+async def stop_job_workers():
+    await job_queue.stop_workers()
+    await extraction_worker.stop_workers()
+    shutdown_render_pool()
+    storage.shutdown()
+
+
 @app.get("/health")
 async def health():
     """Health check. claude_configured = True if ANTHROPIC_API_KEY is set (Claude AI will be used)."""
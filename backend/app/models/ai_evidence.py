@@ -8,7 +8,7 @@ from datetime import datetime
 from typing import Optional
 from sqlalchemy import Text, DateTime, Float, Integer, ForeignKey, Index, func, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.session import Base
 
 
@@ -35,6 +35,30 @@ class ControlExpectationSpec(Base):
     )
 
 
+class EvidenceContentExtraction(Base):
+    """
+    Extraction output stored once per file content: (tenant, sha256 of the bytes).
+    EvidenceExtraction rows of every assessment that uses the same bytes point here, so a file
+    linked to another assessment (or re-uploaded unchanged) is not downloaded and parsed again.
+    """
+    __tablename__ = "evidence_content_extractions"
+
+    id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True, default=gen_uuid)
+    tenant_id: Mapped[str] = mapped_column(UUID(as_uuid=False), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
+    sha256: Mapped[str] = mapped_column(Text, nullable=False)
+    content_type: Mapped[str] = mapped_column(Text, nullable=False)
+    status: Mapped[str] = mapped_column(Text, nullable=False, default="extract_pending")
+    extraction_result: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        UniqueConstraint("tenant_id", "sha256", name="uq_evidence_content_extraction"),
+        Index("ix_evidence_content_extractions_status", "status", "updated_at"),
+    )
+
+
 class EvidenceExtraction(Base):
     """Result of text/structure extraction from an evidence file (input to Claude)."""
     __tablename__ = "evidence_extractions"
@@ -43,14 +67,25 @@ class EvidenceExtraction(Base):
     tenant_id: Mapped[str] = mapped_column(UUID(as_uuid=False), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
     assessment_id: Mapped[str] = mapped_column(UUID(as_uuid=False), ForeignKey("assessments.id", ondelete="CASCADE"), nullable=False)
     evidence_file_id: Mapped[str] = mapped_column(UUID(as_uuid=False), ForeignKey("evidence_files.id", ondelete="CASCADE"), nullable=False)
-    status: Mapped[str] = mapped_column(Text, nullable=False, default="extract_pending")
-    extraction_result: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    content_extraction_id: Mapped[Optional[str]] = mapped_column(UUID(as_uuid=False), ForeignKey("evidence_content_extractions.id", ondelete="SET NULL"), nullable=True)
+    status: Mapped[str] = mapped_column(Text, nullable=False, default="extract_pending")  # mirrors content.status when linked
+    extraction_result: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)  # legacy rows without content link
     error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
+    content: Mapped[Optional["EvidenceContentExtraction"]] = relationship(lazy="joined")
+
+    @property
+    def result(self) -> Optional[dict]:
+        """Extraction output: the shared per-content result when linked, else this row's own."""
+        if self.content is not None:
+            return self.content.extraction_result
+        return self.extraction_result
+
     __table_args__ = (
         Index("ix_evidence_extractions_evidence_file", "evidence_file_id"),
+        Index("ix_evidence_extractions_content", "content_extraction_id"),
         Index("ix_evidence_extractions_assessment", "assessment_id"),
         Index("ix_evidence_extractions_tenant", "tenant_id"),
     )
@@ -82,8 +117,42 @@ class EvidenceAssessmentResult(Base):
     )
 
 
+class EvidenceAnalysisCache(Base):
+    """
+    Cached Claude analyst output, keyed by what the prompt was built from:
+    sha256(tenant, text sha256, control_code, guidance sha256, prompt_version, model).
+    Entries expire after CLAUDE_ANALYSIS_CACHE_TTL_DAYS; least recently used are evicted above
+    CLAUDE_ANALYSIS_CACHE_MAX_ENTRIES (services/analysis_cache.py).
+    """
+    __tablename__ = "evidence_analysis_cache"
+
+    cache_key: Mapped[str] = mapped_column(Text, primary_key=True)
+    tenant_id: Mapped[str] = mapped_column(UUID(as_uuid=False), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
+    text_sha256: Mapped[str] = mapped_column(Text, nullable=False)
+    control_code: Mapped[str] = mapped_column(Text, nullable=False)
+    guidance_sha256: Mapped[str] = mapped_column(Text, nullable=False)
+    prompt_version: Mapped[str] = mapped_column(Text, nullable=False)
+    model: Mapped[str] = mapped_column(Text, nullable=False)
+    result_payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    hit_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    last_used_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+
+    __table_args__ = (
+        Index("ix_evidence_analysis_cache_expires", "expires_at"),
+        Index("ix_evidence_analysis_cache_last_used", "last_used_at"),
+        Index("ix_evidence_analysis_cache_tenant", "tenant_id"),
+    )
+
+
 class ControlEvidenceAggregate(Base):
-    """Aggregated evidence status per assessment + control (for engine/UI/ChatGPT)."""
+    """
+    Aggregated evidence status per assessment + control (for engine/UI/ChatGPT).
+    Running counts (per result status, strength sum/count) are maintained incrementally as
+    results are added (evidence_aggregator.apply_result_deltas); status/score/avg_strength
+    are derived from them.
+    """
     __tablename__ = "control_evidence_aggregates"
 
     id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True, default=gen_uuid)
@@ -96,6 +165,12 @@ class ControlEvidenceAggregate(Base):
     analysis_ids_used: Mapped[Optional[list]] = mapped_column(JSONB, nullable=True)
     avg_strength: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
     findings_summary: Mapped[Optional[list]] = mapped_column(JSONB, nullable=True)
+    validated_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    weak_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    mismatch_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    unreadable_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    strength_sum: Mapped[float] = mapped_column(Float, nullable=False, default=0.0, server_default="0")
+    strength_count: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     __table_args__ = (
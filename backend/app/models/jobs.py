@@ -0,0 +1,45 @@
+"""
+Background jobs — DB-backed queue for long-running work (engine runs, report generation).
+State: queued → running → completed | failed | cancelled (running → queued on retry).
+"""
+import uuid
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import Boolean, Integer, Text, DateTime, ForeignKey, Index, func
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.orm import Mapped, mapped_column
+from app.db.session import Base
+
+
+def gen_uuid():
+    return str(uuid.uuid4())
+
+
+class BackgroundJob(Base):
+    __tablename__ = "background_jobs"
+
+    id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True, default=gen_uuid)
+    tenant_id: Mapped[str] = mapped_column(UUID(as_uuid=False), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
+    job_type: Mapped[str] = mapped_column(Text, nullable=False)  # engine_run | ...
+    entity_type: Mapped[Optional[str]] = mapped_column(Text, nullable=True)  # assessment | report_package
+    entity_id: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    status: Mapped[str] = mapped_column(Text, nullable=False, default="queued")  # queued|running|completed|failed|cancelled
+    payload: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    result: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    progress: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    error: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    max_attempts: Mapped[int] = mapped_column(Integer, nullable=False, default=3)
+    cancel_requested: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
+    requested_by_user_id: Mapped[Optional[str]] = mapped_column(UUID(as_uuid=False), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    available_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())  # retry backoff
+    heartbeat_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    started_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("ix_background_jobs_status_available", "status", "available_at"),
+        Index("ix_background_jobs_tenant_status", "tenant_id", "status"),
+        Index("ix_background_jobs_entity", "entity_type", "entity_id"),
+    )
@@ -191,6 +191,18 @@ class Rule(Base):
     )
 
 
+class ReferenceDataVersion(Base):
+    """
+    Single-row counter bumped whenever framework/control/rule/question data is (re)seeded.
+    In-process reference caches (services/reference_data.py) compare it to drop stale entries.
+    """
+    __tablename__ = "reference_data_version"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, default=1)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=1)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
 # ── 3. INTAKE / QUESTIONNAIRES DOMAIN ─────────────────────────────────────────
 
 class Question(Base):
@@ -254,6 +266,7 @@ class Answer(Base):
     question_id: Mapped[str] = mapped_column(UUID(as_uuid=False), ForeignKey("questions.id"), nullable=False)
     value: Mapped[dict] = mapped_column(JSONB, nullable=False)  # {"choice": "Yes"} or {"date": "2024-01-01"}
     updated_by_user_id: Mapped[Optional[str]] = mapped_column(UUID(as_uuid=False), ForeignKey("users.id"), nullable=True)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")  # +1 per change (optimistic autosave)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
@@ -405,6 +418,22 @@ class RemediationAction(Base):
     )
 
 
+class EngineDirtyControl(Base):
+    """Control whose engine outputs are stale (answer/evidence changed since last run)."""
+    __tablename__ = "engine_dirty_controls"
+
+    id: Mapped[str] = mapped_column(UUID(as_uuid=False), primary_key=True, default=gen_uuid)
+    tenant_id: Mapped[str] = mapped_column(UUID(as_uuid=False), ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False)
+    assessment_id: Mapped[str] = mapped_column(UUID(as_uuid=False), ForeignKey("assessments.id", ondelete="CASCADE"), nullable=False)
+    control_id: Mapped[str] = mapped_column(UUID(as_uuid=False), ForeignKey("controls.id", ondelete="CASCADE"), nullable=False)
+    reason: Mapped[str] = mapped_column(Text, nullable=False)  # answer|evidence_link
+    marked_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        UniqueConstraint("assessment_id", "control_id", name="uq_engine_dirty_control"),
+    )
+
+
 # ── 6. REPORT PACKAGE DOMAIN ──────────────────────────────────────────────────
 
 class ReportPackage(Base):
@@ -497,13 +526,17 @@ from app.models.ingest import IngestReceipt  # noqa: E402
 # AI Evidence Validation & Client Concierge (Next Layer)
 from app.models.ai_evidence import (  # noqa: E402
     ControlExpectationSpec,
+    EvidenceContentExtraction,
     EvidenceExtraction,
     EvidenceAssessmentResult,
+    EvidenceAnalysisCache,
     ControlEvidenceAggregate,
     ClientTask,
     ClientNote,
     AssistantMessageLog,
 )
+# Background job queue (engine runs, report generation)
+from app.models.jobs import BackgroundJob  # noqa: E402
 # Audit Workflow, Self-Attestation, Compliance Timeline (SESSION 8)
 from app.models.workflow import (  # noqa: E402
     ControlRequiredEvidence,
@@ -7,7 +7,7 @@ import uuid
 from datetime import datetime
 from typing import Optional
 
-from sqlalchemy import Boolean, Integer, Text, DateTime, ForeignKey, func
+from sqlalchemy import Boolean, Integer, Text, DateTime, ForeignKey, Index, func
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.session import Base
@@ -39,6 +39,11 @@ class Employee(Base):
         "EmployeeTrainingAssignment", back_populates="employee", cascade="all, delete-orphan"
     )
 
+    __table_args__ = (
+        # Created in 005_workforce; target of the CSV import upsert (ON CONFLICT (tenant_id, email))
+        Index("ix_employees_email_tenant", "tenant_id", "email", unique=True),
+    )
+
     @property
     def full_name(self) -> str:
         return f"{self.first_name} {self.last_name}"
@@ -111,7 +116,11 @@ class WorkforceImportLog(Base):
     created_count: Mapped[int] = mapped_column(Integer, nullable=False)
     updated_count: Mapped[int] = mapped_column(Integer, nullable=False)
     skipped_count: Mapped[int] = mapped_column(Integer, nullable=False)
-    errors: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
+    errors: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)  # [{"row", "error"}], capped
+    status: Mapped[str] = mapped_column(Text, nullable=False, default="running", server_default="completed")  # running | completed | failed
+    processed_rows: Mapped[int] = mapped_column(Integer, nullable=False, default=0, server_default="0")  # progress while running
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)  # last progress commit
+    finished_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
 
 
@@ -36,6 +36,10 @@ class EvidenceAnalyzeRequest(BaseModel):
     force_reanalyze: bool = False
 
 
+class EvidenceBatchAnalyzeRequest(BaseModel):
+    force_reanalyze: bool = False  # False: skip pairs already analyzed with the current prompt/model
+
+
 class EvidenceAssessmentResultDTO(BaseModel):
     analysis_id: str
     evidence_file_id: str
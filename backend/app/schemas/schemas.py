@@ -221,19 +221,38 @@ class AnswerValue(BaseModel):
 
 class UpsertAnswerRequest(BaseModel):
     value: AnswerValue
+    base_version: Optional[int] = None  # version the client edited; 0 = no answer yet; None = overwrite
 
 
 class BatchAnswerItem(BaseModel):
     question_id: str
     value: AnswerValue
+    base_version: Optional[int] = None
 
 
 class BatchUpsertAnswersRequest(BaseModel):
     answers: list[BatchAnswerItem]
 
 
+class AnswerVersion(BaseModel):
+    question_id: str
+    version: int
+
+
+class AnswerConflict(BaseModel):
+    """Answer changed by someone else since base_version; the write was skipped."""
+    question_id: str
+    base_version: Optional[int]
+    current_version: int
+    current_value: dict
+    updated_by_user_id: Optional[str]
+    updated_at: datetime
+
+
 class BatchUpsertAnswersResponse(BaseModel):
     updated_count: int
+    versions: list[AnswerVersion] = []  # current version of every saved or unchanged answer
+    conflicts: list[AnswerConflict] = []
 
 
 class AnswerDTO(BaseModel):
@@ -243,6 +262,7 @@ class AnswerDTO(BaseModel):
     question_id: str
     value: dict
     updated_by_user_id: Optional[str]
+    version: int = 1
     created_at: datetime
     updated_at: datetime
 
@@ -256,6 +276,7 @@ class AnswerWithQuestionDTO(BaseModel):
     question_type: str  # yes_no, yes_no_partial, yes_no_unknown, select, date
     options: Optional[list[str]] = None
     answer_value: Optional[str] = None  # current value as string (choice, date, or text)
+    answer_version: Optional[int] = None  # send back as base_version when saving
     control_id: Optional[str] = None    # hipaa_control_id e.g. HIPAA-GV-01
 
     model_config = {"from_attributes": True}
@@ -342,6 +363,8 @@ class EngineRunResponse(BaseModel):
     controlset_version_id: str
     ruleset_version_id: str
     error: Optional[str] = None
+    attempts: int = 0
+    stats: Optional[dict] = None
 
 
 class ControlResultDTO(BaseModel):
@@ -469,6 +492,20 @@ class GenerateReportPackageResponse(BaseModel):
     files: list[ReportFileItem]
 
 
+class ReportGenerationJobDTO(BaseModel):
+    """Background generation job: progress = {step: state}, result set when completed."""
+    job_id: str
+    report_package_id: str
+    status: str  # queued | running | completed | failed | cancelled
+    progress: dict = {}
+    error: Optional[str] = None
+    attempts: int = 0
+    created_at: Optional[datetime] = None
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    result: Optional[GenerateReportPackageResponse] = None
+
+
 class PublishReportPackageRequest(BaseModel):
     publish_note: Optional[str] = None
 
@@ -665,6 +702,7 @@ class WorkforceStatsDTO(BaseModel):
 
 
 class WorkforceImportResultDTO(BaseModel):
+    import_id: Optional[str] = None
     total_rows: int
     created_count: int
     updated_count: int
@@ -672,6 +710,23 @@ class WorkforceImportResultDTO(BaseModel):
     errors: Optional[dict] = None
 
 
+class WorkforceImportLogDTO(BaseModel):
+    id: str
+    filename: Optional[str]
+    status: str  # running | completed | failed
+    processed_rows: int
+    total_rows: int
+    created_count: int
+    updated_count: int
+    skipped_count: int
+    errors: Optional[list] = None
+    imported_by: Optional[str]
+    created_at: datetime
+    finished_at: Optional[datetime]
+
+    model_config = {"from_attributes": True}
+
+
 # ── INGEST (Commit 31) ───────────────────────────────────────────────────────
 
 class IngestPackageRequest(BaseModel):
@@ -0,0 +1,172 @@
+"""
+Evidence analysis cache — persistent reuse of Claude analyst results.
+
+Key = sha256 over (tenant, sha256 of the text actually sent, control_code, sha256 of the
+expectation guidance, PROMPT_VERSION, model). The same policy PDF linked to several controls,
+re-clicked "analyze", or reused in a later assessment does not call the model again.
+Scoped per tenant. Only real model responses are stored (not disabled/failed fallbacks).
+Lookups are plain SELECTs on the caller's session; usage (hit_count, last_used_at) is written in
+its own short transaction, so a job holding its session through a long LLM phase holds no
+cache row locks and never blocks other jobs hitting the same keys.
+
+Eviction: entries expire after CLAUDE_ANALYSIS_CACHE_TTL_DAYS; prune_analysis_cache() also
+drops least recently used rows above CLAUDE_ANALYSIS_CACHE_MAX_ENTRIES.
+"""
+import hashlib
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable, Optional
+
+from sqlalchemy import select, update, delete, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models.ai_evidence import EvidenceAnalysisCache
+from app.services.claude_analyst import MAX_TEXT_CHARS, PROMPT_VERSION, analyze_evidence
+
+logger = logging.getLogger(__name__)
+
+# Prune after this many stores per process (expired + over-capacity rows)
+_PRUNE_EVERY = 100
+_stores_since_prune = 0
+
+
+def _sha256(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8")).hexdigest()
+
+
+def analysis_cache_entry(
+    tenant_id: str,
+    extracted_text: str,
+    control_code: str,
+    expectation_guidance: Optional[str] = None,
+) -> dict[str, str]:
+    """Key columns for one analysis; normalized the same way the analyst builds its prompt."""
+    parts = {
+        "tenant_id": str(tenant_id),
+        "text_sha256": _sha256((extracted_text or "")[:MAX_TEXT_CHARS].strip()),
+        "control_code": control_code,
+        "guidance_sha256": _sha256((expectation_guidance or "").strip()),
+        "prompt_version": PROMPT_VERSION,
+        "model": settings.LLM_MODEL,
+    }
+    parts["cache_key"] = _sha256("|".join(parts[k] for k in (
+        "tenant_id", "text_sha256", "control_code", "guidance_sha256", "prompt_version", "model",
+    )))
+    return parts
+
+
+async def get_cached_analyses(db: AsyncSession, cache_keys: Iterable[str]) -> dict[str, dict[str, Any]]:
+    """Unexpired results for the given keys (read only); usage is recorded separately."""
+    if not settings.CLAUDE_ANALYSIS_CACHE_ENABLED:
+        return {}
+    keys = list(set(cache_keys))
+    if not keys:
+        return {}
+    now = datetime.now(timezone.utc)
+    rows = (
+        await db.execute(
+            select(EvidenceAnalysisCache.cache_key, EvidenceAnalysisCache.result_payload).where(
+                EvidenceAnalysisCache.cache_key.in_(keys),
+                EvidenceAnalysisCache.expires_at > now,
+            )
+        )
+    ).all()
+    hits = {key: payload for key, payload in rows}
+    if hits:
+        await _record_usage(list(hits), now)
+    return hits
+
+
+async def _record_usage(cache_keys: list[str], now: datetime) -> None:
+    """hit_count / last_used_at for LRU pruning. Own session, committed at once; best-effort."""
+    try:
+        async with AsyncSessionLocal() as session:
+            await session.execute(
+                update(EvidenceAnalysisCache)
+                .where(EvidenceAnalysisCache.cache_key.in_(sorted(cache_keys)))
+                .values(hit_count=EvidenceAnalysisCache.hit_count + 1, last_used_at=now)
+            )
+            await session.commit()
+    except Exception:
+        logger.warning("Could not record analysis cache usage", exc_info=True)
+
+
+async def store_analyses(db: AsyncSession, entries: list[tuple[dict[str, str], dict[str, Any]]]) -> None:
+    """entries: (analysis_cache_entry(...), result). Upserts; an existing key gets a fresh TTL."""
+    global _stores_since_prune
+    if not settings.CLAUDE_ANALYSIS_CACHE_ENABLED or not entries:
+        return
+    now = datetime.now(timezone.utc)
+    expires_at = now + timedelta(days=settings.CLAUDE_ANALYSIS_CACHE_TTL_DAYS)
+    rows = {
+        parts["cache_key"]: {
+            **parts,
+            "result_payload": result,
+            "hit_count": 0,
+            "created_at": now,
+            "last_used_at": now,
+            "expires_at": expires_at,
+        }
+        for parts, result in entries
+    }
+    stmt = pg_insert(EvidenceAnalysisCache).values(list(rows.values()))
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[EvidenceAnalysisCache.cache_key],
+            set_={
+                "result_payload": stmt.excluded.result_payload,
+                "created_at": stmt.excluded.created_at,
+                "last_used_at": stmt.excluded.last_used_at,
+                "expires_at": stmt.excluded.expires_at,
+            },
+        )
+    )
+    _stores_since_prune += len(rows)
+    if _stores_since_prune >= _PRUNE_EVERY:
+        _stores_since_prune = 0
+        await prune_analysis_cache(db)
+
+
+async def prune_analysis_cache(db: AsyncSession) -> int:
+    """Delete expired entries, then least recently used ones above the size limit. Returns rows deleted."""
+    now = datetime.now(timezone.utc)
+    deleted = (
+        await db.execute(delete(EvidenceAnalysisCache).where(EvidenceAnalysisCache.expires_at <= now))
+    ).rowcount or 0
+    total = (await db.execute(select(func.count()).select_from(EvidenceAnalysisCache))).scalar_one()
+    excess = total - settings.CLAUDE_ANALYSIS_CACHE_MAX_ENTRIES
+    if excess > 0:
+        oldest = (
+            select(EvidenceAnalysisCache.cache_key)
+            .order_by(EvidenceAnalysisCache.last_used_at)
+            .limit(excess)
+            .scalar_subquery()
+        )
+        deleted += (
+            await db.execute(delete(EvidenceAnalysisCache).where(EvidenceAnalysisCache.cache_key.in_(oldest)))
+        ).rowcount or 0
+    return deleted
+
+
+async def analyze_with_cache(
+    db: AsyncSession,
+    tenant_id: str,
+    extracted_text: str,
+    control_code: str,
+    control_title: str,
+    expectation_guidance: Optional[str] = None,
+    force_reanalyze: bool = False,
+) -> tuple[dict[str, Any], bool]:
+    """Cached analyst call for one pair. Returns (result, cache_hit); force_reanalyze skips the lookup."""
+    parts = analysis_cache_entry(tenant_id, extracted_text, control_code, expectation_guidance)
+    if not force_reanalyze:
+        hit = (await get_cached_analyses(db, [parts["cache_key"]])).get(parts["cache_key"])
+        if hit is not None:
+            return hit, True
+    result, from_model = await analyze_evidence(extracted_text, control_code, control_title, expectation_guidance)
+    if from_model:
+        await store_analyses(db, [(parts, result)])
+    return result, False
@@ -0,0 +1,97 @@
+"""
+Answer store — batched questionnaire writes.
+The UI autosaves often; a batch of answers (already validated in memory against cached question
+metadata) is written with one INSERT … ON CONFLICT (assessment_id, question_id) DO UPDATE.
+
+Optimistic concurrency: every answer carries a version (1 on insert, +1 per change). An item
+with base_version only overwrites the row if it is still at that version (0 = "there was no
+answer yet"); base_version=None overwrites unconditionally. Rows whose value would not change
+are not touched either. Items the upsert skipped are re-read once: same value → unchanged,
+otherwise → conflict (returned to the client with the current value, nothing is overwritten).
+"""
+from dataclasses import dataclass, field
+from typing import Optional
+
+from sqlalchemy import and_, case, func, select, true
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.models import Answer
+
+
+@dataclass(frozen=True, slots=True)
+class AnswerWrite:
+    question_id: str
+    value: dict
+    base_version: Optional[int] = None
+
+
+@dataclass(slots=True)
+class SaveResult:
+    written: list[Answer] = field(default_factory=list)
+    unchanged: list[Answer] = field(default_factory=list)
+    conflicts: list[tuple[Answer, Optional[int]]] = field(default_factory=list)  # (current row, base_version)
+
+
+async def save_answers(
+    db: AsyncSession,
+    tenant_id: str,
+    assessment_id: str,
+    user_id: Optional[str],
+    items: list[AnswerWrite],
+) -> SaveResult:
+    """One upsert for the whole batch (caller commits). A question listed twice keeps the last item."""
+    result = SaveResult()
+    by_question = {item.question_id: item for item in items}
+    if not by_question:
+        return result
+
+    stmt = pg_insert(Answer).values([
+        {
+            "tenant_id": tenant_id,
+            "assessment_id": assessment_id,
+            "question_id": item.question_id,
+            "value": item.value,
+            "updated_by_user_id": user_id,
+            "version": 1,
+        }
+        for item in by_question.values()
+    ])
+    ex = stmt.excluded
+    should_update = Answer.value.is_distinct_from(ex.value)
+    expected = {qid: item.base_version for qid, item in by_question.items() if item.base_version is not None}
+    if expected:
+        # Per-row version check inside the single statement: CASE on the conflicting question_id
+        should_update = and_(
+            should_update,
+            case(
+                *((ex.question_id == qid, Answer.version == base) for qid, base in expected.items()),
+                else_=true(),
+            ),
+        )
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_answer",
+        set_={
+            "value": ex.value,
+            "updated_by_user_id": ex.updated_by_user_id,
+            "version": Answer.version + 1,
+            "updated_at": func.now(),
+        },
+        where=should_update,
+    ).returning(Answer)
+    rows = await db.execute(stmt, execution_options={"populate_existing": True})
+    result.written = list(rows.scalars().all())
+
+    skipped = set(by_question) - {a.question_id for a in result.written}
+    if skipped:
+        current = await db.execute(
+            select(Answer).where(Answer.assessment_id == assessment_id, Answer.question_id.in_(skipped)),
+            execution_options={"populate_existing": True},
+        )
+        for answer in current.scalars().all():
+            item = by_question[answer.question_id]
+            if answer.value == item.value:
+                result.unchanged.append(answer)
+            else:
+                result.conflicts.append((answer, item.base_version))
+    return result
@@ -8,7 +8,8 @@ from datetime import datetime, timezone
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
-from app.models.models import Assessment, Control, ControlResult, Tenant
+from app.db import loaders
+from app.models.models import Control, ControlResult
 from app.models.workflow import (
     AuditWorkflowState,
     AuditChecklistItem,
@@ -89,9 +90,7 @@ async def advance_workflow(
 
     # Step 1: Agent data (by tenant.client_org_id, status ACCEPTED)
     if workflow.current_step == 1 and not workflow.step_1_status:
-        tenant = (
-            await db.execute(select(Tenant).where(Tenant.id == tenant_id))
-        ).scalar_one_or_none()
+        tenant = await loaders.get_tenant(db, tenant_id)
         client_org_id = (tenant.client_org_id or "").strip() if tenant else ""
         has_agent_data = False
         if client_org_id:
@@ -109,14 +108,7 @@ async def advance_workflow(
 
     # Step 2: Questionnaire (control results vs total controls for this assessment)
     elif workflow.current_step == 2 and not workflow.step_2_status:
-        assessment = (
-            await db.execute(
-                select(Assessment).where(
-                    Assessment.id == assessment_id,
-                    Assessment.tenant_id == tenant_id,
-                )
-            )
-        ).scalar_one_or_none()
+        assessment = await loaders.get_assessment(db, assessment_id, tenant_id)
         if not assessment:
             return workflow
         control_results = (
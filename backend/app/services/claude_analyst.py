@@ -1,17 +1,81 @@
 """
 Claude Analyst — evidence validation for Next Layer.
 Calls Anthropic API with extracted text + control context; returns EvidenceAssessmentResult.
+Async client; every call goes through one shared LLMScheduler (concurrency, requests/tokens
+per minute, jittered retries — CLAUDE_ANALYST_* settings). ANTHROPIC_BASE_URL can point the
+client at a local stub server (see scripts/bench_claude_analyst.py).
 """
 from __future__ import annotations
 
+import asyncio
 import json
 import re
 from typing import Optional, Any
 
 from app.core.config import settings
+from app.services.llm_scheduler import LLMScheduler
 
 PROMPT_VERSION = "1.0"
 VALID_STATUSES = {"validated", "weak", "mismatch", "unreadable"}
+MAX_TEXT_CHARS = 12000
+MAX_OUTPUT_TOKENS = 1024
+MAX_OUTPUT_TOKENS_PER_CONTROL = 600  # multi-control calls: output allowance per listed control
+MAX_OUTPUT_TOKENS_MULTI = 8192
+DEFAULT_GUIDANCE = "Evaluate relevance and completeness for this HIPAA control."
+RESULT_KEYS = """- "status": one of "validated" | "weak" | "mismatch" | "unreadable"
+- "overall_strength": number 0.0 to 1.0 (1 = strong evidence)
+- "confidence": number 0.0 to 1.0 (how confident you are in the assessment)
+- "findings": array of strings (brief findings)
+- "recommended_next_step": string (one clear action for the client)
+- "document_type_detected": string or null (e.g. "policy", "procedure", "screenshot", "log")
+"""
+
+_client = None
+_scheduler: Optional[LLMScheduler] = None
+
+
+def _get_client():
+    global _client
+    if _client is None:
+        import anthropic
+        # Retries are the scheduler's job (it also honours Retry-After across calls)
+        _client = anthropic.AsyncAnthropic(
+            api_key=settings.ANTHROPIC_API_KEY,
+            base_url=settings.ANTHROPIC_BASE_URL or None,
+            timeout=settings.CLAUDE_ANALYST_TIMEOUT_SECONDS,
+            max_retries=0,
+        )
+    return _client
+
+
+def _classify_error(exc: BaseException) -> tuple[bool, Optional[float]]:
+    import anthropic
+    if isinstance(exc, (anthropic.APITimeoutError, anthropic.APIConnectionError)):
+        return True, None
+    if isinstance(exc, anthropic.APIStatusError):
+        retry_after = None
+        try:
+            retry_after = float(exc.response.headers.get("retry-after") or 0) or None
+        except ValueError:
+            pass
+        # 429 rate limit, 5xx / 529 overloaded
+        return exc.status_code == 429 or exc.status_code >= 500, retry_after
+    return False, None
+
+
+def get_analyst_scheduler() -> LLMScheduler:
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = LLMScheduler(
+            max_concurrency=settings.CLAUDE_ANALYST_CONCURRENCY,
+            requests_per_minute=settings.CLAUDE_ANALYST_REQUESTS_PER_MINUTE,
+            tokens_per_minute=settings.CLAUDE_ANALYST_TOKENS_PER_MINUTE,
+            max_retries=settings.CLAUDE_ANALYST_MAX_RETRIES,
+            backoff_base_seconds=settings.CLAUDE_ANALYST_BACKOFF_SECONDS,
+            backoff_max_seconds=settings.CLAUDE_ANALYST_BACKOFF_MAX_SECONDS,
+            classify_error=_classify_error,
+        )
+    return _scheduler
 
 
 def _parse_analyst_response(text: str) -> dict[str, Any]:
@@ -28,7 +92,68 @@ def _parse_analyst_response(text: str) -> dict[str, Any]:
     return {}
 
 
-def analyze_evidence_with_claude(
+def _disabled_result() -> dict[str, Any]:
+    return {
+        "status": "unreadable",
+        "overall_strength": 0.0,
+        "confidence": 0.0,
+        "findings": ["AI analyst is disabled or not configured."],
+        "recommended_next_step": "Enable CLAUDE_ANALYST_ENABLED and set ANTHROPIC_API_KEY.",
+        "document_type_detected": None,
+    }
+
+
+def _no_text_result() -> dict[str, Any]:
+    return {
+        "status": "unreadable",
+        "overall_strength": 0.0,
+        "confidence": 1.0,
+        "findings": ["No text could be extracted from the document."],
+        "recommended_next_step": "Upload a document with readable text or use a supported format (PDF, DOCX, XLSX).",
+        "document_type_detected": None,
+    }
+
+
+def _failed_result(e: Exception) -> dict[str, Any]:
+    return {
+        "status": "unreadable",
+        "overall_strength": 0.0,
+        "confidence": 0.0,
+        "findings": [f"Analysis failed: {str(e)[:200]}"],
+        "recommended_next_step": "Retry analysis or contact support.",
+        "document_type_detected": None,
+    }
+
+
+def _normalize_result(out: dict[str, Any]) -> dict[str, Any]:
+    status = (out.get("status") or "unreadable").lower()
+    if status not in VALID_STATUSES:
+        status = "unreadable"
+    return {
+        "status": status,
+        "overall_strength": float(out.get("overall_strength", 0.0)),
+        "confidence": float(out.get("confidence", 0.0)),
+        "findings": out.get("findings") if isinstance(out.get("findings"), list) else [],
+        "recommended_next_step": str(out.get("recommended_next_step") or ""),
+        "document_type_detected": out.get("document_type_detected"),
+    }
+
+
+async def _create_message(prompt: str, max_tokens: int):
+    client = _get_client()
+    return await get_analyst_scheduler().run(
+        lambda: client.messages.create(
+            model=settings.LLM_MODEL,
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": prompt}],
+        ),
+        # ~4 chars per token for the prompt + the full output allowance
+        estimated_tokens=len(prompt) // 4 + max_tokens,
+        actual_tokens=lambda m: m.usage.input_tokens + m.usage.output_tokens,
+    )
+
+
+async def analyze_evidence_with_claude(
     extracted_text: str,
     control_code: str,
     control_title: str,
@@ -38,26 +163,23 @@ def analyze_evidence_with_claude(
     Call Claude to evaluate evidence for a HIPAA control.
     Returns dict with: status, overall_strength, confidence, findings, recommended_next_step, document_type_detected.
     """
+    result, _ = await analyze_evidence(extracted_text, control_code, control_title, expectation_guidance)
+    return result
+
+
+async def analyze_evidence(
+    extracted_text: str,
+    control_code: str,
+    control_title: str,
+    expectation_guidance: Optional[str] = None,
+) -> tuple[dict[str, Any], bool]:
+    """Same as analyze_evidence_with_claude; also returns whether the result came from the model (cacheable)."""
     if not settings.CLAUDE_ANALYST_ENABLED or not settings.ANTHROPIC_API_KEY:
-        return {
-            "status": "unreadable",
-            "overall_strength": 0.0,
-            "confidence": 0.0,
-            "findings": ["AI analyst is disabled or not configured."],
-            "recommended_next_step": "Enable CLAUDE_ANALYST_ENABLED and set ANTHROPIC_API_KEY.",
-            "document_type_detected": None,
-        }
-    text_preview = (extracted_text or "")[:12000].strip()
+        return _disabled_result(), False
+    text_preview = (extracted_text or "")[:MAX_TEXT_CHARS].strip()
     if not text_preview:
-        return {
-            "status": "unreadable",
-            "overall_strength": 0.0,
-            "confidence": 1.0,
-            "findings": ["No text could be extracted from the document."],
-            "recommended_next_step": "Upload a document with readable text or use a supported format (PDF, DOCX, XLSX).",
-            "document_type_detected": None,
-        }
-    guidance = (expectation_guidance or "").strip() or "Evaluate relevance and completeness for this HIPAA control."
+        return _no_text_result(), False
+    guidance = (expectation_guidance or "").strip() or DEFAULT_GUIDANCE
     prompt = f"""You are a HIPAA compliance analyst. Evaluate the following document as evidence for one control.
 
 Control: {control_code} — {control_title}
@@ -70,41 +192,112 @@ Extracted document text (may be truncated):
 ---
 
 Respond with a single JSON object (no other text) with these exact keys:
-- "status": one of "validated" | "weak" | "mismatch" | "unreadable"
-- "overall_strength": number 0.0 to 1.0 (1 = strong evidence)
-- "confidence": number 0.0 to 1.0 (how confident you are in the assessment)
-- "findings": array of strings (brief findings)
-- "recommended_next_step": string (one clear action for the client)
-- "document_type_detected": string or null (e.g. "policy", "procedure", "screenshot", "log")
-"""
+{RESULT_KEYS}"""
 
     try:
-        import anthropic
-        client = anthropic.Anthropic(api_key=settings.ANTHROPIC_API_KEY)
-        message = client.messages.create(
-            model=settings.LLM_MODEL,
-            max_tokens=1024,
-            messages=[{"role": "user", "content": prompt}],
-        )
-        response_text = message.content[0].text
-        out = _parse_analyst_response(response_text)
-        status = (out.get("status") or "unreadable").lower()
-        if status not in VALID_STATUSES:
-            status = "unreadable"
-        return {
-            "status": status,
-            "overall_strength": float(out.get("overall_strength", 0.0)),
-            "confidence": float(out.get("confidence", 0.0)),
-            "findings": out.get("findings") if isinstance(out.get("findings"), list) else [],
-            "recommended_next_step": str(out.get("recommended_next_step") or ""),
-            "document_type_detected": out.get("document_type_detected"),
-        }
+        message = await _create_message(prompt, MAX_OUTPUT_TOKENS)
+        return _normalize_result(_parse_analyst_response(message.content[0].text)), True
     except Exception as e:
-        return {
-            "status": "unreadable",
-            "overall_strength": 0.0,
-            "confidence": 0.0,
-            "findings": [f"Analysis failed: {str(e)[:200]}"],
-            "recommended_next_step": "Retry analysis or contact support.",
-            "document_type_detected": None,
-        }
+        return _failed_result(e), False
+
+
+# ── Multi-control analysis ────────────────────────────────────────────────────
+# A policy linked to several controls is sent once with the list of controls (at most
+# CLAUDE_ANALYST_MAX_CONTROLS_PER_CALL per request) instead of once per control. Same rubric
+# and per-control output as the single prompt, so results share PROMPT_VERSION and the
+# analysis cache. Controls missing from the model's answer fall back to single calls — all of
+# them when the answer is unusable as a whole (truncated at max_tokens, not parseable JSON).
+# Only a failed request itself (retries exhausted, auth) fails every control of the call.
+
+async def analyze_evidence_multi(
+    extracted_text: str,
+    controls: list[dict[str, Any]],
+) -> list[tuple[dict[str, Any], bool]]:
+    """
+    Evaluate one document against several controls in one model call.
+    controls: [{"control_code", "control_title", "expectation_guidance"}]. Returns
+    (result, from_model) per control, in input order.
+    """
+    if len(controls) <= 1:
+        return [await analyze_evidence(extracted_text, **c) for c in controls]
+    if not settings.CLAUDE_ANALYST_ENABLED or not settings.ANTHROPIC_API_KEY:
+        return [(_disabled_result(), False) for _ in controls]
+    text_preview = (extracted_text or "")[:MAX_TEXT_CHARS].strip()
+    if not text_preview:
+        return [(_no_text_result(), False) for _ in controls]
+
+    listing = "\n".join(
+        f"{i}. {c['control_code']} — {c['control_title']}\n"
+        f"   Expectations / guidance: {(c.get('expectation_guidance') or '').strip() or DEFAULT_GUIDANCE}"
+        for i, c in enumerate(controls, start=1)
+    )
+    prompt = f"""You are a HIPAA compliance analyst. Evaluate the following document as evidence for each of {len(controls)} controls, independently.
+
+Controls:
+{listing}
+
+Extracted document text (may be truncated):
+---
+{text_preview}
+---
+
+Respond with a single JSON object (no other text): {{"results": [...]}} with one object per control, in the order listed.
+Each object has "control_index" (the number above) and these exact keys:
+{RESULT_KEYS}"""
+
+    max_tokens = min(MAX_OUTPUT_TOKENS_MULTI, MAX_OUTPUT_TOKENS_PER_CONTROL * len(controls))
+    try:
+        message = await _create_message(prompt, max_tokens)
+    except Exception as e:
+        return [(_failed_result(e), False) for _ in controls]
+    out: dict[str, Any] = {}
+    if message.stop_reason != "max_tokens":
+        try:
+            out = _parse_analyst_response(message.content[0].text)
+        except (ValueError, IndexError, AttributeError):
+            out = {}
+
+    by_index: dict[int, dict[str, Any]] = {}
+    results = out.get("results") if isinstance(out, dict) else None
+    for item in results if isinstance(results, list) else []:
+        if not isinstance(item, dict):
+            continue
+        try:
+            idx = int(item.get("control_index"))
+            if 1 <= idx <= len(controls) and "status" in item and idx not in by_index:
+                by_index[idx] = _normalize_result(item)
+        except (TypeError, ValueError):
+            continue
+    missing = [i for i in range(1, len(controls) + 1) if i not in by_index]
+    fallback = dict(zip(missing, await asyncio.gather(*(
+        analyze_evidence(extracted_text, **controls[i - 1]) for i in missing
+    ))))
+    return [
+        fallback[i] if i in fallback else (by_index[i], True)
+        for i in range(1, len(controls) + 1)
+    ]
+
+
+async def analyze_evidence_batch(items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Analyze many (document, control) pairs concurrently; items are analyze_evidence_with_claude
+    keyword arguments. Items sharing the same document text go out as multi-control calls.
+    Results are returned in input order; the scheduler bounds the fan-out.
+    """
+    groups: dict[str, list[int]] = {}
+    for i, item in enumerate(items):
+        groups.setdefault((item.get("extracted_text") or "")[:MAX_TEXT_CHARS].strip(), []).append(i)
+    size = max(1, settings.CLAUDE_ANALYST_MAX_CONTROLS_PER_CALL)
+    chunks = [idx[k:k + size] for idx in groups.values() for k in range(0, len(idx), size)]
+
+    async def _run(chunk: list[int]) -> list[tuple[dict[str, Any], bool]]:
+        return await analyze_evidence_multi(
+            items[chunk[0]].get("extracted_text") or "",
+            [{k: v for k, v in items[i].items() if k != "extracted_text"} for i in chunk],
+        )
+
+    results: list[Optional[dict[str, Any]]] = [None] * len(items)
+    for chunk, out in zip(chunks, await asyncio.gather(*(_run(c) for c in chunks))):
+        for i, (result, _) in zip(chunk, out):
+            results[i] = result
+    return results
@@ -13,7 +13,8 @@ from typing import Any
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
-from app.models.models import Assessment, Control
+from app.db import loaders
+from app.models.models import Control
 from app.core.config import settings
 from app.services.report_context_builder import build_full_report_context
 
@@ -172,9 +173,7 @@ async def resolve_control_id_by_code(
     db: AsyncSession,
 ) -> str | None:
     """Возвращает Control.id (UUID) для данного assessment и control_code."""
-    assessment = (
-        await db.execute(select(Assessment).where(Assessment.id == assessment_id))
-    ).scalar_one_or_none()
+    assessment = await loaders.get_assessment(db, assessment_id)
     if not assessment:
         return None
     ctrl = (
@@ -18,18 +18,23 @@ Output per run:
   remediation_actions — 1+ per gap
 
 Per spec: replace outputs on re-run (idempotent).
+Incremental mode (run_engine_incremental) rewrites only controls marked dirty by
+answer/evidence changes; it falls back to a full run on structural changes.
+Outputs are evaluated in memory first and written with one multi-row INSERT per
+table (client-generated UUIDs), so a run costs a constant number of round-trips.
 Per spec: all controls must have a result, every non-Pass must have gap+risk+remediation.
 """
 
-import uuid
 from datetime import datetime, timezone, date
 from typing import Optional
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, delete
+from sqlalchemy import select, delete, insert, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from app.models.models import (
-    Assessment, Answer, Question, Control, Rule,
-    EvidenceLink, ControlResult, Gap, Risk, RemediationAction
+    Assessment, Answer,
+    EvidenceLink, ControlResult, Gap, Risk, RemediationAction, EngineDirtyControl, gen_uuid,
 )
+from app.services.reference_data import ControlRef, RuleRef, get_reference_cache
 
 
 # ── Severity priority (for downgrade logic) ───────────────────────────────────
@@ -317,7 +322,7 @@ class ControlEvaluation:
 
 # ── Pattern evaluators ────────────────────────────────────────────────────────
 
-def _apply_pattern_1(answer: Optional[dict], control: Control) -> tuple[str, str]:
+def _apply_pattern_1(answer: Optional[dict], control: ControlRef) -> tuple[str, str]:
     """PATTERN_1_BINARY_FAIL — Yes=Pass, No=Fail, missing=Unknown."""
     if not answer:
         return "Unknown", "No answer provided."
@@ -329,7 +334,7 @@ def _apply_pattern_1(answer: Optional[dict], control: Control) -> tuple[str, str
     return "Unknown", f"Unrecognized answer: {choice!r}."
 
 
-def _apply_pattern_2(answer: Optional[dict], control: Control) -> tuple[str, str]:
+def _apply_pattern_2(answer: Optional[dict], control: ControlRef) -> tuple[str, str]:
     """PATTERN_2_PARTIAL — Yes=Pass, Partial=Partial, No=Fail."""
     if not answer:
         return "Unknown", "No answer provided."
@@ -343,7 +348,7 @@ def _apply_pattern_2(answer: Optional[dict], control: Control) -> tuple[str, str
     return "Unknown", f"Unrecognized answer: {choice!r}."
 
 
-def _apply_pattern_3(answer: Optional[dict], logic: Optional[dict], control: Control) -> tuple[str, str]:
+def _apply_pattern_3(answer: Optional[dict], logic: Optional[dict], control: ControlRef) -> tuple[str, str]:
     """PATTERN_3_DATE / PATTERN_6_TIME_BOUND — date answer, time-bound validity."""
     if not answer:
         return "Unknown", "No answer provided."
@@ -376,7 +381,7 @@ def _apply_pattern_3(answer: Optional[dict], logic: Optional[dict], control: Con
 def _apply_pattern_4(
     answer: Optional[dict],
     has_evidence: bool,
-    control: Control,
+    control: ControlRef,
 ) -> tuple[str, str]:
     """PATTERN_4_EVIDENCE_DEPENDENT — Yes without evidence → Partial."""
     if not answer:
@@ -394,7 +399,7 @@ def _apply_pattern_4(
     return "Unknown", f"Unrecognized answer: {choice!r}."
 
 
-def _apply_pattern_5(answer: Optional[dict], control: Control) -> tuple[str, str]:
+def _apply_pattern_5(answer: Optional[dict], control: ControlRef) -> tuple[str, str]:
     """PATTERN_5_NA_VALID — N/A is a valid Pass for na_eligible controls."""
     if not answer:
         return "Unknown", "No answer provided."
@@ -415,8 +420,8 @@ def _apply_pattern_5(answer: Optional[dict], control: Control) -> tuple[str, str
 
 
 def _evaluate_control(
-    control: Control,
-    rule: Optional[Rule],
+    control: ControlRef,
+    rule: Optional[RuleRef],
     answer: Optional[dict],
     has_evidence: bool,
 ) -> tuple[str, str]:
@@ -511,35 +516,28 @@ async def run_engine(
     await db.execute(
         delete(ControlResult).where(ControlResult.assessment_id == assessment.id)
     )
-    await db.flush()
-
-    # ── 2. Load all controls for this assessment's controlset ──────────────────
-    ctrl_result = await db.execute(
-        select(Control).where(
-            Control.controlset_version_id == assessment.controlset_version_id
-        )
+    # A full run refreshes every control — nothing stays dirty
+    await db.execute(
+        delete(EngineDirtyControl).where(EngineDirtyControl.assessment_id == assessment.id)
     )
-    controls = ctrl_result.scalars().all()
+    await db.flush()
 
-    # ── 3. Load all rules for this assessment's ruleset ────────────────────────
-    rule_result = await db.execute(
-        select(Rule).where(
-            Rule.ruleset_version_id == assessment.ruleset_version_id
-        )
-    )
-    rules_map: dict[str, Rule] = {r.control_id: r for r in rule_result.scalars().all()}
+    # ── 2–3. Controls and rules of this assessment's versions (reference cache) ──
+    reference = get_reference_cache()
+    controls = (await reference.controls(db, assessment.controlset_version_id)).controls
+    rules_map: dict[str, RuleRef] = await reference.rules(db, assessment.ruleset_version_id)
+    questions = await reference.questions(db, assessment.framework_id)
 
     # ── 4. Load all answers for this assessment (question → Answer) ────────────
     answers_result = await db.execute(
-        select(Answer, Question)
-        .join(Question, Question.id == Answer.question_id)
-        .where(Answer.assessment_id == assessment.id)
+        select(Answer.question_id, Answer.value).where(Answer.assessment_id == assessment.id)
     )
-    # Build control_code → answer dict (one question per control in v1)
+    # Build control_id → answer dict (one question per control in v1)
     control_answers: dict[str, dict] = {}
-    for ans, question in answers_result.all():
-        # Map via question.control_id
-        control_answers[question.control_id] = ans.value
+    for question_id, value in answers_result.all():
+        question = questions.by_id.get(question_id)
+        if question is not None:
+            control_answers[question.control_id] = value
 
     # ── 5. Load evidence per control ───────────────────────────────────────────
     evidence_result = await db.execute(
@@ -550,84 +548,193 @@ async def run_engine(
     )
     controls_with_evidence: set[str] = {row[0] for row in evidence_result.all()}
 
-    # ── 6. Evaluate each control ───────────────────────────────────────────────
+    # ── 6. Evaluate each control (in memory, no DB round-trips) ───────────────
+    evaluations = _evaluate_controls(controls, rules_map, control_answers, controls_with_evidence)
+
+    # ── 7. Build output rows (client-generated UUIDs → no flush for PKs) ───────
+    controls_by_id = {c.id: c for c in controls}
+    rows = _build_output_rows(assessment, controls_by_id, evaluations, control_answers, now)
+
     stats = {"Pass": 0, "Partial": 0, "Fail": 0, "Unknown": 0}
-    gap_count = 0
-    risk_count = 0
-    remediation_count = 0
+    for ev in evaluations:
+        stats[ev.status] = stats.get(ev.status, 0) + 1
 
-    for control in controls:
-        rule = rules_map.get(control.id)
-        answer = control_answers.get(control.id)
-        has_evidence = control.id in controls_with_evidence
+    # ── 8. Write outputs: one multi-row INSERT per table ──────────────────────
+    await _bulk_insert(db, ControlResult, rows["control_results"])
+    await _bulk_insert(db, Gap, rows["gaps"])
+    await _bulk_insert(db, Risk, rows["risks"])
+    await _bulk_insert(db, RemediationAction, rows["remediation_actions"])
 
-        status, rationale = _evaluate_control(control, rule, answer, has_evidence)
-        stats[status] = stats.get(status, 0) + 1
+    gap_count = len(rows["gaps"])
+    risk_count = len(rows["risks"])
+    remediation_count = len(rows["remediation_actions"])
 
-        # ── Write ControlResult ────────────────────────────────────────────────
-        cr = ControlResult(
-            tenant_id=assessment.tenant_id,
-            assessment_id=assessment.id,
-            control_id=control.id,
-            status=status,
-            severity=control.severity,
-            rationale=rationale,
-            calculated_at=now,
+    # ── 9. Consistency check (per spec: section 6.3) ──────────────────────────
+    if len(controls) == 0:
+        errors.append("No controls found in controlset_version — engine may have no data.")
+
+    return {
+        "pass": stats.get("Pass", 0),
+        "partial": stats.get("Partial", 0),
+        "fail": stats.get("Fail", 0),
+        "unknown": stats.get("Unknown", 0),
+        "total_controls": len(controls),
+        "gaps": gap_count,
+        "risks": risk_count,
+        "remediations": remediation_count,
+        "errors": errors,
+    }
+
+
+# ── Incremental mode ─────────────────────────────────────────────────────────
+
+# Date-based rules depend on today's date, so their outputs can go stale without
+# any answer/evidence change — they are re-evaluated on every incremental run.
+TIME_BOUND_PATTERNS = {"PATTERN_3_DATE", "PATTERN_6_TIME_BOUND"}
+
+
+async def mark_controls_dirty(
+    db: AsyncSession,
+    tenant_id: str,
+    assessment_id: str,
+    control_ids,
+    reason: str,
+) -> None:
+    """
+    Record that engine outputs for these controls are stale.
+    Called on Answer upsert and EvidenceLink create/delete. Idempotent.
+    """
+    ids = {cid for cid in control_ids if cid}
+    if not ids:
+        return
+    stmt = pg_insert(EngineDirtyControl).values([
+        {
+            "id": gen_uuid(),
+            "tenant_id": tenant_id,
+            "assessment_id": assessment_id,
+            "control_id": cid,
+            "reason": reason,
+        }
+        for cid in ids
+    ]).on_conflict_do_nothing(constraint="uq_engine_dirty_control")
+    await db.execute(stmt)
+
+
+async def run_engine_incremental(
+    assessment: Assessment,
+    db: AsyncSession,
+) -> dict:
+    """
+    Re-evaluates only dirty controls (plus time-bound ones) and rewrites their outputs.
+    Falls back to a full run_engine() when anything structural changed: no previous
+    results, or the set of controls with results differs from the controlset.
+
+    Output rows are identical to a full run (except calculated_at/ids of untouched rows).
+    Returns the same stats dict as run_engine(), plus "mode" and "reevaluated".
+    """
+    now = datetime.now(timezone.utc)
+
+    reference = get_reference_cache()
+    controls = (await reference.controls(db, assessment.controlset_version_id)).controls
+
+    existing_result = await db.execute(
+        select(ControlResult.control_id).where(ControlResult.assessment_id == assessment.id)
+    )
+    existing_ids = [row[0] for row in existing_result.all()]
+
+    # ── Structural change → full run ───────────────────────────────────────────
+    if not controls or len(existing_ids) != len(controls) or set(existing_ids) != {c.id for c in controls}:
+        stats = await run_engine(assessment, db)
+        stats.update({"mode": "full", "reevaluated": stats["total_controls"]})
+        return stats
+
+    rules_map: dict[str, RuleRef] = await reference.rules(db, assessment.ruleset_version_id)
+
+    dirty_result = await db.execute(
+        select(EngineDirtyControl.id, EngineDirtyControl.control_id).where(
+            EngineDirtyControl.assessment_id == assessment.id
         )
-        db.add(cr)
-        await db.flush()  # get cr.id
-
-        # ── Write Gap if status != Pass ────────────────────────────────────────
-        if status != "Pass":
-            template_id = CONTROL_TEMPLATES.get(control.control_code, "TMPL_CLARIFY_UNKNOWN")
-            template = REMEDIATION_TEMPLATES.get(template_id, {})
-
-            gap_desc = _build_gap_description(control, status, answer)
-            gap = Gap(
-                tenant_id=assessment.tenant_id,
-                assessment_id=assessment.id,
-                control_id=control.id,
-                status_source=status,
-                severity=control.severity,
-                description=gap_desc,
-                recommended_remediation=template.get("description", ""),
+    )
+    dirty_rows = dirty_result.all()
+    dirty_ids = {row.control_id for row in dirty_rows}
+    dirty_ids |= {
+        cid for cid, rule in rules_map.items() if rule.pattern in TIME_BOUND_PATTERNS
+    }
+    dirty_controls = [c for c in controls if c.id in dirty_ids]
+
+    if dirty_controls:
+        # ── Load inputs for dirty controls only ────────────────────────────────
+        dirty_questions = {
+            q.id: q.control_id
+            for q in (await reference.questions(db, assessment.framework_id)).for_controls(dirty_ids)
+        }
+        answers_result = await db.execute(
+            select(Answer.question_id, Answer.value).where(
+                Answer.assessment_id == assessment.id,
+                Answer.question_id.in_(list(dirty_questions)),
             )
-            db.add(gap)
-            await db.flush()
-            gap_count += 1
-
-            # ── Write Risk (1:1 with Gap) ──────────────────────────────────────
-            risk = Risk(
-                tenant_id=assessment.tenant_id,
-                assessment_id=assessment.id,
-                gap_id=gap.id,
-                severity=control.severity,
-                description=_build_risk_description(control, status),
-                rationale=rationale,
+        )
+        control_answers: dict[str, dict] = {}
+        for question_id, value in answers_result.all():
+            control_answers[dirty_questions[question_id]] = value
+
+        evidence_result = await db.execute(
+            select(EvidenceLink.control_id).where(
+                EvidenceLink.assessment_id == assessment.id,
+                EvidenceLink.control_id.in_(dirty_ids),
             )
-            db.add(risk)
-            await db.flush()
-            risk_count += 1
-
-            # ── Write RemediationAction ────────────────────────────────────────
-            remediation = RemediationAction(
-                tenant_id=assessment.tenant_id,
-                assessment_id=assessment.id,
-                gap_id=gap.id,
-                priority=_severity_to_priority(control.severity),
-                effort=template.get("effort", _severity_to_effort(control.severity)),
-                remediation_type=template.get("type", "Process"),
-                description=template.get("description", f"Remediate {control.title}"),
-                template_reference=template_id,
+        )
+        controls_with_evidence: set[str] = {row[0] for row in evidence_result.all()}
+
+        # ── Replace outputs of dirty controls ──────────────────────────────────
+        dirty_gap_ids = select(Gap.id).where(
+            Gap.assessment_id == assessment.id,
+            Gap.control_id.in_(dirty_ids),
+        )
+        await db.execute(
+            delete(RemediationAction).where(RemediationAction.gap_id.in_(dirty_gap_ids))
+        )
+        await db.execute(
+            delete(Risk).where(Risk.gap_id.in_(dirty_gap_ids))
+        )
+        await db.execute(
+            delete(Gap).where(Gap.assessment_id == assessment.id, Gap.control_id.in_(dirty_ids))
+        )
+        await db.execute(
+            delete(ControlResult).where(
+                ControlResult.assessment_id == assessment.id,
+                ControlResult.control_id.in_(dirty_ids),
             )
-            db.add(remediation)
-            remediation_count += 1
+        )
 
+        evaluations = _evaluate_controls(dirty_controls, rules_map, control_answers, controls_with_evidence)
+        rows = _build_output_rows(
+            assessment, {c.id: c for c in dirty_controls}, evaluations, control_answers, now
+        )
+        await _bulk_insert(db, ControlResult, rows["control_results"])
+        await _bulk_insert(db, Gap, rows["gaps"])
+        await _bulk_insert(db, Risk, rows["risks"])
+        await _bulk_insert(db, RemediationAction, rows["remediation_actions"])
+
+    # Clear only the markers we consumed (new marks made meanwhile stay dirty)
+    if dirty_rows:
+        await db.execute(
+            delete(EngineDirtyControl).where(
+                EngineDirtyControl.id.in_([row.id for row in dirty_rows])
+            )
+        )
     await db.flush()
 
-    # ── 7. Consistency check (per spec: section 6.3) ──────────────────────────
-    if len(controls) == 0:
-        errors.append("No controls found in controlset_version — engine may have no data.")
+    # ── Stats over the whole assessment (same shape as run_engine) ─────────────
+    status_result = await db.execute(
+        select(ControlResult.status, func.count())
+        .where(ControlResult.assessment_id == assessment.id)
+        .group_by(ControlResult.status)
+    )
+    stats = dict(status_result.all())
+    gap_count = (await db.execute(
+        select(func.count()).select_from(Gap).where(Gap.assessment_id == assessment.id)
+    )).scalar_one()
 
     return {
         "pass": stats.get("Pass", 0),
@@ -635,14 +742,123 @@ async def run_engine(
         "fail": stats.get("Fail", 0),
         "unknown": stats.get("Unknown", 0),
         "total_controls": len(controls),
+        # Risk and RemediationAction are 1:1 with Gap
         "gaps": gap_count,
-        "risks": risk_count,
-        "remediations": remediation_count,
-        "errors": errors,
+        "risks": gap_count,
+        "remediations": gap_count,
+        "errors": [],
+        "mode": "incremental",
+        "reevaluated": len(dirty_controls),
     }
 
 
-def _build_gap_description(control: Control, status: str, answer: Optional[dict]) -> str:
+def _evaluate_controls(
+    controls,
+    rules_map: dict[str, RuleRef],
+    control_answers: dict[str, dict],
+    controls_with_evidence: set[str],
+) -> list[ControlEvaluation]:
+    """Evaluate controls in memory. Pure function of the loaded inputs."""
+    evaluations: list[ControlEvaluation] = []
+    for control in controls:
+        rule = rules_map.get(control.id)
+        answer = control_answers.get(control.id)
+        has_evidence = control.id in controls_with_evidence
+
+        status, rationale = _evaluate_control(control, rule, answer, has_evidence)
+        evaluations.append(ControlEvaluation(
+            control_id=control.id,
+            control_code=control.control_code,
+            status=status,
+            severity=control.severity,
+            rationale=rationale,
+            has_gap=status != "Pass",
+            template_id=CONTROL_TEMPLATES.get(control.control_code, "TMPL_CLARIFY_UNKNOWN"),
+        ))
+    return evaluations
+
+
+def _build_output_rows(
+    assessment: Assessment,
+    controls_by_id: dict[str, ControlRef],
+    evaluations: list[ControlEvaluation],
+    answers_by_control: dict[str, Optional[dict]],
+    now: datetime,
+) -> dict[str, list[dict]]:
+    """
+    Turn evaluations into insert-ready row dicts for all four output tables.
+    Gap ids are generated here so Risk/RemediationAction can reference them
+    without waiting for the database to assign primary keys.
+    """
+    control_results: list[dict] = []
+    gaps: list[dict] = []
+    risks: list[dict] = []
+    remediations: list[dict] = []
+
+    for ev in evaluations:
+        control = controls_by_id[ev.control_id]
+        control_results.append({
+            "id": gen_uuid(),
+            "tenant_id": assessment.tenant_id,
+            "assessment_id": assessment.id,
+            "control_id": control.id,
+            "status": ev.status,
+            "severity": control.severity,
+            "rationale": ev.rationale,
+            "calculated_at": now,
+        })
+        if not ev.has_gap:
+            continue
+
+        template = REMEDIATION_TEMPLATES.get(ev.template_id, {})
+        gap_id = gen_uuid()
+        gaps.append({
+            "id": gap_id,
+            "tenant_id": assessment.tenant_id,
+            "assessment_id": assessment.id,
+            "control_id": control.id,
+            "status_source": ev.status,
+            "severity": control.severity,
+            "description": _build_gap_description(control, ev.status, answers_by_control.get(control.id)),
+            "recommended_remediation": template.get("description", ""),
+        })
+        # Risk is 1:1 with Gap
+        risks.append({
+            "id": gen_uuid(),
+            "tenant_id": assessment.tenant_id,
+            "assessment_id": assessment.id,
+            "gap_id": gap_id,
+            "severity": control.severity,
+            "description": _build_risk_description(control, ev.status),
+            "rationale": ev.rationale,
+        })
+        remediations.append({
+            "id": gen_uuid(),
+            "tenant_id": assessment.tenant_id,
+            "assessment_id": assessment.id,
+            "gap_id": gap_id,
+            "priority": _severity_to_priority(control.severity),
+            "effort": template.get("effort", _severity_to_effort(control.severity)),
+            "remediation_type": template.get("type", "Process"),
+            "description": template.get("description", f"Remediate {control.title}"),
+            "template_reference": ev.template_id,
+        })
+
+    return {
+        "control_results": control_results,
+        "gaps": gaps,
+        "risks": risks,
+        "remediation_actions": remediations,
+    }
+
+
+async def _bulk_insert(db: AsyncSession, model, rows: list[dict]) -> None:
+    """Multi-row INSERT (executemany → insertmanyvalues batches on asyncpg)."""
+    if rows:
+        await db.execute(insert(model), rows)
+
+
+def _build_gap_description(control: ControlRef, status: str, answer: Optional[dict]) -> str:
     choice = (answer or {}).get("choice", "not answered")
     if status == "Fail":
         return (
@@ -665,7 +881,7 @@ def _build_gap_description(control: Control, status: str, answer: Optional[dict]
     return f"{control.title} — gap detected (status: {status})."
 
 
-def _build_risk_description(control: Control, status: str) -> str:
+def _build_risk_description(control: ControlRef, status: str) -> str:
     if status == "Fail":
         return (
             f"Risk: {control.title} is not implemented. "
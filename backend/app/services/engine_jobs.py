@@ -0,0 +1,50 @@
+"""
+Engine run as a background job (job_type "engine_run").
+POST /engine/run enqueues; a job worker executes run_engine() and records the outcome
+on the job row (status/result/error) plus the engine_run_* audit events.
+"""
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.models import Assessment, BackgroundJob
+from app.services.audit import log_event
+from app.services.engine import run_engine
+from app.services.job_queue import register_job_handler, PermanentJobError
+
+ENGINE_RUN_JOB = "engine_run"
+
+
+async def _on_engine_run_failed(job: BackgroundJob, db: AsyncSession, error: str) -> None:
+    await log_event(
+        db, "engine_run_failed",
+        tenant_id=job.tenant_id, user_id=job.requested_by_user_id,
+        entity_type="assessment", entity_id=job.entity_id,
+        payload={"run_id": job.id, "attempts": job.attempts, "error": error},
+    )
+
+
+@register_job_handler(ENGINE_RUN_JOB, on_failure=_on_engine_run_failed)
+async def execute_engine_run(job: BackgroundJob, db: AsyncSession) -> dict:
+    assessment = await db.get(Assessment, job.entity_id)
+    if assessment is None or assessment.tenant_id != job.tenant_id:
+        raise PermanentJobError("Assessment not found")
+    if assessment.status != "submitted":
+        raise PermanentJobError(
+            f"Assessment must be 'submitted' before running the engine. Current: '{assessment.status}'"
+        )
+
+    stats = await run_engine(assessment, db)
+
+    await log_event(
+        db, "engine_run_completed",
+        tenant_id=job.tenant_id, user_id=job.requested_by_user_id,
+        entity_type="assessment", entity_id=assessment.id,
+        payload={
+            "run_id": job.id,
+            "pass": stats["pass"],
+            "fail": stats["fail"],
+            "partial": stats["partial"],
+            "unknown": stats["unknown"],
+            "gaps": stats["gaps"],
+        },
+    )
+    return stats
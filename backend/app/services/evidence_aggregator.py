@@ -8,15 +8,49 @@ Evidence Aggregator
   weak        — только weak, нет validated
   insufficient — есть mismatch или все unreadable
   missing     — нет ни одного EvidenceAssessmentResult
+
+Инкрементально: apply_result_deltas() добавляет новые результаты к счётчикам своих контролов
+(по статусам, сумма/число strength) одним INSERT … ON CONFLICT DO UPDATE; статус, score и
+avg_strength выводятся из счётчиков в том же запросе. recompute_control_aggregates() —
+полный пересчёт (ремонт после удаления файлов, POST recompute); агрегаты контролов
+без результатов удаляются.
 """
 from datetime import datetime, timezone
 from typing import Optional
 
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, delete, case, cast, func, literal_column, Float, Numeric
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.models.ai_evidence import EvidenceAssessmentResult, ControlEvidenceAggregate
 
+SCORE_MAP = {
+    "strong": 100,
+    "adequate": 75,
+    "weak": 40,
+    "insufficient": 10,
+    "missing": 0,
+}
+MAX_FINDINGS = 10
+_COUNTED_STATUSES = ("validated", "weak", "mismatch", "unreadable")
+
+
+def aggregate_status(statuses: list[str], avg_strength: float) -> str:
+    """Агрегированный статус контрола по статусам его результатов."""
+    if not statuses:
+        return "missing"
+    if "mismatch" in statuses:
+        return "insufficient"
+    if all(s == "unreadable" for s in statuses):
+        return "insufficient"
+    if all(s == "validated" for s in statuses) and avg_strength >= 0.7:
+        return "strong"
+    if any(s == "validated" for s in statuses):
+        return "adequate"
+    if all(s == "weak" for s in statuses):
+        return "weak"
+    return "insufficient"
+
 
 async def recompute_control_aggregates(
     assessment_id: str,
@@ -28,113 +62,183 @@ async def recompute_control_aggregates(
     Пересчитывает агрегаты по контролам.
     Если control_id передан — пересчитывает только его (быстрый путь после analyze).
     Если None — пересчитывает все контролы assessment'а.
+    Один SELECT по результатам, один проход в памяти и один
+    INSERT … ON CONFLICT (assessment_id, control_id) DO UPDATE для всех контролов.
+    Не коммитит — транзакцией управляет вызывающий код.
     """
-    query = select(EvidenceAssessmentResult).where(
+    query = select(
+        EvidenceAssessmentResult.id,
+        EvidenceAssessmentResult.control_id,
+        EvidenceAssessmentResult.status,
+        EvidenceAssessmentResult.overall_strength,
+        EvidenceAssessmentResult.result_payload["findings"],
+    ).where(
         EvidenceAssessmentResult.assessment_id == assessment_id,
         EvidenceAssessmentResult.tenant_id == tenant_id,
-    )
+    ).order_by(EvidenceAssessmentResult.created_at, EvidenceAssessmentResult.id)
     if control_id:
         query = query.where(EvidenceAssessmentResult.control_id == control_id)
 
-    result = await db.execute(query)
-    all_results = result.scalars().all()
+    # Группируем по control_id за один проход
+    by_control: dict[str, dict] = {}
+    for rid, cid, status, strength, findings in (await db.execute(query)).all():
+        acc = by_control.setdefault(str(cid), {"statuses": [], "strengths": [], "findings": [], "ids": []})
+        acc["statuses"].append(status)
+        acc["ids"].append(str(rid))
+        if strength is not None:
+            acc["strengths"].append(strength)
+        if isinstance(findings, list) and len(acc["findings"]) < MAX_FINDINGS:
+            acc["findings"].extend(str(f) for f in findings[:MAX_FINDINGS - len(acc["findings"])])
 
-    # Группируем по control_id
-    by_control: dict[str, list[EvidenceAssessmentResult]] = {}
-    for r in all_results:
-        cid = str(r.control_id)
-        by_control.setdefault(cid, []).append(r)
+    # Агрегаты контролов без оставшихся результатов (удалённые файлы) удаляются — статус "missing"
+    stale = delete(ControlEvidenceAggregate).where(
+        ControlEvidenceAggregate.assessment_id == assessment_id,
+        ControlEvidenceAggregate.tenant_id == tenant_id,
+    )
+    if control_id:
+        stale = stale.where(ControlEvidenceAggregate.control_id == control_id)
+    if by_control:
+        stale = stale.where(ControlEvidenceAggregate.control_id.not_in(list(by_control)))
+    await db.execute(stale)
 
-    aggregates: list[ControlEvidenceAggregate] = []
+    if not by_control:
+        return []
 
-    for cid, ctrl_results in by_control.items():
-        statuses = [r.status for r in ctrl_results]
-        strengths = [
-            r.overall_strength
-            for r in ctrl_results
-            if r.overall_strength is not None
-        ]
+    now = datetime.now(timezone.utc)
+    rows = []
+    for cid, acc in by_control.items():
+        strengths = acc["strengths"]
         avg_strength = round(sum(strengths) / len(strengths), 3) if strengths else 0.0
-        evidence_count = len(ctrl_results)
-
-        # Собираем findings из result_payload
-        all_findings: list[str] = []
-        analysis_ids: list[str] = []
-        for r in ctrl_results:
-            analysis_ids.append(str(r.id))
-            if r.result_payload and isinstance(r.result_payload, dict):
-                findings = r.result_payload.get("findings", [])
-                if isinstance(findings, list):
-                    all_findings.extend(str(f) for f in findings)
-
-        # Логика агрегированного статуса
-        if not ctrl_results:
-            agg_status = "missing"
-        elif "mismatch" in statuses:
-            agg_status = "insufficient"
-        elif all(s == "unreadable" for s in statuses):
-            agg_status = "insufficient"
-        elif all(s == "validated" for s in statuses) and avg_strength >= 0.7:
-            agg_status = "strong"
-        elif any(s == "validated" for s in statuses) and avg_strength >= 0.5:
-            agg_status = "adequate"
-        elif any(s == "validated" for s in statuses):
-            agg_status = "adequate"
-        elif all(s == "weak" for s in statuses):
-            agg_status = "weak"
-        else:
-            agg_status = "insufficient"
-
-        # score 0–100
-        score_map = {
-            "strong": 100,
-            "adequate": 75,
-            "weak": 40,
-            "insufficient": 10,
-            "missing": 0,
-        }
-        score = float(score_map.get(agg_status, 0))
-
-        # Upsert
-        existing_row = (
-            await db.execute(
-                select(ControlEvidenceAggregate).where(
-                    ControlEvidenceAggregate.assessment_id == assessment_id,
-                    ControlEvidenceAggregate.control_id == cid,
-                )
-            )
-        ).scalar_one_or_none()
-
-        now = datetime.now(timezone.utc)
-
-        if existing_row:
-            existing_row.status = agg_status
-            existing_row.score = score
-            existing_row.evidence_count = evidence_count
-            existing_row.avg_strength = avg_strength
-            existing_row.findings_summary = all_findings[:10]
-            existing_row.analysis_ids_used = analysis_ids
-            existing_row.updated_at = now
-            aggregates.append(existing_row)
-        else:
-            new_agg = ControlEvidenceAggregate(
-                tenant_id=tenant_id,
-                assessment_id=assessment_id,
-                control_id=cid,
-                status=agg_status,
-                score=score,
-                evidence_count=evidence_count,
-                avg_strength=avg_strength,
-                findings_summary=all_findings[:10],
-                analysis_ids_used=analysis_ids,
-                updated_at=now,
+        agg_status = aggregate_status(acc["statuses"], avg_strength)
+        rows.append({
+            "tenant_id": tenant_id,
+            "assessment_id": assessment_id,
+            "control_id": cid,
+            "status": agg_status,
+            "score": float(SCORE_MAP.get(agg_status, 0)),
+            "evidence_count": len(acc["statuses"]),
+            "avg_strength": avg_strength,
+            "findings_summary": acc["findings"],
+            "analysis_ids_used": acc["ids"],
+            **{f"{st}_count": acc["statuses"].count(st) for st in _COUNTED_STATUSES},
+            "strength_sum": float(sum(strengths)),
+            "strength_count": len(strengths),
+            "updated_at": now,
+        })
+
+    stmt = pg_insert(ControlEvidenceAggregate).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        constraint="uq_control_evidence_aggregate",
+        set_={
+            col: stmt.excluded[col]
+            for col in (
+                "status", "score", "evidence_count", "avg_strength", "findings_summary", "analysis_ids_used",
+                *(f"{st}_count" for st in _COUNTED_STATUSES), "strength_sum", "strength_count", "updated_at",
             )
-            db.add(new_agg)
-            await db.flush()
-            aggregates.append(new_agg)
+        },
+    ).returning(ControlEvidenceAggregate)
+    result = await db.execute(stmt, execution_options={"populate_existing": True})
+    return list(result.scalars().all())
+
+
+def _status_rules(evidence_count, validated, weak, mismatch, unreadable, avg_strength) -> list[tuple]:
+    """aggregate_status() as SQL conditions over (new) counter expressions, in the same order."""
+    return [
+        (mismatch > 0, "insufficient"),
+        (unreadable == evidence_count, "insufficient"),
+        ((validated == evidence_count) & (avg_strength >= 0.7), "strong"),
+        (validated > 0, "adequate"),
+        (weak == evidence_count, "weak"),
+    ]
 
-    await db.commit()
-    return aggregates
+
+async def apply_result_deltas(
+    db: AsyncSession,
+    results: list[EvidenceAssessmentResult],
+) -> None:
+    """
+    Добавляет новые (уже flushed) EvidenceAssessmentResult к агрегатам их контролов.
+    Один INSERT … ON CONFLICT DO UPDATE на пачку: счётчики увеличиваются на дельту, статус,
+    score и avg_strength пересчитываются из новых счётчиков, findings/analysis_ids дописываются.
+    Не коммитит.
+    """
+    deltas: dict[tuple[str, str], dict] = {}
+    for r in results:
+        key = (str(r.assessment_id), str(r.control_id))
+        d = deltas.get(key)
+        if d is None:
+            d = deltas[key] = {
+                "tenant_id": str(r.tenant_id),
+                "assessment_id": key[0],
+                "control_id": key[1],
+                "evidence_count": 0,
+                **{f"{st}_count": 0 for st in _COUNTED_STATUSES},
+                "strength_sum": 0.0,
+                "strength_count": 0,
+                "findings_summary": [],
+                "analysis_ids_used": [],
+            }
+        d["evidence_count"] += 1
+        if r.status in _COUNTED_STATUSES:
+            d[f"{r.status}_count"] += 1
+        if r.overall_strength is not None:
+            d["strength_sum"] += r.overall_strength
+            d["strength_count"] += 1
+        findings = (r.result_payload or {}).get("findings") if isinstance(r.result_payload, dict) else None
+        if isinstance(findings, list) and len(d["findings_summary"]) < MAX_FINDINGS:
+            d["findings_summary"].extend(str(f) for f in findings[:MAX_FINDINGS - len(d["findings_summary"])])
+        d["analysis_ids_used"].append(str(r.id))
+    if not deltas:
+        return
+
+    # Values of a fresh row (no conflict): status/score/avg from the delta itself
+    now = datetime.now(timezone.utc)
+    rows = []
+    for d in deltas.values():
+        avg = round(d["strength_sum"] / d["strength_count"], 3) if d["strength_count"] else 0.0
+        statuses = [st for st in _COUNTED_STATUSES for _ in range(d[f"{st}_count"])]
+        statuses += ["other"] * (d["evidence_count"] - len(statuses))
+        agg_status = aggregate_status(statuses, avg)
+        rows.append({
+            **d, "status": agg_status, "score": float(SCORE_MAP[agg_status]), "avg_strength": avg, "updated_at": now,
+        })
+
+    table = ControlEvidenceAggregate.__table__
+    stmt = pg_insert(ControlEvidenceAggregate).values(rows)
+    ex = stmt.excluded
+    new = {
+        col: table.c[col] + ex[col]
+        for col in ("evidence_count", *(f"{st}_count" for st in _COUNTED_STATUSES), "strength_sum", "strength_count")
+    }
+    new_avg = case(
+        (new["strength_count"] > 0,
+         cast(func.round(cast(new["strength_sum"] / new["strength_count"], Numeric), 3), Float)),
+        else_=0.0,
+    )
+    rules = _status_rules(
+        new["evidence_count"], new["validated_count"], new["weak_count"],
+        new["mismatch_count"], new["unreadable_count"], new_avg,
+    )
+    findings = literal_column(
+        "(SELECT coalesce(jsonb_agg(f.e ORDER BY f.i), '[]'::jsonb) FROM jsonb_array_elements("
+        "coalesce(control_evidence_aggregates.findings_summary, '[]'::jsonb) || excluded.findings_summary"
+        f") WITH ORDINALITY AS f(e, i) WHERE f.i <= {MAX_FINDINGS})"
+    )
+    await db.execute(
+        stmt.on_conflict_do_update(
+            constraint="uq_control_evidence_aggregate",
+            set_={
+                **new,
+                "avg_strength": new_avg,
+                "status": case(*rules, else_="insufficient"),
+                "score": case(*((cond, float(SCORE_MAP[st])) for cond, st in rules), else_=float(SCORE_MAP["insufficient"])),
+                "findings_summary": findings,
+                "analysis_ids_used": func.coalesce(table.c.analysis_ids_used, literal_column("'[]'::jsonb"))
+                .op("||")(ex.analysis_ids_used),
+                "updated_at": ex.updated_at,
+            },
+        )
+    )
 
 
 async def get_aggregates_dict(
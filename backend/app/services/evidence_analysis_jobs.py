@@ -0,0 +1,203 @@
+"""
+Batch evidence analysis as a background job (job_type "evidence_analyze").
+POST /assessments/{id}/evidence/analyze enqueues; a job worker analyzes every extracted
+evidence file against each control it is linked to — concurrently, through the analyst
+scheduler — stores one EvidenceAssessmentResult per pair and adds them to the control aggregates.
+Pairs with a cached result (services/analysis_cache.py) do not call the model; the remaining
+pairs on the same document go out as multi-control calls (claude_analyst.analyze_evidence_multi).
+
+Progress (background_jobs.progress): {"total": pairs to analyze, "done": k, "cached": hits, "requests": model calls}.
+"""
+import asyncio
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.models import Assessment, BackgroundJob, Control, EvidenceLink
+from app.models.ai_evidence import EvidenceExtraction, EvidenceAssessmentResult, ControlExpectationSpec
+from app.services.audit import log_event
+from app.services.analysis_cache import analysis_cache_entry, get_cached_analyses, store_analyses
+from app.services.claude_analyst import PROMPT_VERSION, analyze_evidence_multi
+from app.services.evidence_aggregator import apply_result_deltas
+from app.services.job_queue import register_job_handler, set_job_progress, PermanentJobError
+
+EVIDENCE_ANALYZE_JOB = "evidence_analyze"
+
+
+async def _on_evidence_analysis_failed(job: BackgroundJob, db: AsyncSession, error: str) -> None:
+    await log_event(
+        db, "evidence_analysis_failed",
+        tenant_id=job.tenant_id, user_id=job.requested_by_user_id,
+        entity_type="assessment", entity_id=job.entity_id,
+        payload={"job_id": job.id, "attempts": job.attempts, "error": error},
+    )
+
+
+@register_job_handler(EVIDENCE_ANALYZE_JOB, on_failure=_on_evidence_analysis_failed)
+async def execute_evidence_analysis(job: BackgroundJob, db: AsyncSession) -> dict:
+    options = job.payload or {}
+    assessment = await db.get(Assessment, job.entity_id)
+    if assessment is None or assessment.tenant_id != job.tenant_id:
+        raise PermanentJobError("Assessment not found")
+    if not settings.CLAUDE_ANALYST_ENABLED or not settings.ANTHROPIC_API_KEY:
+        raise PermanentJobError("AI analyst is disabled or not configured.")
+
+    # Latest successful extraction per evidence file (ascending order: last one wins)
+    extractions = {
+        ext.evidence_file_id: ext
+        for ext in (
+            await db.execute(
+                select(EvidenceExtraction)
+                .where(
+                    EvidenceExtraction.assessment_id == assessment.id,
+                    EvidenceExtraction.tenant_id == job.tenant_id,
+                    EvidenceExtraction.status == "extracted",
+                )
+                .order_by(EvidenceExtraction.updated_at)
+            )
+        ).scalars().all()
+    }
+    pairs = {
+        (file_id, control_id)
+        for file_id, control_id in (
+            await db.execute(
+                select(EvidenceLink.evidence_file_id, EvidenceLink.control_id).where(
+                    EvidenceLink.assessment_id == assessment.id,
+                    EvidenceLink.tenant_id == job.tenant_id,
+                    EvidenceLink.control_id.is_not(None),
+                )
+            )
+        ).all()
+        if file_id in extractions
+    }
+    total_linked = len(pairs)
+    if not options.get("force_reanalyze"):
+        pairs -= set(
+            (
+                await db.execute(
+                    select(EvidenceAssessmentResult.evidence_file_id, EvidenceAssessmentResult.control_id).where(
+                        EvidenceAssessmentResult.assessment_id == assessment.id,
+                        EvidenceAssessmentResult.prompt_version == PROMPT_VERSION,
+                        EvidenceAssessmentResult.model == settings.LLM_MODEL,
+                    )
+                )
+            ).all()
+        )
+    pairs = sorted(pairs)
+
+    control_ids = {control_id for _, control_id in pairs}
+    controls_by_id = {
+        c.id: c
+        for c in (await db.execute(select(Control).where(Control.id.in_(control_ids)))).scalars().all()
+    } if control_ids else {}
+    guidance: dict[str, str] = {}
+    if control_ids:
+        for spec in (
+            await db.execute(select(ControlExpectationSpec).where(ControlExpectationSpec.control_id.in_(control_ids)))
+        ).scalars().all():
+            guidance.setdefault(spec.control_id, spec.guidance_text or "")
+    pairs = [(f, c) for f, c in pairs if c in controls_by_id]
+
+    # Cache lookup per pair; misses are deduplicated (same text + control + guidance → one call)
+    entries = {}
+    for file_id, control_id in pairs:
+        control = controls_by_id[control_id]
+        entries[(file_id, control_id)] = analysis_cache_entry(
+            job.tenant_id,
+            (extractions[file_id].result or {}).get("extracted_text") or "",
+            (control.hipaa_control_id or control.id)[:64],
+            guidance.get(control_id) or None,
+        )
+    cached = {} if options.get("force_reanalyze") else await get_cached_analyses(
+        db, (e["cache_key"] for e in entries.values())
+    )
+    misses: dict[str, tuple[str, str]] = {}
+    for pair, entry in entries.items():
+        if entry["cache_key"] not in cached:
+            misses.setdefault(entry["cache_key"], pair)
+
+    # Misses on the same document text go out together: one call per document and up to
+    # CLAUDE_ANALYST_MAX_CONTROLS_PER_CALL controls instead of one call per pair
+    by_document: dict[str, list[str]] = {}
+    for key, pair in misses.items():
+        by_document.setdefault(entries[pair]["text_sha256"], []).append(key)
+    size = max(1, settings.CLAUDE_ANALYST_MAX_CONTROLS_PER_CALL)
+    chunks = [keys[i:i + size] for keys in by_document.values() for i in range(0, len(keys), size)]
+
+    await set_job_progress(job.id, {
+        "total": len(misses), "done": 0, "cached": len(pairs) - len(misses), "requests": len(chunks),
+    })
+    done = 0
+
+    async def _analyze(keys: list[str]) -> list[tuple[dict, bool]]:
+        nonlocal done
+        controls = []
+        for key in keys:
+            control_id = misses[key][1]
+            control = controls_by_id[control_id]
+            controls.append({
+                "control_code": (control.hipaa_control_id or control.id)[:64],
+                "control_title": (control.title or "")[:256],
+                "expectation_guidance": guidance.get(control_id) or None,
+            })
+        out = await analyze_evidence_multi(
+            (extractions[misses[keys[0]][0]].result or {}).get("extracted_text") or "",
+            controls,
+        )
+        done += len(keys)
+        await set_job_progress(job.id, {"done": done})
+        return out
+
+    # LLM calls run concurrently (no DB access); results are persisted on this session afterwards
+    fresh = {
+        key: out
+        for keys, outs in zip(chunks, await asyncio.gather(*(_analyze(keys) for keys in chunks)))
+        for key, out in zip(keys, outs)
+    }
+    await store_analyses(db, [
+        (entries[misses[key]], result) for key, (result, from_model) in fresh.items() if from_model
+    ])
+    results = [
+        cached.get(entries[pair]["cache_key"]) or fresh[entries[pair]["cache_key"]][0]
+        for pair in pairs
+    ]
+
+    added = []
+    for (file_id, control_id), result in zip(pairs, results):
+        added.append(EvidenceAssessmentResult(
+            tenant_id=job.tenant_id,
+            assessment_id=assessment.id,
+            control_id=control_id,
+            evidence_file_id=file_id,
+            extraction_id=extractions[file_id].id,
+            provider="anthropic",
+            model=settings.LLM_MODEL,
+            prompt_version=PROMPT_VERSION,
+            status=result["status"],
+            overall_strength=result.get("overall_strength"),
+            confidence=result.get("confidence"),
+            result_payload=result,
+        ))
+    db.add_all(added)
+    await db.flush()
+    await apply_result_deltas(db, added)
+
+    stats = {
+        "linked_pairs": total_linked,
+        "analyzed": len(pairs),
+        "skipped": total_linked - len(pairs),
+        "model_calls": len(chunks),
+        "analyzed_by_model": len(misses),
+        "by_status": {
+            status: sum(1 for r in results if r["status"] == status)
+            for status in sorted({r["status"] for r in results})
+        },
+    }
+    await log_event(
+        db, "evidence_analysis_completed",
+        tenant_id=job.tenant_id, user_id=job.requested_by_user_id,
+        entity_type="assessment", entity_id=assessment.id,
+        payload={"job_id": job.id, **stats},
+    )
+    return stats
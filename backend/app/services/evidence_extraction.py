@@ -2,17 +2,28 @@
 Evidence text extraction for AI Evidence (Next Layer).
 Extracts text from PDF, DOCX, XLSX; stores result in EvidenceExtraction.
 State: extract_pending → extracting → extracted | extract_failed.
+Rows are drained by the extraction workers (extraction_worker.py); parsing runs in a
+short-lived child process with a timeout and a memory limit (parse_isolated).
+Output is stored once per (tenant, file sha256) and shared by every assessment using the file.
 """
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import io
+import multiprocessing
+import os
+from datetime import date, datetime, time as dt_time
 from typing import Optional
 
-from sqlalchemy import select
+from sqlalchemy import select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.db import loaders
 from app.models.models import EvidenceFile
-from app.models.ai_evidence import EvidenceExtraction
+from app.core.config import settings
+from app.models.ai_evidence import EvidenceExtraction, EvidenceContentExtraction
 from app.services import storage
 
 
@@ -24,62 +35,409 @@ PNG_CT = "image/png"
 JPEG_CT = "image/jpeg"
 
 
-def _extract_pdf(data: bytes) -> dict:
-    from pypdf import PdfReader
-    reader = PdfReader(io.BytesIO(data))
-    parts = []
-    for page in reader.pages:
-        text = page.extract_text()
+# ── PDF ───────────────────────────────────────────────────────────────────────
+# Pages are extracted lazily and extraction stops once EXTRACTION_CHAR_BUDGET characters
+# are collected — the analyst only reads the beginning of the text, a 300-page binder does not
+# need every page parsed. page_count comes from the page tree, not from extracting pages.
+# With EXTRACTION_PDF_SAMPLE_SECTIONS the budget is split between the beginning, middle and end
+# of long documents (gaps are marked in the text). Pages without a text layer (scans) are
+# OCR'd when local OCR is enabled, at most EXTRACTION_OCR_MAX_PDF_PAGES per document.
+
+def _iter_pdf_pages(reader, indices, ocr: Optional[dict] = None):
+    """
+    Yield (page_index, text) for the given page indices, one page at a time.
+    ocr: {"remaining": pages left to OCR, "pages": pages OCR'd} or None (no OCR).
+    """
+    for i in indices:
+        page = reader.pages[i]
+        text = (page.extract_text() or "").strip()
+        if not text and ocr is not None and ocr["remaining"] > 0:
+            ocr["remaining"] -= 1
+            ocr["pages"] += 1
+            text = _ocr_pdf_page(page)
         if text:
+            yield i, text
+
+
+def _take_pages(reader, indices, budget: int, ocr: Optional[dict] = None) -> tuple[list[tuple[int, str]], bool]:
+    """Pages from indices until budget characters are collected. Returns (pages, budget_reached)."""
+    taken, used = [], 0
+    for i, text in _iter_pdf_pages(reader, indices, ocr):
+        if used + len(text) >= budget:
+            taken.append((i, text[:budget - used]))
+            return taken, True
+        taken.append((i, text))
+        used += len(text) + 2
+    return taken, False
+
+
+def _join_pdf_sections(sections: list[list[tuple[int, str]]]) -> str:
+    parts, last = [], -1
+    for pages in sections:
+        for i, text in pages:
+            if last >= 0 and i > last + 1:
+                parts.append(f"[… pages {last + 2}–{i} omitted …]")
             parts.append(text)
-    full = "\n\n".join(parts).strip()
-    return {
+            last = i
+    return "\n\n".join(parts).strip()
+
+
+def _extract_pdf(data: bytes, char_budget: Optional[int] = None, sample_sections: Optional[bool] = None) -> dict:
+    from pypdf import PdfReader
+    budget = settings.EXTRACTION_CHAR_BUDGET if char_budget is None else char_budget
+    sample = settings.EXTRACTION_PDF_SAMPLE_SECTIONS if sample_sections is None else sample_sections
+    reader = PdfReader(io.BytesIO(data))
+    page_count = len(reader.pages)
+    ocr = (
+        {"remaining": settings.EXTRACTION_OCR_MAX_PDF_PAGES, "pages": 0}
+        if settings.EXTRACTION_OCR_MAX_PDF_PAGES > 0 and _ocr_available() else None
+    )
+
+    if budget <= 0:
+        sections = [list(_iter_pdf_pages(reader, range(page_count), ocr))]
+        truncated = False
+    elif not sample or page_count < 3:
+        pages, truncated = _take_pages(reader, range(page_count), budget, ocr)
+        sections = [pages]
+    else:
+        # Beginning gets half the budget, middle and end a quarter each; sections never overlap
+        mid = page_count // 2
+        head, head_cut = _take_pages(reader, range(0, mid), budget // 2, ocr)
+        head_end = head[-1][0] + 1 if head else 0
+        tail, tail_cut = _take_pages(reader, range(page_count - 1, max(mid, head_end) - 1, -1), budget // 4, ocr)
+        tail.reverse()
+        tail_start = tail[0][0] if tail else page_count
+        middle, mid_cut = _take_pages(reader, range(max(mid, head_end), tail_start), budget - budget // 2 - budget // 4, ocr)
+        sections = [head, middle, tail]
+        truncated = head_cut or mid_cut or tail_cut
+
+    extracted = [i for pages in sections for i, _ in pages]
+    full = _join_pdf_sections(sections)
+    result = {
         "extracted_text": full,
         "has_text": bool(full),
         "has_tables": False,
-        "page_count": len(reader.pages),
+        "page_count": page_count,
+        "pages_extracted": len(extracted),
+        "truncated": truncated,
     }
+    if ocr is not None and ocr["pages"]:
+        result["ocr_pages"] = ocr["pages"]
+    if truncated:
+        result["char_budget"] = budget
+        result["sampled"] = bool(sample and page_count >= 3)
+    return result
+
+
+# ── Tables (DOCX / XLSX) ──────────────────────────────────────────────────────
+# Tables become compact TSV blocks: at most EXTRACTION_TABLE_MAX_ROWS non-empty rows and
+# EXTRACTION_TABLE_MAX_COLS columns each. Remaining rows are still streamed (one row in memory
+# at a time) to count them and summarize each column — values, numeric / date ranges — so a
+# 100k-row access log export becomes its first rows plus one summary line.
+
+_MAX_CELL_CHARS = 200
+
+
+def _cell_text(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    if isinstance(value, datetime):
+        return value.date().isoformat() if value.time() == dt_time() else value.isoformat(sep=" ")
+    if isinstance(value, date):
+        return value.isoformat()
+    text = " ".join(str(value).split())
+    return text if len(text) <= _MAX_CELL_CHARS else text[:_MAX_CELL_CHARS - 1] + "…"
+
+
+class _ColumnStats:
+    __slots__ = ("values", "low", "high")
+
+    def __init__(self):
+        self.values = 0
+        self.low = self.high = None
+
+    def add(self, value) -> None:
+        if value is None or value == "":
+            return
+        self.values += 1
+        if isinstance(value, (int, float, date)) and not isinstance(value, bool):
+            try:
+                if self.low is None or value < self.low:
+                    self.low = value
+                if self.high is None or value > self.high:
+                    self.high = value
+            except TypeError:
+                pass  # mixed numbers and dates in one column: keep the first kind's range
 
+    def describe(self, name: str) -> str:
+        text = f"{name or '?'}: {self.values} values"
+        if self.low is not None:
+            text += f", {_cell_text(self.low)} – {_cell_text(self.high)}"
+        return text
 
-def _extract_docx(data: bytes) -> dict:
+
+def _tsv_block(title: str, rows, max_rows: int, max_cols: int, char_limit: int) -> tuple[str, dict]:
+    """
+    TSV text for one table from an iterable of row value sequences (consumed lazily).
+    char_limit <= 0 means no character limit. Returns (text, stats).
+    """
+    lines: list[str] = []
+    used = 0
+    header: Optional[list[str]] = None
+    columns: list[_ColumnStats] = []
+    total = width = 0
+    for row in rows:
+        cells = list(row)
+        while cells and (cells[-1] is None or cells[-1] == ""):
+            cells.pop()
+        if not cells:
+            continue
+        total += 1
+        width = max(width, len(cells))
+        cells = cells[:max_cols]
+        if header is None:
+            header = [_cell_text(c) for c in cells]
+        else:
+            while len(columns) < len(cells):
+                columns.append(_ColumnStats())
+            for stat, value in zip(columns, cells):
+                stat.add(value)
+        if len(lines) < max_rows and (char_limit <= 0 or used < char_limit):
+            line = "\t".join(_cell_text(c) for c in cells)
+            lines.append(line)
+            used += len(line) + 1
+
+    shown = len(lines)
+    parts = [f"[{title}: {total} rows × {width} columns]"] + lines
+    if shown < total or width > max_cols:
+        summary = f"[… {total - shown} more rows not shown"
+        if width > max_cols:
+            summary += f"; columns after {max_cols} omitted"
+        if columns:
+            names = (header or []) + [""] * len(columns)
+            summary += "; " + "; ".join(stat.describe(names[i]) for i, stat in enumerate(columns))
+        parts.append(summary + "]")
+    return "\n".join(parts), {
+        "title": title, "rows": total, "columns": width, "rows_included": shown,
+        "truncated": shown < total or width > max_cols,
+    }
+
+
+def _docx_blocks(doc):
+    """Paragraphs and tables in document order."""
+    from docx.table import Table
+    from docx.text.paragraph import Paragraph
+    for child in doc.element.body.iterchildren():
+        tag = child.tag.rsplit("}", 1)[-1]
+        if tag == "p":
+            yield "p", Paragraph(child, doc)
+        elif tag == "tbl":
+            yield "tbl", Table(child, doc)
+
+
+def _docx_table_rows(table):
+    for row in table.rows:
+        cells, last = [], None
+        for cell in row.cells:
+            # Merged cells repeat the same <w:tc> across the span; emit it once
+            if cell._tc is last:
+                continue
+            last = cell._tc
+            cells.append(cell.text)
+        yield cells
+
+
+def _extract_docx(data: bytes, char_budget: Optional[int] = None) -> dict:
     from docx import Document
+    budget = settings.EXTRACTION_CHAR_BUDGET if char_budget is None else char_budget
     doc = Document(io.BytesIO(data))
-    parts = [p.text for p in doc.paragraphs if p.text.strip()]
+    parts: list[str] = []
+    used = 0
+    tables: list[dict] = []
+    truncated = False
+    for kind, block in _docx_blocks(doc):
+        if budget > 0 and used >= budget:
+            truncated = True
+            break
+        if kind == "tbl":
+            text, stats = _tsv_block(
+                f"Table {len(tables) + 1}", _docx_table_rows(block),
+                settings.EXTRACTION_TABLE_MAX_ROWS, settings.EXTRACTION_TABLE_MAX_COLS,
+                budget - used if budget > 0 else 0,
+            )
+            tables.append(stats)
+        else:
+            text = block.text.strip()
+            if not text:
+                continue
+            if budget > 0 and used + len(text) > budget:
+                text = text[:budget - used]
+                truncated = True
+        parts.append(text)
+        used += len(text) + 2
     full = "\n\n".join(parts).strip()
-    tables = list(doc.tables)
-    return {
+    result = {
         "extracted_text": full,
-        "has_text": bool(full) or bool(tables),
+        "has_text": bool(full),
         "has_tables": len(tables) > 0,
         "table_count": len(tables),
+        "tables": tables,
+        "truncated": truncated or any(t["truncated"] for t in tables),
     }
+    if truncated:
+        result["char_budget"] = budget
+    return result
 
 
-def _extract_xlsx(data: bytes) -> dict:
+def _extract_xlsx(data: bytes, char_budget: Optional[int] = None) -> dict:
     from openpyxl import load_workbook
+    budget = settings.EXTRACTION_CHAR_BUDGET if char_budget is None else char_budget
     wb = load_workbook(io.BytesIO(data), read_only=True, data_only=True)
-    parts = []
-    for sheet in wb.worksheets:
-        for row in sheet.iter_rows(values_only=True):
-            line = "\t".join(str(c) if c is not None else "" for c in row).strip()
-            if line:
-                parts.append(line)
-    full = "\n".join(parts).strip()
-    wb.close()
+    parts: list[str] = []
+    used = 0
+    sheets: list[dict] = []
+    try:
+        for sheet in wb.worksheets:
+            # Once the budget is spent, later sheets contribute only their header and summary line
+            spent = budget > 0 and used >= budget
+            text, stats = _tsv_block(
+                f"Sheet {sheet.title}",
+                sheet.iter_rows(values_only=True),
+                0 if spent else settings.EXTRACTION_TABLE_MAX_ROWS,
+                settings.EXTRACTION_TABLE_MAX_COLS,
+                budget - used if budget > 0 else 0,
+            )
+            if stats["rows"]:
+                parts.append(text)
+                used += len(text) + 2
+                sheets.append(stats)
+    finally:
+        wb.close()
+    full = "\n\n".join(parts).strip()
     return {
         "extracted_text": full,
         "has_text": bool(full),
-        "has_tables": True,
+        "has_tables": bool(sheets),
+        "table_count": len(sheets),
+        "tables": sheets,
+        "truncated": any(t["truncated"] for t in sheets),
     }
 
 
-def _extract_image(_data: bytes) -> dict:
-    # No OCR in MVP; placeholder for future Tesseract/cloud OCR
+# ── Images (local OCR) ────────────────────────────────────────────────────────
+# Optional Tesseract OCR (pytesseract + the tesseract binary) for screenshots and scanned PDF
+# pages, fully local — no cloud call. Images are normalized before OCR: EXIF rotation,
+# transparency flattened onto white, grayscale, downscaled to EXTRACTION_OCR_MAX_SIDE (JPEGs
+# are decoded at reduced scale), small screenshots upscaled, dark mode inverted, autocontrast.
+# OCR text is cached on disk per image sha256 (EXTRACTION_OCR_CACHE_DIR), so the same
+# screenshot or a repeated scanned page is recognized once across extraction processes.
+
+_OCR_PREPROCESS_VERSION = "1"  # part of the OCR cache key; bump when _prepare_ocr_image changes
+_OCR_MIN_SIDE = 1200  # upscale 2× below this — screenshot text is too small for Tesseract at 1×
+
+_ocr_ready: Optional[bool] = None
+
+
+def _ocr_available() -> bool:
+    global _ocr_ready
+    if not settings.EXTRACTION_OCR_ENABLED:
+        return False
+    if _ocr_ready is None:
+        try:
+            import pytesseract
+            pytesseract.get_tesseract_version()
+            _ocr_ready = True
+        except Exception:
+            _ocr_ready = False
+    return _ocr_ready
+
+
+def _prepare_ocr_image(data: bytes):
+    from PIL import Image, ImageOps, ImageStat
+    max_side = settings.EXTRACTION_OCR_MAX_SIDE
+    img = Image.open(io.BytesIO(data))
+    img.draft("RGB", (max_side, max_side))
+    img = ImageOps.exif_transpose(img)
+    if img.mode in ("RGBA", "LA", "P"):
+        img = img.convert("RGBA")
+        img = Image.alpha_composite(Image.new("RGBA", img.size, "white"), img)
+    img = img.convert("L")
+    longest = max(img.size)
+    if longest > max_side:
+        img.thumbnail((max_side, max_side), Image.LANCZOS)
+    elif longest < _OCR_MIN_SIDE:
+        img = img.resize((img.width * 2, img.height * 2), Image.LANCZOS)
+    if ImageStat.Stat(img).mean[0] < 110:
+        img = ImageOps.invert(img)
+    return ImageOps.autocontrast(img)
+
+
+def _ocr_cache_path(data: bytes) -> Optional[str]:
+    if not settings.EXTRACTION_OCR_CACHE_DIR:
+        return None
+    key = hashlib.sha256(data).hexdigest()
+    name = f"{key}-{settings.EXTRACTION_OCR_LANG}-{settings.EXTRACTION_OCR_MAX_SIDE}-{_OCR_PREPROCESS_VERSION}.txt"
+    return os.path.join(settings.EXTRACTION_OCR_CACHE_DIR, key[:2], name)
+
+
+def _ocr_image(data: bytes) -> tuple[str, bool]:
+    """OCR text for one encoded image. Returns (text, from_cache)."""
+    import pytesseract
+    path = _ocr_cache_path(data)
+    if path:
+        try:
+            with open(path, encoding="utf-8") as f:
+                return f.read(), True
+        except OSError:
+            pass
+    raw = pytesseract.image_to_string(_prepare_ocr_image(data), lang=settings.EXTRACTION_OCR_LANG)
+    lines = [" ".join(line.split()) for line in raw.splitlines()]
+    text = "\n".join(line for line in lines if line)
+    if path:
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp, path)
+        except OSError:
+            pass
+    return text, False
+
+
+def _ocr_pdf_page(page) -> str:
+    """OCR the images embedded in a PDF page that has no text layer."""
+    parts = []
+    for image in page.images:
+        text, _ = _ocr_image(image.data)
+        if text:
+            parts.append(text)
+    return "\n".join(parts)
+
+
+def _extract_image(data: bytes) -> dict:
+    if not settings.EXTRACTION_OCR_ENABLED:
+        return {
+            "extracted_text": "",
+            "has_text": False,
+            "has_tables": False,
+            "note": "image_no_ocr",
+        }
+    if not _ocr_available():
+        return {
+            "extracted_text": "",
+            "has_text": False,
+            "has_tables": False,
+            "note": "ocr_unavailable",
+        }
+    text, cached = _ocr_image(data)
     return {
-        "extracted_text": "",
-        "has_text": False,
+        "extracted_text": text,
+        "has_text": bool(text),
         "has_tables": False,
-        "note": "image_no_ocr",
+        "ocr": {"engine": "tesseract", "lang": settings.EXTRACTION_OCR_LANG, "cached": cached},
     }
 
 
@@ -103,6 +461,121 @@ def extract_text_from_bytes(data: bytes, content_type: str) -> dict:
     }
 
 
+# ── Isolated parsing ──────────────────────────────────────────────────────────
+# One child process per file: a parser that hangs is killed at EXTRACTION_TIMEOUT_SECONDS,
+# one that balloons hits RLIMIT_AS (EXTRACTION_MEMORY_LIMIT_MB) and fails with MemoryError —
+# neither affects the API process. forkserver keeps the per-file start cost to a fork of a
+# process that already imported the parsers.
+
+class ExtractionError(Exception):
+    pass
+
+
+_mp_context = None
+
+
+def _get_mp_context():
+    global _mp_context
+    if _mp_context is None:
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            _mp_context = multiprocessing.get_context("forkserver")
+            _mp_context.set_forkserver_preload(
+                ["app.services.evidence_extraction", "pypdf", "docx", "openpyxl", "PIL.Image", "pytesseract"]
+            )
+        else:
+            _mp_context = multiprocessing.get_context("spawn")
+    return _mp_context
+
+
+def _parse_child(conn, data: bytes, content_type: str, memory_limit_bytes: int) -> None:
+    try:
+        if memory_limit_bytes > 0:
+            try:
+                import resource
+                resource.setrlimit(resource.RLIMIT_AS, (memory_limit_bytes, memory_limit_bytes))
+            except (ImportError, ValueError, OSError):
+                pass
+        conn.send(("ok", extract_text_from_bytes(data, content_type)))
+    except MemoryError:
+        conn.send(("error", "Extraction exceeded the memory limit"))
+    except Exception as e:
+        conn.send(("error", f"{type(e).__name__}: {e}"[:500]))
+    finally:
+        conn.close()
+
+
+async def parse_isolated(data: bytes, content_type: str) -> dict:
+    """extract_text_from_bytes() in a child process; raises ExtractionError on timeout/crash/parse error."""
+    ctx = _get_mp_context()
+    recv_conn, send_conn = ctx.Pipe(duplex=False)
+    proc = ctx.Process(
+        target=_parse_child,
+        args=(send_conn, data, content_type, settings.EXTRACTION_MEMORY_LIMIT_MB * 1024 * 1024),
+        daemon=True,
+    )
+    proc.start()
+    send_conn.close()
+    try:
+        ready = await asyncio.to_thread(recv_conn.poll, settings.EXTRACTION_TIMEOUT_SECONDS)
+        if not ready:
+            raise ExtractionError(f"Extraction timed out after {settings.EXTRACTION_TIMEOUT_SECONDS:g}s")
+        try:
+            kind, payload = await asyncio.to_thread(recv_conn.recv)
+        except EOFError:
+            await asyncio.to_thread(proc.join, 5)
+            raise ExtractionError(f"Extraction process exited unexpectedly (code {proc.exitcode})")
+        if kind != "ok":
+            raise ExtractionError(payload)
+        return payload
+    finally:
+        if proc.is_alive():
+            proc.kill()
+        await asyncio.to_thread(proc.join, 5)
+        recv_conn.close()
+
+
+# ── Extract-once content ──────────────────────────────────────────────────────
+# Output is stored per (tenant, sha256) in EvidenceContentExtraction; per-assessment
+# EvidenceExtraction rows reference it and mirror its status. Same bytes → parsed once per
+# tenant; a new file version (new sha256) gets its own content row. Never shared across tenants.
+
+_CLAIMABLE = ("extract_pending", "extract_failed")
+
+
+async def _get_or_create_content(
+    db: AsyncSession, tenant_id: str, sha256: str, content_type: str
+) -> EvidenceContentExtraction:
+    await db.execute(
+        pg_insert(EvidenceContentExtraction)
+        .values(tenant_id=tenant_id, sha256=sha256, content_type=content_type, status="extract_pending")
+        .on_conflict_do_nothing(constraint="uq_evidence_content_extraction")
+    )
+    r = await db.execute(
+        select(EvidenceContentExtraction).where(
+            EvidenceContentExtraction.tenant_id == tenant_id,
+            EvidenceContentExtraction.sha256 == sha256,
+        )
+    )
+    return r.scalar_one()
+
+
+def _link(ext: EvidenceExtraction, content: EvidenceContentExtraction) -> None:
+    ext.content = content
+    ext.content_extraction_id = content.id
+    ext.status = content.status
+    ext.error_message = content.error_message
+    ext.extraction_result = None
+
+
+async def _mirror_to_references(db: AsyncSession, content: EvidenceContentExtraction) -> None:
+    await db.execute(
+        update(EvidenceExtraction)
+        .where(EvidenceExtraction.content_extraction_id == content.id)
+        .values(status=content.status, error_message=content.error_message)
+        .execution_options(synchronize_session=False)
+    )
+
+
 async def get_or_create_extraction(
     db: AsyncSession,
     evidence_file_id: str,
@@ -112,7 +585,9 @@ async def get_or_create_extraction(
 ) -> tuple[EvidenceExtraction, bool]:
     """
     Get existing extraction for this evidence file (same assessment), or create new.
-    Returns (extraction, created_new).
+    When the file's sha256 is known the row is linked to the shared content extraction —
+    already-extracted content is returned as 'extracted' without queueing anything.
+    Failed extractions are queued again. Returns (extraction, created_new).
     """
     q = select(EvidenceExtraction).where(
         EvidenceExtraction.evidence_file_id == evidence_file_id,
@@ -120,30 +595,41 @@ async def get_or_create_extraction(
         EvidenceExtraction.tenant_id == tenant_id,
     ).order_by(EvidenceExtraction.updated_at.desc()).limit(1)
     r = await db.execute(q)
-    existing = r.scalar_one_or_none()
-    if existing and not force_reextract:
-        return existing, False
-    if existing and force_reextract:
-        existing.status = "extract_pending"
-        existing.extraction_result = None
-        existing.error_message = None
-        await db.flush()
-        return existing, False
-    ext = EvidenceExtraction(
-        tenant_id=tenant_id,
-        assessment_id=assessment_id,
-        evidence_file_id=evidence_file_id,
-        status="extract_pending",
-    )
-    db.add(ext)
+    ext = r.scalar_one_or_none()
+    created = ext is None
+    if created:
+        ext = EvidenceExtraction(
+            tenant_id=tenant_id,
+            assessment_id=assessment_id,
+            evidence_file_id=evidence_file_id,
+            status="extract_pending",
+        )
+        db.add(ext)
+
+    # Usually already loaded by the route's membership check
+    evidence = await loaders.get_evidence_file(db, evidence_file_id, tenant_id)
+    if evidence is not None and evidence.sha256:
+        content = await _get_or_create_content(db, tenant_id, evidence.sha256, evidence.content_type)
+        if content.status == "extract_failed" or (force_reextract and content.status == "extracted"):
+            content.status = "extract_pending"
+            content.extraction_result = None
+            content.error_message = None
+        _link(ext, content)
+    elif force_reextract or ext.status == "extract_failed":
+        ext.status = "extract_pending"
+        ext.extraction_result = None
+        ext.error_message = None
     await db.flush()
-    return ext, True
+    return ext, created
 
 
 async def run_extraction(db: AsyncSession, extraction_id: str) -> EvidenceExtraction | None:
     """
-    Load extraction + evidence file, download file from storage, extract text, update extraction.
-    Caller must commit. Returns updated EvidenceExtraction or None if not found.
+    Worker step for one extraction row: resolve its content (hashing the file on first use),
+    claim the content, download and parse once, store the result on the content row and
+    mirror the status to every extraction referencing it.
+    Commits the claim itself (so concurrent workers see it); caller commits the rest.
+    Returns updated EvidenceExtraction or None if not found.
     """
     q = select(EvidenceExtraction).where(EvidenceExtraction.id == extraction_id)
     r = await db.execute(q)
@@ -160,22 +646,54 @@ async def run_extraction(db: AsyncSession, extraction_id: str) -> EvidenceExtrac
         ext.status = "extract_failed"
         ext.error_message = "Evidence file not found"
         return ext
-    ext.status = "extracting"
-    await db.flush()
-    try:
-        data = storage.get_object_bytes(evidence.storage_key)
-    except Exception as e:
-        ext.status = "extract_failed"
-        ext.error_message = str(e)[:500]
-        ext.extraction_result = None
+
+    data: Optional[bytes] = None
+    content = ext.content
+    if content is None or content.sha256 != evidence.sha256:
+        if not evidence.sha256:
+            # Hash not known yet (registration does not read the object): hash the download the
+            # parse needs anyway, then dedupe on the tenant's content rows as usual
+            try:
+                data = await storage.get_object_bytes(evidence.storage_key)
+            except Exception as e:
+                ext.status = "extract_failed"
+                ext.error_message = str(e)[:500]
+                ext.extraction_result = None
+                return ext
+            evidence.sha256 = hashlib.sha256(data).hexdigest()
+        content = await _get_or_create_content(db, ext.tenant_id, evidence.sha256, evidence.content_type)
+        _link(ext, content)
+
+    if content.status == "extracted":
+        _link(ext, content)
         return ext
+
+    claimed = (
+        await db.execute(
+            update(EvidenceContentExtraction)
+            .where(EvidenceContentExtraction.id == content.id, EvidenceContentExtraction.status.in_(_CLAIMABLE))
+            .values(status="extracting", error_message=None)
+            .returning(EvidenceContentExtraction.id)
+        )
+    ).scalar_one_or_none()
+    await db.refresh(content)
+    _link(ext, content)
+    await db.commit()
+    if claimed is None:
+        # Another worker is parsing the same bytes; it mirrors the outcome into this row
+        return ext
+
     try:
-        result = extract_text_from_bytes(data, evidence.content_type)
-        ext.status = "extracted"
-        ext.extraction_result = result
-        ext.error_message = None
+        if data is None:
+            data = await storage.get_object_bytes(evidence.storage_key)
+        content.extraction_result = await parse_isolated(data, evidence.content_type)
+        content.status = "extracted"
+        content.error_message = None
     except Exception as e:
-        ext.status = "extract_failed"
-        ext.error_message = str(e)[:500]
-        ext.extraction_result = None
+        content.status = "extract_failed"
+        content.error_message = str(e)[:500]
+        content.extraction_result = None
+    await db.flush()
+    _link(ext, content)
+    await _mirror_to_references(db, content)
     return ext
@@ -0,0 +1,182 @@
+"""
+Evidence extraction worker pool.
+POST /evidence/{id}/extract only marks the EvidenceExtraction row extract_pending; these
+workers drain pending rows (FOR UPDATE SKIP LOCKED → extracting), download the file and parse
+it via evidence_extraction.parse_isolated (child process, timeout, memory limit).
+Rows (and shared content rows) left in 'extracting' by a crashed process go back to
+extract_pending after EXTRACTION_STALE_AFTER_SECONDS.
+"""
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import select, update
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models.ai_evidence import EvidenceExtraction, EvidenceContentExtraction
+from app.services.evidence_extraction import run_extraction
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractionWorkerPool:
+    def __init__(self, concurrency: int, poll_interval: float, stale_after: float):
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval
+        self.stale_after = stale_after
+        self._tasks: list[asyncio.Task] = []
+        self._stopping = False
+        self._wake = asyncio.Event()
+
+    async def start(self) -> None:
+        self._stopping = False
+        try:
+            await self.requeue_stale()
+        except Exception:
+            logger.exception("Stale extraction sweep failed at startup")
+        self._tasks = [
+            asyncio.create_task(self._worker_loop(i), name=f"extraction-worker-{i}")
+            for i in range(self.concurrency)
+        ]
+        self._tasks.append(asyncio.create_task(self._reaper_loop(), name="extraction-reaper"))
+        logger.info("Extraction worker pool started: %d workers", self.concurrency)
+
+    async def stop(self) -> None:
+        self._stopping = True
+        for t in self._tasks:
+            t.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def notify(self) -> None:
+        """New pending rows in this process: skip the rest of the poll interval."""
+        self._wake.set()
+
+    async def requeue_stale(self) -> int:
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=self.stale_after)
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(EvidenceContentExtraction)
+                .where(EvidenceContentExtraction.status == "extracting", EvidenceContentExtraction.updated_at < cutoff)
+                .values(status="extract_pending")
+            )
+            result = await db.execute(
+                update(EvidenceExtraction)
+                .where(EvidenceExtraction.status == "extracting", EvidenceExtraction.updated_at < cutoff)
+                .values(status="extract_pending")
+            )
+            await db.commit()
+        if result.rowcount:
+            logger.warning("Re-queued %d stale evidence extractions", result.rowcount)
+        return result.rowcount
+
+    async def _reaper_loop(self) -> None:
+        while not self._stopping:
+            await asyncio.sleep(self.stale_after)
+            try:
+                await self.requeue_stale()
+            except Exception:
+                logger.exception("Stale extraction sweep failed")
+
+    async def _idle(self) -> None:
+        try:
+            await asyncio.wait_for(self._wake.wait(), timeout=self.poll_interval)
+        except asyncio.TimeoutError:
+            pass
+        self._wake.clear()
+
+    async def _worker_loop(self, idx: int) -> None:
+        while not self._stopping:
+            try:
+                extraction_id = await self._claim()
+            except Exception:
+                logger.exception("Extraction claim failed (worker %d)", idx)
+                extraction_id = None
+            if extraction_id is None:
+                await self._idle()
+                continue
+            try:
+                await self._run(extraction_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Extraction %s failed (worker %d)", extraction_id, idx)
+
+    async def _claim(self) -> Optional[str]:
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(EvidenceExtraction)
+                .where(EvidenceExtraction.status == "extract_pending")
+                .order_by(EvidenceExtraction.created_at)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+            )
+            ext = result.scalar_one_or_none()
+            if ext is None:
+                return None
+            ext.status = "extracting"
+            ext.error_message = None
+            await db.commit()
+            return ext.id
+
+    async def _run(self, extraction_id: str) -> None:
+        async with AsyncSessionLocal() as db:
+            try:
+                ext = await run_extraction(db, extraction_id)
+                await db.commit()
+            except asyncio.CancelledError:
+                # Shutdown: hand the row back instead of waiting for the stale sweep
+                await db.rollback()
+                await self._release(extraction_id)
+                raise
+        if ext is not None and ext.status == "extract_failed":
+            logger.warning("Extraction %s failed: %s", extraction_id, ext.error_message)
+
+    async def _release(self, extraction_id: str) -> None:
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(EvidenceContentExtraction)
+                .where(
+                    EvidenceContentExtraction.id == select(EvidenceExtraction.content_extraction_id)
+                    .where(EvidenceExtraction.id == extraction_id)
+                    .scalar_subquery(),
+                    EvidenceContentExtraction.status == "extracting",
+                )
+                .values(status="extract_pending")
+            )
+            await db.execute(
+                update(EvidenceExtraction)
+                .where(EvidenceExtraction.id == extraction_id, EvidenceExtraction.status == "extracting")
+                .values(status="extract_pending")
+            )
+            await db.commit()
+
+
+_pool: Optional[ExtractionWorkerPool] = None
+
+
+async def start_workers() -> None:
+    global _pool
+    if _pool is not None:
+        return
+    _pool = ExtractionWorkerPool(
+        concurrency=settings.EXTRACTION_WORKER_CONCURRENCY,
+        poll_interval=settings.EXTRACTION_POLL_INTERVAL_SECONDS,
+        stale_after=settings.EXTRACTION_STALE_AFTER_SECONDS,
+    )
+    await _pool.start()
+
+
+async def stop_workers() -> None:
+    global _pool
+    if _pool is None:
+        return
+    await _pool.stop()
+    _pool = None
+
+
+def notify_pending() -> None:
+    if _pool is not None:
+        _pool.notify()
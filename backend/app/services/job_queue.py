@@ -0,0 +1,404 @@
+"""
+Background job queue — DB-backed (table background_jobs), drained by an asyncio worker pool.
+
+Producers call enqueue_job() inside the request transaction; the job becomes visible to
+workers when get_db() commits. Workers claim jobs with SELECT ... FOR UPDATE SKIP LOCKED,
+so several API processes can share one queue without double execution.
+
+  - retries:      failed attempts are re-queued with exponential backoff up to max_attempts;
+                  PermanentJobError fails the job immediately
+  - cancellation: queued jobs are cancelled at once; running jobs get cancel_requested and
+                  the heartbeat watcher cancels the handler task
+  - fairness:     at most JOB_TENANT_CONCURRENCY running jobs per tenant (soft limit)
+  - recovery:     running jobs whose heartbeat is older than JOB_STALE_AFTER_SECONDS
+                  (crashed/restarted process) are re-queued, or failed once max_attempts is used up
+
+Handlers are registered per job_type with @register_job_handler and receive (job, db).
+Handler writes and the final job status are committed in one transaction; a handler may
+commit earlier only results that must survive a failed attempt (report generation: engine outputs).
+"""
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+from typing import Awaitable, Callable, Optional
+
+from sqlalchemy import select, update, func, literal
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models.models import BackgroundJob
+
+logger = logging.getLogger(__name__)
+
+ACTIVE_STATUSES = ("queued", "running")
+
+JobHandler = Callable[[BackgroundJob, AsyncSession], Awaitable[Optional[dict]]]
+FailureHook = Callable[[BackgroundJob, AsyncSession, str], Awaitable[None]]
+
+
+class PermanentJobError(Exception):
+    """Raised by a handler when retrying cannot help (missing entity, invalid input)."""
+
+
+_handlers: dict[str, JobHandler] = {}
+_failure_hooks: dict[str, FailureHook] = {}
+
+
+def register_job_handler(job_type: str, on_failure: Optional[FailureHook] = None):
+    """Decorator: register the coroutine that executes jobs of job_type.
+    on_failure runs in the same transaction that marks the job failed (terminal failures only)."""
+    def decorator(fn: JobHandler) -> JobHandler:
+        _handlers[job_type] = fn
+        if on_failure is not None:
+            _failure_hooks[job_type] = on_failure
+        return fn
+    return decorator
+
+
+# ── Producer API ──────────────────────────────────────────────────────────────
+
+async def enqueue_job(
+    db: AsyncSession,
+    tenant_id: str,
+    job_type: str,
+    entity_type: Optional[str] = None,
+    entity_id: Optional[str] = None,
+    payload: Optional[dict] = None,
+    requested_by_user_id: Optional[str] = None,
+    max_attempts: Optional[int] = None,
+    progress: Optional[dict] = None,
+) -> BackgroundJob:
+    job = BackgroundJob(
+        tenant_id=tenant_id,
+        job_type=job_type,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        status="queued",
+        payload=payload or {},
+        progress=progress,
+        attempts=0,
+        max_attempts=max_attempts or settings.JOB_MAX_ATTEMPTS,
+        cancel_requested=False,
+        requested_by_user_id=requested_by_user_id,
+        available_at=datetime.now(timezone.utc),
+    )
+    db.add(job)
+    await db.flush()
+    return job
+
+
+async def get_active_job(
+    db: AsyncSession, job_type: str, entity_type: str, entity_id: str
+) -> Optional[BackgroundJob]:
+    """Queued or running job for the entity, if any (used to de-duplicate enqueues)."""
+    result = await db.execute(
+        select(BackgroundJob).where(
+            BackgroundJob.job_type == job_type,
+            BackgroundJob.entity_type == entity_type,
+            BackgroundJob.entity_id == entity_id,
+            BackgroundJob.status.in_(ACTIVE_STATUSES),
+        ).order_by(BackgroundJob.created_at.desc()).limit(1)
+    )
+    return result.scalar_one_or_none()
+
+
+async def request_cancel(db: AsyncSession, job: BackgroundJob) -> BackgroundJob:
+    """Cancel a queued job immediately; flag a running job for its worker to cancel.
+    The queued → cancelled transition is one conditional UPDATE, so a worker claiming the job
+    concurrently either sees it cancelled or wins and gets cancel_requested instead."""
+    cancelled = await db.execute(
+        update(BackgroundJob)
+        .where(BackgroundJob.id == job.id, BackgroundJob.status == "queued")
+        .values(status="cancelled", finished_at=func.now())
+        .returning(BackgroundJob.id)
+    )
+    if cancelled.scalar_one_or_none() is None:
+        await db.execute(
+            update(BackgroundJob)
+            .where(BackgroundJob.id == job.id, BackgroundJob.status == "running")
+            .values(cancel_requested=True)
+        )
+    await db.refresh(job)
+    return job
+
+
+async def set_job_progress(job_id: str, progress: dict) -> None:
+    """Merge progress keys into job.progress (atomic jsonb ||, safe for concurrent steps).
+    Own session/commit so pollers see it mid-run."""
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            update(BackgroundJob)
+            .where(BackgroundJob.id == job_id)
+            .values(
+                progress=func.coalesce(BackgroundJob.progress, literal({}, JSONB)).op("||")(literal(progress, JSONB)),
+                heartbeat_at=func.now(),
+            )
+        )
+        await db.commit()
+
+
+async def _run_failure_hook(job: BackgroundJob, db: AsyncSession, error: str) -> None:
+    """Run the job type's on_failure hook in a savepoint: a failing hook is logged and rolled
+    back alone, never the status change it accompanies."""
+    hook = _failure_hooks.get(job.job_type)
+    if hook is None:
+        return
+    try:
+        async with db.begin_nested():
+            await hook(job, db, error)
+    except Exception:
+        logger.exception("Failure hook for job %s (%s) raised", job.id, job.job_type)
+
+
+# ── Worker pool ───────────────────────────────────────────────────────────────
+
+class JobWorkerPool:
+    def __init__(
+        self,
+        concurrency: int,
+        tenant_concurrency: int,
+        poll_interval: float,
+        heartbeat_interval: float,
+        stale_after: float,
+        retry_backoff: float,
+    ):
+        self.concurrency = concurrency
+        self.tenant_concurrency = tenant_concurrency
+        self.poll_interval = poll_interval
+        self.heartbeat_interval = heartbeat_interval
+        self.stale_after = stale_after
+        self.retry_backoff = retry_backoff
+        self._tasks: list[asyncio.Task] = []
+        self._stopping = False
+
+    async def start(self) -> None:
+        self._stopping = False
+        try:
+            await self.requeue_stale()
+        except Exception:
+            logger.exception("Stale job sweep failed at startup")
+        self._tasks = [
+            asyncio.create_task(self._worker_loop(i), name=f"job-worker-{i}")
+            for i in range(self.concurrency)
+        ]
+        self._tasks.append(asyncio.create_task(self._reaper_loop(), name="job-reaper"))
+        logger.info("Job worker pool started: %d workers", self.concurrency)
+
+    async def stop(self) -> None:
+        self._stopping = True
+        for t in self._tasks:
+            t.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def requeue_stale(self) -> int:
+        """Recover running jobs whose worker died. A job that keeps killing its worker must not be
+        re-queued forever: once attempts reach max_attempts it is failed (failure hook included)."""
+        cutoff = datetime.now(timezone.utc) - timedelta(seconds=self.stale_after)
+        stale = (
+            BackgroundJob.status == "running",
+            func.coalesce(BackgroundJob.heartbeat_at, BackgroundJob.started_at) < cutoff,
+        )
+        error = "Worker lost (heartbeat expired); no attempts left"
+        async with AsyncSessionLocal() as db:
+            failed = await db.execute(
+                update(BackgroundJob)
+                .where(*stale, BackgroundJob.attempts >= BackgroundJob.max_attempts)
+                .values(status="failed", error=error, finished_at=func.now())
+                .returning(BackgroundJob),
+                execution_options={"populate_existing": True},
+            )
+            failed_jobs = list(failed.scalars().all())
+            for job in failed_jobs:
+                await _run_failure_hook(job, db, error)
+            requeued = await db.execute(
+                update(BackgroundJob)
+                .where(*stale)
+                .values(status="queued", available_at=func.now())
+            )
+            await db.commit()
+        if requeued.rowcount:
+            logger.warning("Re-queued %d stale background jobs", requeued.rowcount)
+        if failed_jobs:
+            logger.error("Failed %d stale background jobs with no attempts left", len(failed_jobs))
+        return requeued.rowcount + len(failed_jobs)
+
+    async def _reaper_loop(self) -> None:
+        while not self._stopping:
+            await asyncio.sleep(self.stale_after)
+            try:
+                await self.requeue_stale()
+            except Exception:
+                logger.exception("Stale job sweep failed")
+
+    async def _worker_loop(self, idx: int) -> None:
+        while not self._stopping:
+            try:
+                job_id = await self._claim()
+            except Exception:
+                logger.exception("Job claim failed (worker %d)", idx)
+                job_id = None
+            if job_id is None:
+                await asyncio.sleep(self.poll_interval)
+                continue
+            try:
+                await self._run(job_id)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Job %s bookkeeping failed (worker %d)", job_id, idx)
+
+    async def _claim(self) -> Optional[str]:
+        now = datetime.now(timezone.utc)
+        busy_tenants = (
+            select(BackgroundJob.tenant_id)
+            .where(BackgroundJob.status == "running")
+            .group_by(BackgroundJob.tenant_id)
+            .having(func.count() >= self.tenant_concurrency)
+        )
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(BackgroundJob)
+                .where(
+                    BackgroundJob.status == "queued",
+                    BackgroundJob.job_type.in_(list(_handlers)),
+                    BackgroundJob.available_at <= now,
+                    BackgroundJob.tenant_id.not_in(busy_tenants),
+                )
+                .order_by(BackgroundJob.created_at)
+                .limit(1)
+                .with_for_update(skip_locked=True)
+            )
+            job = result.scalar_one_or_none()
+            if job is None:
+                return None
+            job.status = "running"
+            job.attempts += 1
+            job.started_at = now
+            job.heartbeat_at = now
+            job.error = None
+            await db.commit()
+            return job.id
+
+    async def _watch(self, job_id: str, task: asyncio.Task, cancelled: dict) -> None:
+        """Heartbeat + cancel_requested polling for a running job."""
+        while not task.done():
+            await asyncio.sleep(self.heartbeat_interval)
+            async with AsyncSessionLocal() as db:
+                result = await db.execute(
+                    update(BackgroundJob)
+                    .where(BackgroundJob.id == job_id)
+                    .values(heartbeat_at=func.now())
+                    .returning(BackgroundJob.cancel_requested)
+                )
+                flag = result.scalar_one_or_none()
+                await db.commit()
+            if flag:
+                cancelled["by_user"] = True
+                task.cancel()
+                return
+
+    async def _run(self, job_id: str) -> None:
+        async with AsyncSessionLocal() as db:
+            job = await db.get(BackgroundJob, job_id)
+            attempt = job.attempts  # claim increments attempts: identifies this worker's run
+            handler = _handlers.get(job.job_type)
+            cancelled = {"by_user": False}
+            task = asyncio.create_task(handler(job, db))
+            watcher = asyncio.create_task(self._watch(job_id, task, cancelled))
+            error: Optional[BaseException] = None
+            result: Optional[dict] = None
+            try:
+                result = await task
+            except asyncio.CancelledError as e:
+                if not cancelled["by_user"]:
+                    # Pool shutdown: leave the job for requeue_stale() / another process
+                    watcher.cancel()
+                    await db.rollback()
+                    await self._release(job_id)
+                    raise
+                error = e
+            except Exception as e:
+                error = e
+            finally:
+                watcher.cancel()
+
+            now = datetime.now(timezone.utc)
+            if error is None:
+                # Conditional: the stale sweep may have re-queued (maybe re-claimed) or failed the job meanwhile
+                completed = await db.execute(
+                    update(BackgroundJob)
+                    .where(
+                        BackgroundJob.id == job_id,
+                        BackgroundJob.status == "running",
+                        BackgroundJob.attempts == attempt,
+                    )
+                    .values(status="completed", result=result, finished_at=now)
+                    .returning(BackgroundJob.id)
+                )
+                if completed.scalar_one_or_none() is None:
+                    job_type = job.job_type
+                    await db.rollback()
+                    logger.warning("Job %s (%s) finished after losing ownership; result discarded", job_id, job_type)
+                    return
+                await db.commit()
+                return
+
+            await db.rollback()
+            job = await db.get(BackgroundJob, job_id, populate_existing=True)
+            if job.status != "running" or job.attempts != attempt:
+                logger.warning("Job %s (%s) failed after losing ownership (now %s)", job_id, job.job_type, job.status)
+                return
+            if cancelled["by_user"]:
+                job.status = "cancelled"
+                job.error = "Cancelled by user"
+                job.finished_at = now
+            elif not isinstance(error, PermanentJobError) and job.attempts < job.max_attempts:
+                job.status = "queued"
+                job.error = str(error)
+                job.available_at = now + timedelta(seconds=self.retry_backoff * (2 ** (job.attempts - 1)))
+                logger.warning("Job %s (%s) attempt %d failed, retrying: %s", job.id, job.job_type, job.attempts, error)
+            else:
+                job.status = "failed"
+                job.error = str(error)
+                job.finished_at = now
+                logger.error("Job %s (%s) failed: %s", job.id, job.job_type, error)
+                await _run_failure_hook(job, db, str(error))
+            await db.commit()
+
+    async def _release(self, job_id: str) -> None:
+        async with AsyncSessionLocal() as db:
+            await db.execute(
+                update(BackgroundJob)
+                .where(BackgroundJob.id == job_id, BackgroundJob.status == "running")
+                .values(status="queued", attempts=BackgroundJob.attempts - 1, available_at=func.now())
+            )
+            await db.commit()
+
+
+_pool: Optional[JobWorkerPool] = None
+
+
+async def start_workers() -> None:
+    global _pool
+    if _pool is not None:
+        return
+    _pool = JobWorkerPool(
+        concurrency=settings.JOB_WORKER_CONCURRENCY,
+        tenant_concurrency=settings.JOB_TENANT_CONCURRENCY,
+        poll_interval=settings.JOB_POLL_INTERVAL_SECONDS,
+        heartbeat_interval=settings.JOB_HEARTBEAT_SECONDS,
+        stale_after=settings.JOB_STALE_AFTER_SECONDS,
+        retry_backoff=settings.JOB_RETRY_BACKOFF_SECONDS,
+    )
+    await _pool.start()
+
+
+async def stop_workers() -> None:
+    global _pool
+    if _pool is None:
+        return
+    await _pool.stop()
+    _pool = None
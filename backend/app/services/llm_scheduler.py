@@ -0,0 +1,130 @@
+"""
+LLM request scheduler — bounded concurrency, rate-limit budgets and retries for LLM calls.
+
+  - at most `max_concurrency` calls in flight;
+  - two token buckets refilled continuously: requests/minute and tokens/minute. A call
+    reserves its estimated tokens up front; the estimate is corrected from the real usage;
+  - retryable errors (429, 5xx/529, timeouts, connection resets) are retried with full-jitter
+    exponential backoff. A server Retry-After pauses the whole scheduler, not just one call.
+
+Provider-agnostic: the caller supplies the coroutine and the error classifier
+(see claude_analyst.get_analyst_scheduler).
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from typing import Awaitable, Callable, Optional, TypeVar
+
+log = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class TokenBucket:
+    """`per_minute` units of capacity, refilled at per_minute/60 per second. Acquirers queue FIFO."""
+
+    def __init__(self, per_minute: float):
+        self.capacity = float(per_minute)
+        self.rate = self.capacity / 60.0
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self, amount: float = 1.0) -> float:
+        """Take `amount` (capped at capacity) and return what was actually taken — the base for adjust()."""
+        # A single request larger than the bucket would otherwise wait forever
+        amount = min(float(amount), self.capacity)
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return amount
+                await asyncio.sleep((amount - self._tokens) / self.rate)
+
+    def adjust(self, delta: float) -> None:
+        """Refund (delta > 0) or charge (delta < 0) after the fact; the balance may go negative."""
+        self._refill()
+        self._tokens = min(self.capacity, self._tokens + delta)
+
+
+class LLMScheduler:
+    def __init__(
+        self,
+        max_concurrency: int,
+        requests_per_minute: int,
+        tokens_per_minute: int,
+        max_retries: int,
+        backoff_base_seconds: float,
+        backoff_max_seconds: float,
+        classify_error: Callable[[BaseException], tuple[bool, Optional[float]]],
+    ):
+        """classify_error(exc) -> (retryable, retry_after_seconds or None)."""
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        self._requests = TokenBucket(max(1, requests_per_minute))
+        self._tokens = TokenBucket(max(1, tokens_per_minute))
+        self._max_retries = max(0, max_retries)
+        self._backoff_base = backoff_base_seconds
+        self._backoff_max = backoff_max_seconds
+        self._classify_error = classify_error
+        self._paused_until = 0.0
+        self.stats = {"calls": 0, "retries": 0, "rate_limited": 0, "failed": 0, "tokens": 0}
+
+    def _backoff(self, attempt: int, retry_after: Optional[float]) -> float:
+        delay = random.uniform(0, min(self._backoff_max, self._backoff_base * 2 ** attempt))
+        return max(delay, retry_after or 0.0)
+
+    async def _wait_if_paused(self) -> None:
+        delay = self._paused_until - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def run(
+        self,
+        call: Callable[[], Awaitable[T]],
+        estimated_tokens: int,
+        actual_tokens: Optional[Callable[[T], Optional[int]]] = None,
+    ) -> T:
+        """
+        Run call() under the concurrency and rate limits, retrying retryable errors.
+        actual_tokens(result) returns the real usage used to correct the token budget.
+        """
+        attempt = 0
+        while True:
+            await self._wait_if_paused()
+            await self._requests.acquire(1)
+            reserved = await self._tokens.acquire(estimated_tokens)
+            async with self._semaphore:
+                await self._wait_if_paused()
+                self.stats["calls"] += 1
+                try:
+                    result = await call()
+                except Exception as e:
+                    retryable, retry_after = self._classify_error(e)
+                    if retry_after:
+                        self.stats["rate_limited"] += 1
+                        self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+                    if not retryable or attempt >= self._max_retries:
+                        self.stats["failed"] += 1
+                        raise
+                    delay = self._backoff(attempt, retry_after)
+                    attempt += 1
+                    self.stats["retries"] += 1
+                    log.info("LLM call failed (%s); retry %d/%d in %.2fs", e, attempt, self._max_retries, delay)
+                else:
+                    used = actual_tokens(result) if actual_tokens else None
+                    if used is not None:
+                        # Relative to what was taken: an estimate above capacity was only partly reserved
+                        self._tokens.adjust(reserved - used)
+                        self.stats["tokens"] += used
+                    return result
+            # Sleep outside the semaphore so other calls can use the slot meanwhile
+            await asyncio.sleep(delay)
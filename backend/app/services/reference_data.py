@@ -0,0 +1,251 @@
+"""
+Reference data cache — frameworks, controlset versions, controls, rules, questions.
+
+These rows are versioned and effectively immutable once seeded, so each API/worker process
+keeps them in memory as frozen, slotted *Ref objects instead of querying them per request:
+  - controls per controlset_version_id, rules per ruleset_version_id, questions per framework;
+  - entries are loaded on first use and kept until invalidated;
+  - invalidation: seed scripts call bump_reference_data_version(db) (same transaction as the
+    seed). Every process compares reference_data_version.version at most every
+    REFERENCE_CACHE_CHECK_SECONDS and drops everything when it changed;
+    invalidate() clears the local process immediately.
+
+Ref objects are shared between requests — treat them (including logic/options dicts) as read-only.
+Metrics: get_reference_cache().metrics() → hits, misses, hit_rate, invalidations, version.
+"""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.models import (
+    Control, ControlsetVersion, Framework, Question, ReferenceDataVersion, Rule,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class FrameworkRef:
+    id: str
+    code: str
+    name: str
+
+
+@dataclass(frozen=True, slots=True)
+class VersionRef:
+    """ControlsetVersion or RulesetVersion."""
+    id: str
+    framework_id: str
+    version: str
+    is_active: bool
+
+
+@dataclass(frozen=True, slots=True)
+class ControlRef:
+    id: str
+    framework_id: str
+    controlset_version_id: str
+    control_code: str
+    title: str
+    description: Optional[str]
+    category: str
+    severity: str
+    na_eligible: bool
+    hipaa_control_id: Optional[str]
+    created_at: datetime
+
+
+@dataclass(frozen=True, slots=True)
+class RuleRef:
+    id: str
+    ruleset_version_id: str
+    control_id: str
+    pattern: str
+    logic: Optional[dict]
+    remediation_template_id: Optional[str]
+
+
+@dataclass(frozen=True, slots=True)
+class QuestionRef:
+    id: str
+    framework_id: str
+    control_id: str
+    question_code: str
+    text: str
+    answer_type: str
+    options: Optional[dict]
+    is_active: bool
+    created_at: datetime
+
+
+class ControlSet:
+    """Controls of one controlset version, ordered by control_code."""
+    __slots__ = ("controls", "by_id")
+
+    def __init__(self, controls: list[ControlRef]):
+        self.controls: tuple[ControlRef, ...] = tuple(sorted(controls, key=lambda c: c.control_code))
+        self.by_id: dict[str, ControlRef] = {c.id: c for c in self.controls}
+
+
+class QuestionSet:
+    """All questions of one framework (active and inactive), ordered by question_code."""
+    __slots__ = ("questions", "by_id", "by_code", "active_count")
+
+    def __init__(self, questions: list[QuestionRef]):
+        self.questions: tuple[QuestionRef, ...] = tuple(sorted(questions, key=lambda q: q.question_code))
+        self.by_id: dict[str, QuestionRef] = {q.id: q for q in self.questions}
+        self.by_code: dict[str, QuestionRef] = {q.question_code: q for q in self.questions}
+        self.active_count = sum(1 for q in self.questions if q.is_active)
+
+    def active(self) -> list[QuestionRef]:
+        return [q for q in self.questions if q.is_active]
+
+    def for_controls(self, control_ids) -> list[QuestionRef]:
+        ids = set(control_ids)
+        return [q for q in self.questions if q.control_id in ids]
+
+
+def _control_ref(c: Control) -> ControlRef:
+    return ControlRef(
+        c.id, c.framework_id, c.controlset_version_id, c.control_code, c.title, c.description,
+        c.category, c.severity, bool(c.na_eligible), c.hipaa_control_id, c.created_at,
+    )
+
+
+def _question_ref(q: Question) -> QuestionRef:
+    return QuestionRef(
+        q.id, q.framework_id, q.control_id, q.question_code, q.text, q.answer_type,
+        q.options, bool(q.is_active), q.created_at,
+    )
+
+
+class ReferenceDataCache:
+    def __init__(self, check_interval: float):
+        self.check_interval = check_interval
+        self._entries: dict[tuple, Any] = {}
+        self._version: Optional[int] = None
+        self._checked_at = 0.0
+        self.stats = {"hits": 0, "misses": 0, "invalidations": 0, "version_checks": 0}
+
+    def invalidate(self) -> None:
+        self._entries.clear()
+        self._version = None
+        self._checked_at = 0.0
+        self.stats["invalidations"] += 1
+
+    def metrics(self) -> dict:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "hit_rate": round(self.stats["hits"] / lookups, 4) if lookups else None,
+            "entries": len(self._entries),
+            "version": self._version,
+        }
+
+    async def _check_version(self, db: AsyncSession) -> None:
+        now = time.monotonic()
+        if self._version is not None and now - self._checked_at < self.check_interval:
+            return
+        self.stats["version_checks"] += 1
+        version = (
+            await db.execute(select(ReferenceDataVersion.version).where(ReferenceDataVersion.id == 1))
+        ).scalar_one_or_none() or 0
+        if self._version is not None and version != self._version:
+            self._entries.clear()
+            self.stats["invalidations"] += 1
+        self._version = version
+        self._checked_at = now
+
+    async def _get(self, db: AsyncSession, key: tuple, load: Callable[[], Awaitable[Any]]) -> Any:
+        if not settings.REFERENCE_CACHE_ENABLED:
+            return await load()
+        await self._check_version(db)
+        if key in self._entries:
+            self.stats["hits"] += 1
+            return self._entries[key]
+        self.stats["misses"] += 1
+        version = self._version
+        value = await load()
+        # Not stored if an invalidation happened while loading
+        if version == self._version:
+            self._entries[key] = value
+        return value
+
+    # ── Lookups ──────────────────────────────────────────────────────────────
+
+    async def frameworks(self, db: AsyncSession) -> tuple[FrameworkRef, ...]:
+        async def load():
+            rows = (await db.execute(select(Framework.id, Framework.code, Framework.name))).all()
+            return tuple(FrameworkRef(*row) for row in rows)
+        return await self._get(db, ("frameworks",), load)
+
+    async def controlset_versions(self, db: AsyncSession, framework_id: str) -> tuple[VersionRef, ...]:
+        async def load():
+            rows = (
+                await db.execute(
+                    select(
+                        ControlsetVersion.id, ControlsetVersion.framework_id,
+                        ControlsetVersion.version, ControlsetVersion.is_active,
+                    ).where(ControlsetVersion.framework_id == framework_id)
+                )
+            ).all()
+            return tuple(VersionRef(i, f, v, bool(a)) for i, f, v, a in rows)
+        return await self._get(db, ("controlset_versions", framework_id), load)
+
+    async def controls(self, db: AsyncSession, controlset_version_id: str) -> ControlSet:
+        async def load():
+            rows = (
+                await db.execute(select(Control).where(Control.controlset_version_id == controlset_version_id))
+            ).scalars().all()
+            return ControlSet([_control_ref(c) for c in rows])
+        return await self._get(db, ("controls", controlset_version_id), load)
+
+    async def rules(self, db: AsyncSession, ruleset_version_id: str) -> dict[str, RuleRef]:
+        """control_id → RuleRef (one rule per control)."""
+        async def load():
+            rows = (
+                await db.execute(select(Rule).where(Rule.ruleset_version_id == ruleset_version_id))
+            ).scalars().all()
+            return {
+                r.control_id: RuleRef(r.id, r.ruleset_version_id, r.control_id, r.pattern, r.logic, r.remediation_template_id)
+                for r in rows
+            }
+        return await self._get(db, ("rules", ruleset_version_id), load)
+
+    async def questions(self, db: AsyncSession, framework_id: str) -> QuestionSet:
+        async def load():
+            rows = (
+                await db.execute(select(Question).where(Question.framework_id == framework_id))
+            ).scalars().all()
+            return QuestionSet([_question_ref(q) for q in rows])
+        return await self._get(db, ("questions", framework_id), load)
+
+
+_cache: Optional[ReferenceDataCache] = None
+
+
+def get_reference_cache() -> ReferenceDataCache:
+    global _cache
+    if _cache is None:
+        _cache = ReferenceDataCache(check_interval=settings.REFERENCE_CACHE_CHECK_SECONDS)
+    return _cache
+
+
+async def bump_reference_data_version(db: AsyncSession) -> None:
+    """
+    Call after seeding/changing frameworks, controls, rules or questions (caller commits).
+    Other processes drop their caches within REFERENCE_CACHE_CHECK_SECONDS; this one at once.
+    """
+    result = await db.execute(
+        update(ReferenceDataVersion)
+        .where(ReferenceDataVersion.id == 1)
+        .values(version=ReferenceDataVersion.version + 1)
+    )
+    if not result.rowcount:
+        db.add(ReferenceDataVersion(id=1, version=1))
+    get_reference_cache().invalidate()
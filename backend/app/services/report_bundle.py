@@ -0,0 +1,117 @@
+"""
+Report bundle — ZIP of all files in a report package, streamed.
+
+Files are read from storage chunk by chunk and written into a streaming ZIP (data
+descriptors, no seeking), so memory stays at roughly one chunk per request regardless of
+package size. Members are STORED: PDF/XLSX are already compressed.
+
+Published packages are immutable, so the first full download can be teed into a spooled
+temp file and uploaded as a cached bundle; later downloads stream that single object.
+"""
+import logging
+import tempfile
+import zipfile
+from datetime import datetime
+from typing import AsyncIterator, Optional
+
+from app.models.models import ReportPackage
+from app.services import storage
+
+log = logging.getLogger(__name__)
+
+BUNDLE_CONTENT_TYPE = "application/zip"
+_SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+
+def bundle_storage_key(pkg: ReportPackage) -> str:
+    return storage.generate_report_key(
+        pkg.tenant_id, pkg.assessment_id, f"package_v{pkg.package_version}_bundle", "ZIP"
+    )
+
+
+def bundle_file_name(pkg: ReportPackage) -> str:
+    return f"hipaa_report_package_v{pkg.package_version}_{pkg.assessment_id[:8]}.zip"
+
+
+class _ZipSink:
+    """Write-only, non-seekable sink: zipfile switches to streaming mode; drain() hands out bytes."""
+
+    def __init__(self):
+        self._chunks: list[bytes] = []
+        self._pos = 0
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        self._pos += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._pos
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        out = b"".join(self._chunks)
+        self._chunks.clear()
+        return out
+
+
+async def stream_package_zip(
+    files: list[tuple[str, str, Optional[datetime]]],
+    cache_key: Optional[str] = None,
+) -> AsyncIterator[bytes]:
+    """
+    files: (file_name in archive, storage_key, timestamp).
+    cache_key: when set, the complete archive is also uploaded there after the last byte.
+    """
+    sink = _ZipSink()
+    spool = tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_BYTES) if cache_key else None
+    completed = False
+
+    def _emit() -> bytes:
+        data = sink.drain()
+        if spool is not None and data:
+            spool.write(data)
+        return data
+
+    try:
+        with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_STORED) as zf:
+            seen: set[str] = set()
+            for file_name, storage_key, ts in files:
+                name = file_name
+                n = 1
+                while name in seen:
+                    stem, dot, ext = file_name.rpartition(".")
+                    name = f"{stem}_{n}.{ext}" if dot else f"{file_name}_{n}"
+                    n += 1
+                seen.add(name)
+
+                info = zipfile.ZipInfo(name, date_time=(ts or datetime.now()).timetuple()[:6])
+                info.compress_type = zipfile.ZIP_STORED
+                with zf.open(info, mode="w") as member:
+                    async for chunk in storage.iter_object_chunks(storage_key):
+                        member.write(chunk)
+                        data = _emit()
+                        if data:
+                            yield data
+                data = _emit()
+                if data:
+                    yield data
+        data = _emit()
+        if data:
+            yield data
+        completed = True
+
+        if spool is not None:
+            spool.seek(0)
+            try:
+                await storage.upload_fileobj(cache_key, spool, BUNDLE_CONTENT_TYPE)
+            except Exception as e:
+                # Cache is best-effort; the client already has the archive
+                log.warning("Report bundle cache upload failed for %s: %s", cache_key, e)
+    finally:
+        if spool is not None:
+            spool.close()
+        if not completed:
+            log.info("Report bundle stream aborted before completion (cache_key=%s)", cache_key)
@@ -7,16 +7,21 @@ Generates all 5 required output artifacts per Блок 3 spec:
   4. roadmap             — XLSX (Remediation Roadmap)
   5. evidence_checklist  — XLSX
 
-All data sourced exclusively from engine outputs.
+All data sourced exclusively from engine outputs, loaded once per package into a
+ReportSnapshot (report_snapshot.py) that every artifact is built from.
 AI used only for narrative sections of Executive Summary.
 Human review required before publish (enforced by status workflow).
 """
+import asyncio
+import hashlib
 import io
 import json
 import logging
+import multiprocessing
 import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Awaitable, Callable, Optional
 
 from openpyxl import Workbook
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
@@ -29,15 +34,11 @@ from reportlab.platypus import (
     SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, HRFlowable
 )
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
 
-from app.models.models import (
-    Assessment, Tenant, ControlResult, Gap, Risk,
-    RemediationAction, EvidenceLink, Control, Question, EvidenceFile
-)
+from app.models.models import Assessment, Tenant
 from app.core.config import settings
-from app.services.evidence_aggregator import recompute_control_aggregates
-from app.services.report_context_builder import build_full_report_context
+from app.services.report_context_builder import build_report_context
+from app.services.report_snapshot import ReportSnapshot, load_report_snapshot
 
 log = logging.getLogger(__name__)
 
@@ -93,28 +94,91 @@ def _auto_width(ws, min_width=12, max_width=60):
         ws.column_dimensions[col_letter].width = min(max_width, max(min_width, max_len + 2))
 
 
-# ── XLSX: Gap Register ─────────────────────────────────────────────────────────
+# ── Render pool ────────────────────────────────────────────────────────────────
+# ReportLab/openpyxl rendering is CPU-bound. generate_* coroutines load data (async DB)
+# into plain dicts and hand them to the pure render_* functions, which run in a
+# process pool (default), a thread pool, or inline — see REPORT_RENDER_* settings.
+
+_render_executor: Optional[Executor] = None
+
+
+def _get_render_executor() -> Optional[Executor]:
+    global _render_executor
+    mode = settings.REPORT_RENDER_EXECUTOR
+    if mode == "inline" or settings.REPORT_RENDER_POOL_SIZE <= 0:
+        return None
+    if _render_executor is None:
+        if mode == "thread":
+            _render_executor = ThreadPoolExecutor(
+                max_workers=settings.REPORT_RENDER_POOL_SIZE, thread_name_prefix="report-render",
+            )
+        else:
+            # spawn: do not fork the running event loop / DB pool into workers
+            _render_executor = ProcessPoolExecutor(
+                max_workers=settings.REPORT_RENDER_POOL_SIZE,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+    return _render_executor
+
+
+async def run_renderer(fn: Callable[..., bytes], *args) -> bytes:
+    """Run a pure render_* function in the render pool (inline if the pool is disabled)."""
+    executor = _get_render_executor()
+    if executor is None:
+        return fn(*args)
+    return await asyncio.get_running_loop().run_in_executor(executor, fn, *args)
+
+
+def shutdown_render_pool() -> None:
+    global _render_executor
+    if _render_executor is not None:
+        _render_executor.shutdown(wait=False, cancel_futures=True)
+        _render_executor = None
+
+
+# ── Content addressing ─────────────────────────────────────────────────────────
+# The XLSX artifacts are pure functions of their row input, so a hash of that input plus
+# the template version identifies the rendered file. Bump ARTIFACT_TEMPLATE_VERSION whenever
+# a render_* layout changes so previously stored artifacts are not reused.
+
+ARTIFACT_TEMPLATE_VERSION = "1"
 
-async def generate_gap_register(
-    assessment: Assessment,
-    tenant: Tenant,
-    db: AsyncSession,
-) -> bytes:
-    gaps_result = await db.execute(
-        select(Gap, Control)
-        .join(Control, Control.id == Gap.control_id)
-        .where(Gap.assessment_id == assessment.id)
-        .order_by(Gap.severity.desc(), Control.control_code)
-    )
-    rows = gaps_result.all()
 
-    # Evidence per control
-    ev_result = await db.execute(
-        select(EvidenceLink.control_id)
-        .where(EvidenceLink.assessment_id == assessment.id, EvidenceLink.control_id.is_not(None))
+def artifact_digest(file_type: str, rows: list[dict]) -> str:
+    payload = json.dumps(
+        {"template": ARTIFACT_TEMPLATE_VERSION, "file_type": file_type, "rows": rows},
+        sort_keys=True, separators=(",", ":"), default=str,
     )
-    controls_with_evidence = {r[0] for r in ev_result.all()}
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
 
+
+# ── XLSX: Gap Register ─────────────────────────────────────────────────────────
+
+def _gap_register_rows(snapshot: ReportSnapshot) -> list[dict]:
+    controls = snapshot.controls_by_id()
+    evidence = snapshot.evidence_by_control()
+    data = [
+        {
+            "control_code": controls[gap.control_id].control_code,
+            "category": controls[gap.control_id].category,
+            "title": controls[gap.control_id].title,
+            "status_source": gap.status_source,
+            "severity": gap.severity,
+            "description": gap.description,
+            "recommended_remediation": gap.recommended_remediation,
+            "evidence_provided": gap.control_id in evidence,
+        }
+        for gap in snapshot.gaps
+        if gap.control_id in controls
+    ]
+    return data
+
+
+async def generate_gap_register(snapshot: ReportSnapshot) -> bytes:
+    return await run_renderer(render_gap_register, _gap_register_rows(snapshot))
+
+
+def render_gap_register(rows: list[dict]) -> bytes:
     wb = Workbook()
     ws = wb.active
     ws.title = "Gap Register"
@@ -128,18 +192,17 @@ async def generate_gap_register(
     _style_header_row(ws, 1, len(headers))
     ws.row_dimensions[1].height = 30
 
-    for i, (gap, control) in enumerate(rows, start=2):
-        evidence_provided = "Yes" if control.id in controls_with_evidence else "No"
+    for i, gap in enumerate(rows, start=2):
         row = [
-            control.control_code,
-            f"45 CFR 164 — {control.category}",
-            control.title,
-            control.category,
-            gap.status_source,
-            gap.severity,
-            gap.description,
-            gap.recommended_remediation or "",
-            evidence_provided,
+            gap["control_code"],
+            f"45 CFR 164 — {gap['category']}",
+            gap["title"],
+            gap["category"],
+            gap["status_source"],
+            gap["severity"],
+            gap["description"],
+            gap["recommended_remediation"] or "",
+            "Yes" if gap["evidence_provided"] else "No",
         ]
         ws.append(row)
 
@@ -153,7 +216,7 @@ async def generate_gap_register(
 
         # Severity cell color
         sev_cell = ws.cell(row=i, column=6)
-        sev_cell.fill = _severity_fill(gap.severity)
+        sev_cell.fill = _severity_fill(gap["severity"])
         sev_cell.font = Font(bold=True, color="FFFFFF")
 
     _auto_width(ws)
@@ -166,20 +229,34 @@ async def generate_gap_register(
 
 # ── XLSX: Risk Register ────────────────────────────────────────────────────────
 
-async def generate_risk_register(
-    assessment: Assessment,
-    tenant: Tenant,
-    db: AsyncSession,
-) -> bytes:
-    risks_result = await db.execute(
-        select(Risk, Gap, Control)
-        .join(Gap, Gap.id == Risk.gap_id)
-        .join(Control, Control.id == Gap.control_id)
-        .where(Risk.assessment_id == assessment.id)
-        .order_by(Risk.severity.desc(), Control.control_code)
-    )
-    rows = risks_result.all()
-
+def _risk_register_rows(snapshot: ReportSnapshot) -> list[dict]:
+    controls = snapshot.controls_by_id()
+    gaps = snapshot.gaps_by_id()
+    data = []
+    for risk in snapshot.risks:
+        gap = gaps.get(risk.gap_id)
+        control = controls.get(gap.control_id) if gap else None
+        if control is None:
+            continue
+        data.append({
+            "control_code": control.control_code,
+            "title": control.title,
+            "severity": risk.severity,
+            "description": risk.description,
+            "rationale": risk.rationale,
+            "recommended_remediation": gap.recommended_remediation,
+        })
+    # ORDER BY severity DESC, control_code
+    data.sort(key=lambda r: r["control_code"])
+    data.sort(key=lambda r: r["severity"], reverse=True)
+    return data
+
+
+async def generate_risk_register(snapshot: ReportSnapshot) -> bytes:
+    return await run_renderer(render_risk_register, _risk_register_rows(snapshot))
+
+
+def render_risk_register(rows: list[dict]) -> bytes:
     wb = Workbook()
     ws = wb.active
     ws.title = "Risk Register"
@@ -192,15 +269,15 @@ async def generate_risk_register(
     _style_header_row(ws, 1, len(headers))
     ws.row_dimensions[1].height = 30
 
-    for i, (risk, gap, control) in enumerate(rows, start=2):
+    for i, risk in enumerate(rows, start=2):
         row = [
             f"RSK-{i - 1:03d}",
-            control.control_code,
-            control.title,
-            risk.severity,
-            risk.description,
-            risk.rationale or "",
-            gap.recommended_remediation or "",
+            risk["control_code"],
+            risk["title"],
+            risk["severity"],
+            risk["description"],
+            risk["rationale"] or "",
+            risk["recommended_remediation"] or "",
         ]
         ws.append(row)
 
@@ -212,7 +289,7 @@ async def generate_risk_register(
             cell.alignment = Alignment(wrap_text=True, vertical="top")
 
         sev_cell = ws.cell(row=i, column=4)
-        sev_cell.fill = _severity_fill(risk.severity)
+        sev_cell.fill = _severity_fill(risk["severity"])
         sev_cell.font = Font(bold=True, color="FFFFFF")
 
     _auto_width(ws)
@@ -225,20 +302,35 @@ async def generate_risk_register(
 
 # ── XLSX: Remediation Roadmap ──────────────────────────────────────────────────
 
-async def generate_roadmap(
-    assessment: Assessment,
-    tenant: Tenant,
-    db: AsyncSession,
-) -> bytes:
-    rem_result = await db.execute(
-        select(RemediationAction, Gap, Control)
-        .join(Gap, Gap.id == RemediationAction.gap_id)
-        .join(Control, Control.id == Gap.control_id)
-        .where(RemediationAction.assessment_id == assessment.id)
-        .order_by(RemediationAction.priority, Control.control_code)
-    )
-    rows = rem_result.all()
-
+def _roadmap_rows(snapshot: ReportSnapshot) -> list[dict]:
+    controls = snapshot.controls_by_id()
+    gaps = snapshot.gaps_by_id()
+    data = []
+    for rem in snapshot.remediations:
+        gap = gaps.get(rem.gap_id)
+        control = controls.get(gap.control_id) if gap else None
+        if control is None:
+            continue
+        data.append({
+            "control_code": control.control_code,
+            "title": control.title,
+            "priority": rem.priority,
+            "effort": rem.effort,
+            "remediation_type": rem.remediation_type,
+            "description": rem.description,
+            "dependency": rem.dependency,
+            "template_reference": rem.template_reference,
+        })
+    # ORDER BY priority, control_code
+    data.sort(key=lambda r: (r["priority"], r["control_code"]))
+    return data
+
+
+async def generate_roadmap(snapshot: ReportSnapshot) -> bytes:
+    return await run_renderer(render_roadmap, _roadmap_rows(snapshot))
+
+
+def render_roadmap(rows: list[dict]) -> bytes:
     wb = Workbook()
     ws = wb.active
     ws.title = "Remediation Roadmap"
@@ -259,18 +351,18 @@ async def generate_roadmap(
     _style_header_row(ws, 1, len(headers))
     ws.row_dimensions[1].height = 30
 
-    for i, (rem, gap, control) in enumerate(rows, start=2):
+    for i, rem in enumerate(rows, start=2):
         row = [
             f"ACT-{i - 1:03d}",
-            control.control_code,
-            control.title,
-            rem.priority,
-            PRIORITY_PHASE.get(rem.priority, ""),
-            rem.effort,
-            rem.remediation_type,
-            rem.description,
-            rem.dependency or "",
-            rem.template_reference or "",
+            rem["control_code"],
+            rem["title"],
+            rem["priority"],
+            PRIORITY_PHASE.get(rem["priority"], ""),
+            rem["effort"],
+            rem["remediation_type"],
+            rem["description"],
+            rem["dependency"] or "",
+            rem["template_reference"] or "",
         ]
         ws.append(row)
 
@@ -282,7 +374,7 @@ async def generate_roadmap(
             cell.alignment = Alignment(wrap_text=True, vertical="top")
 
         pri_cell = ws.cell(row=i, column=4)
-        pri_cell.fill = _severity_fill(rem.priority)
+        pri_cell.fill = _severity_fill(rem["priority"])
         pri_cell.font = Font(bold=True, color="FFFFFF")
 
     _auto_width(ws)
@@ -295,33 +387,33 @@ async def generate_roadmap(
 
 # ── XLSX: Evidence Checklist ───────────────────────────────────────────────────
 
-async def generate_evidence_checklist(
-    assessment: Assessment,
-    tenant: Tenant,
-    db: AsyncSession,
-) -> bytes:
-    # All controls
-    ctrl_result = await db.execute(
-        select(Control, ControlResult)
-        .join(ControlResult, (
-            (ControlResult.control_id == Control.id) &
-            (ControlResult.assessment_id == assessment.id)
-        ), isouter=True)
-        .where(Control.controlset_version_id == assessment.controlset_version_id)
-        .order_by(Control.control_code)
-    )
-    rows = ctrl_result.all()
+def _evidence_checklist_rows(snapshot: ReportSnapshot) -> list[dict]:
+    from app.services.engine import CONTROL_TEMPLATES, REMEDIATION_TEMPLATES
+
+    results = snapshot.results_by_control()
+    evidence = snapshot.evidence_by_control()
+    data = []
+    for control in snapshot.controls:
+        cr = results.get(control.id)
+        # Expected evidence hint
+        tmpl = REMEDIATION_TEMPLATES.get(CONTROL_TEMPLATES.get(control.control_code, ""), {})
+        data.append({
+            "control_code": control.control_code,
+            "title": control.title,
+            "category": control.category,
+            "severity": control.severity,
+            "status": cr.status if cr else "Unknown",
+            "evidence_type": tmpl.get("type", "Process"),
+            "files": list(evidence.get(control.id, ())),
+        })
+    return data
 
-    # Evidence per control
-    ev_result = await db.execute(
-        select(EvidenceLink.control_id, EvidenceFile.file_name)
-        .join(EvidenceFile, EvidenceFile.id == EvidenceLink.evidence_file_id)
-        .where(EvidenceLink.assessment_id == assessment.id, EvidenceLink.control_id.is_not(None))
-    )
-    ev_map: dict[str, list[str]] = {}
-    for ctrl_id, fname in ev_result.all():
-        ev_map.setdefault(ctrl_id, []).append(fname)
 
+async def generate_evidence_checklist(snapshot: ReportSnapshot) -> bytes:
+    return await run_renderer(render_evidence_checklist, _evidence_checklist_rows(snapshot))
+
+
+def render_evidence_checklist(rows: list[dict]) -> bytes:
     wb = Workbook()
     ws = wb.active
     ws.title = "Evidence Checklist"
@@ -340,18 +432,12 @@ async def generate_evidence_checklist(
     _style_header_row(ws, 1, len(headers))
     ws.row_dimensions[1].height = 30
 
-    for i, (control, cr) in enumerate(rows, start=2):
-        ctrl_status = cr.status if cr else "Unknown"
-        files = ev_map.get(control.id, [])
+    for i, control in enumerate(rows, start=2):
+        ctrl_status = control["status"]
+        files = control["files"]
         ev_provided = "Yes" if files else "No"
         files_str = "; ".join(files) if files else "—"
-
-        # Expected evidence hint
-        from app.services.engine import CONTROL_TEMPLATES, REMEDIATION_TEMPLATES
-        tmpl_id = CONTROL_TEMPLATES.get(control.control_code, "")
-        tmpl = REMEDIATION_TEMPLATES.get(tmpl_id, {})
-        ev_type = tmpl.get("type", "Process")
-        expected = EXPECTED_EVIDENCE.get(ev_type, "Documentation")
+        expected = EXPECTED_EVIDENCE.get(control["evidence_type"], "Documentation")
 
         # Status impact
         if ctrl_status == "Fail":
@@ -364,7 +450,7 @@ async def generate_evidence_checklist(
             impact = "None — control passing"
 
         row = [
-            control.control_code, control.title, control.category, control.severity,
+            control["control_code"], control["title"], control["category"], control["severity"],
             ctrl_status, expected, ev_provided, files_str, "", impact
         ]
         ws.append(row)
@@ -377,7 +463,7 @@ async def generate_evidence_checklist(
             cell.alignment = Alignment(wrap_text=True, vertical="top")
 
         if ctrl_status not in ("Pass",):
-            ws.cell(row=i, column=5).fill = _severity_fill(control.severity)
+            ws.cell(row=i, column=5).fill = _severity_fill(control["severity"])
             ws.cell(row=i, column=5).font = Font(bold=True, color="FFFFFF")
 
     _auto_width(ws)
@@ -610,7 +696,9 @@ async def generate_ai_narrative(
             prompt = _build_legacy_prompt(tenant, assessment, stats, top_gaps, ai_tone)
             max_tokens = 900
 
-        message = client.messages.create(
+        # Blocking SDK call — run off the event loop so other artifacts keep building
+        message = await asyncio.to_thread(
+            client.messages.create,
             model=settings.LLM_MODEL,
             max_tokens=max_tokens,
             messages=[{"role": "user", "content": prompt}],
@@ -667,57 +755,36 @@ by a qualified professional."""
 
 # ── PDF: Executive Summary ─────────────────────────────────────────────────────
 
+def _llm_available() -> bool:
+    return bool((getattr(settings, "ANTHROPIC_API_KEY", "") or "").strip()) or getattr(
+        settings, "LLM_ENABLED", False
+    )
+
+
 async def generate_executive_summary(
+    snapshot: ReportSnapshot,
     assessment: Assessment,
     tenant: Tenant,
-    db: AsyncSession,
     include_ai: bool = True,
     ai_tone: str = "neutral",
 ) -> bytes:
-    # Gather stats from DB
-    cr_result = await db.execute(
-        select(ControlResult).where(ControlResult.assessment_id == assessment.id)
-    )
-    control_results = cr_result.scalars().all()
-
+    results = [cr for _, cr in snapshot.results]
     stats = {
-        "total": len(control_results),
-        "pass": sum(1 for r in control_results if r.status == "Pass"),
-        "fail": sum(1 for r in control_results if r.status == "Fail"),
-        "partial": sum(1 for r in control_results if r.status == "Partial"),
-        "unknown": sum(1 for r in control_results if r.status == "Unknown"),
+        "total": len(results),
+        "pass": sum(1 for r in results if r.status == "Pass"),
+        "fail": sum(1 for r in results if r.status == "Fail"),
+        "partial": sum(1 for r in results if r.status == "Partial"),
+        "unknown": sum(1 for r in results if r.status == "Unknown"),
     }
 
-    gaps_result = await db.execute(
-        select(Gap).where(Gap.assessment_id == assessment.id)
-        .order_by(Gap.severity.desc())
-        .limit(15)
-    )
-    top_gaps = gaps_result.scalars().all()
+    top_gaps = list(snapshot.gaps[:15])
     stats["gaps"] = len(top_gaps)
 
     # Полный контекст для Claude: если включён AI и есть ключ или LLM_ENABLED
-    _llm_available = bool((getattr(settings, "ANTHROPIC_API_KEY", "") or "").strip()) or getattr(
-        settings, "LLM_ENABLED", False
-    )
-    if include_ai and _llm_available:
-        try:
-            await recompute_control_aggregates(
-                assessment_id=str(assessment.id),
-                tenant_id=str(assessment.tenant_id),
-                db=db,
-            )
-        except Exception:
-            pass
-
     full_context = None
-    if include_ai and _llm_available:
+    if include_ai and _llm_available():
         try:
-            full_context = await build_full_report_context(
-                assessment_id=str(assessment.id),
-                tenant_id=str(assessment.tenant_id),
-                db=db,
-            )
+            full_context = build_report_context(snapshot)
         except Exception:
             full_context = None
 
@@ -726,6 +793,23 @@ async def generate_executive_summary(
         full_context=full_context,
     )
 
+    return await run_renderer(render_executive_summary, {
+        "tenant_name": snapshot.tenant_name,
+        "submitted_at": snapshot.submitted_at,
+        "scope_note": snapshot.scope_note,
+        "stats": stats,
+        "narrative": narrative,
+        "used_claude": used_claude,
+        "top_gaps": [{"severity": g.severity, "description": g.description} for g in top_gaps],
+    })
+
+
+def render_executive_summary(data: dict) -> bytes:
+    stats = data["stats"]
+    narrative = data["narrative"]
+    used_claude = data["used_claude"]
+    top_gaps = data["top_gaps"]
+
     # Build PDF
     buf = io.BytesIO()
     doc = SimpleDocTemplate(
@@ -765,17 +849,16 @@ async def generate_executive_summary(
 
     story.append(Paragraph("HIPAA Security Rule Readiness Assessment", title_style))
     story.append(Paragraph("Executive Compliance Summary", subtitle_style))
-    story.append(Paragraph(f"Organization: <b>{tenant.name}</b>", subtitle_style))
-    report_date = assessment.submitted_at.strftime("%B %d, %Y") if assessment.submitted_at else "N/A"
+    story.append(Paragraph(f"Organization: <b>{data['tenant_name']}</b>", subtitle_style))
+    report_date = data["submitted_at"].strftime("%B %d, %Y") if data["submitted_at"] else "N/A"
     story.append(Paragraph(f"Assessment Date: {report_date}", subtitle_style))
     story.append(Paragraph(f"Report Generated: {datetime.now().strftime('%B %d, %Y')}", subtitle_style))
     story.append(HRFlowable(width="100%", thickness=2, color=colors.HexColor("#1A3A5C")))
     story.append(Spacer(1, 12))
 
     # Scope
-    scope_meta = assessment.metadata_ or {}
     story.append(Paragraph("Scope & Methodology", heading_style))
-    scope_note = scope_meta.get("scope_note", "Full organizational scope — all ePHI systems and workflows.")
+    scope_note = data["scope_note"]
     story.append(Paragraph(
         f"This assessment covers HIPAA Security Rule safeguards (Administrative, Physical, Technical) "
         f"and Vendor/Third-Party Management. Scope: {scope_note}. "
@@ -830,15 +913,15 @@ async def generate_executive_summary(
             story.append(Paragraph(para, body_style))
 
     # Top findings
-    critical_high = [g for g in top_gaps if g.severity in ("Critical", "High")][:8]
+    critical_high = [g for g in top_gaps if g["severity"] in ("Critical", "High")][:8]
     if critical_high:
         story.append(Paragraph("Critical & High Priority Findings", heading_style))
         findings_data = [["Severity", "Control", "Gap Description"]]
         for gap in critical_high:
             # Get control code via query would require async — use description prefix
-            d = gap.description or ""
+            d = gap["description"] or ""
             desc = (d[:100] + "...") if len(d) > 100 else d
-            findings_data.append([gap.severity, "—", desc])
+            findings_data.append([gap["severity"], "—", desc])
 
         findings_table = Table(findings_data, colWidths=[1 * inch, 1.2 * inch, 4.3 * inch])
         sev_colors_map = {
@@ -886,29 +969,52 @@ async def generate_all_reports(
     db: AsyncSession,
     include_ai: bool = True,
     ai_tone: str = "neutral",
+    on_artifact: Optional[Callable[[str, bytes, Optional[str]], Awaitable[None]]] = None,
+    reuse_artifact: Optional[Callable[[str, str], Awaitable[bool]]] = None,
 ) -> dict[str, bytes]:
     """
-    Generate all 5 required report artifacts.
-    Returns dict: {file_type: bytes}
+    Generate all 5 required report artifacts concurrently.
+    Data is loaded once into a ReportSnapshot; every artifact is built from it without
+    further queries, and rendering runs in the render pool.
+    on_artifact(file_type, data, digest) is awaited as soon as each artifact is ready (e.g. upload);
+    digest is the artifact_digest of an XLSX artifact, None for the executive summary (dated, AI narrative).
+    reuse_artifact(file_type, digest) is awaited before rendering an XLSX artifact; returning True
+    means an identical artifact is already stored and rendering/on_artifact are skipped.
+    Returns dict: {file_type: bytes} for the artifacts actually rendered.
     """
-    cr_count_result = await db.execute(
-        select(func.count()).select_from(ControlResult).where(
-            ControlResult.assessment_id == assessment.id
-        )
+    # ControlEvidenceAggregate rows are kept current as analysis results are added
+    # (evidence_aggregator.apply_result_deltas), so they are read as-is
+    with_ai = include_ai and _llm_available()
+
+    snapshot = await load_report_snapshot(
+        str(assessment.id), str(assessment.tenant_id), db, include_context=with_ai,
     )
-    if cr_count_result.scalar_one() == 0:
+    if not snapshot.results:
         raise ValueError(
             "No control results found for this assessment. Run the compliance engine before generating reports."
         )
 
-    results = {}
-
-    results["executive_summary"] = await generate_executive_summary(
-        assessment, tenant, db, include_ai, ai_tone
-    )
-    results["gap_register"] = await generate_gap_register(assessment, tenant, db)
-    results["risk_register"] = await generate_risk_register(assessment, tenant, db)
-    results["roadmap"] = await generate_roadmap(assessment, tenant, db)
-    results["evidence_checklist"] = await generate_evidence_checklist(assessment, tenant, db)
+    tables = {
+        "gap_register": (render_gap_register, _gap_register_rows),
+        "risk_register": (render_risk_register, _risk_register_rows),
+        "roadmap": (render_roadmap, _roadmap_rows),
+        "evidence_checklist": (render_evidence_checklist, _evidence_checklist_rows),
+    }
 
-    return results
+    async def _build(file_type: str) -> tuple[str, Optional[bytes]]:
+        if file_type == "executive_summary":
+            data = await generate_executive_summary(snapshot, assessment, tenant, include_ai, ai_tone)
+            digest = None
+        else:
+            render, rows_for = tables[file_type]
+            rows = rows_for(snapshot)
+            digest = artifact_digest(file_type, rows)
+            if reuse_artifact is not None and await reuse_artifact(file_type, digest):
+                return file_type, None
+            data = await run_renderer(render, rows)
+        if on_artifact is not None:
+            await on_artifact(file_type, data, digest)
+        return file_type, data
+
+    pairs = await asyncio.gather(*(_build(ft) for ft in ("executive_summary", *tables)))
+    return {ft: data for ft, data in pairs if data is not None}
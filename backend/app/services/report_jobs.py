@@ -0,0 +1,198 @@
+"""
+Report package generation as a background job (job_type "report_generate").
+POST /reports/packages/{id}/generate enqueues; a job worker runs the engine, builds the
+5 artifacts concurrently and uploads each one as soon as it is ready.
+Artifact keys are content-addressed, so a run never overwrites an object a committed ReportFile
+points at. XLSX keys use the input digest: when that object already exists it is reused as-is
+(no render, no upload); the PDF is keyed by the sha256 of its bytes.
+Superseded objects are deleted by a follow-up "report_cleanup" job enqueued in the same
+transaction that swaps the ReportFile rows — it only exists if that transaction commits.
+
+Progress (background_jobs.progress), one key per step:
+  engine                              pending | running | done
+  executive_summary, gap_register,
+  risk_register, roadmap,
+  evidence_checklist                  pending | rendering | uploading | done  (reused → done)
+"""
+import hashlib
+from datetime import datetime, timezone
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.models import Assessment, Tenant, ReportPackage, ReportFile, BackgroundJob
+from app.schemas.schemas import GenerateReportPackageResponse, ReportFileItem
+from app.services import storage
+from app.services.audit import log_event
+from app.services.engine import run_engine_incremental
+from app.services.job_queue import enqueue_job, register_job_handler, set_job_progress, PermanentJobError
+from app.services.report_generator import generate_all_reports
+
+REPORT_GENERATE_JOB = "report_generate"
+REPORT_CLEANUP_JOB = "report_cleanup"
+
+# File type → format mapping
+REQUIRED_FILE_TYPES = {
+    "executive_summary": "PDF",
+    "gap_register": "XLSX",
+    "risk_register": "XLSX",
+    "roadmap": "XLSX",
+    "evidence_checklist": "XLSX",
+}
+
+CONTENT_TYPES = {
+    "PDF": "application/pdf",
+    "XLSX": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "DOCX": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+}
+
+FILE_EXTENSIONS = {"PDF": "pdf", "XLSX": "xlsx", "DOCX": "docx"}
+
+
+def initial_progress() -> dict:
+    return {"engine": "pending", **{ft: "pending" for ft in REQUIRED_FILE_TYPES}}
+
+
+async def _on_report_generation_failed(job: BackgroundJob, db: AsyncSession, error: str) -> None:
+    await log_event(
+        db, "report_generation_failed",
+        tenant_id=job.tenant_id, user_id=job.requested_by_user_id,
+        entity_type="report_package", entity_id=job.entity_id,
+        payload={"job_id": job.id, "attempts": job.attempts, "error": error},
+    )
+
+
+@register_job_handler(REPORT_GENERATE_JOB, on_failure=_on_report_generation_failed)
+async def execute_report_generation(job: BackgroundJob, db: AsyncSession) -> dict:
+    options = job.payload or {}
+    pkg = await db.get(ReportPackage, job.entity_id)
+    if pkg is None or pkg.tenant_id != job.tenant_id:
+        raise PermanentJobError("Report package not found")
+    if pkg.status == "published":
+        raise PermanentJobError("Cannot regenerate a published report package.")
+    assessment = await db.get(Assessment, pkg.assessment_id)
+    tenant = await db.get(Tenant, job.tenant_id)
+
+    # Run engine first so report and percentage reflect latest answers + evidence.
+    # Incremental: only controls touched since the last run are re-evaluated.
+    await set_job_progress(job.id, {"engine": "running"})
+    await run_engine_incremental(assessment, db)
+
+    # Persist engine outputs before the long render/upload phase (no row locks held meanwhile).
+    # The package's current ReportFile rows stay until every new artifact is uploaded, so a
+    # failed or cancelled run leaves the previous files downloadable.
+    await db.commit()
+    await set_job_progress(job.id, {"engine": "done", **{ft: "rendering" for ft in REQUIRED_FILE_TYPES}})
+
+    uploaded: dict[str, tuple[str, str, str, int]] = {}
+    reused: list[str] = []
+
+    def _file_name(file_type: str, fmt: str) -> str:
+        return f"{file_type}_{assessment.id[:8]}.{FILE_EXTENSIONS[fmt]}"
+
+    async def _reuse(file_type: str, digest: str) -> bool:
+        fmt = REQUIRED_FILE_TYPES.get(file_type, "XLSX")
+        storage_key = storage.generate_artifact_key(job.tenant_id, pkg.assessment_id, file_type, digest, fmt)
+        meta = await storage.head_object(storage_key)
+        if meta is None:
+            return False
+        uploaded[file_type] = (fmt, _file_name(file_type, fmt), storage_key, int(meta["ContentLength"]))
+        reused.append(file_type)
+        await set_job_progress(job.id, {file_type: "done"})
+        return True
+
+    async def _upload(file_type: str, data: bytes, digest: str | None) -> None:
+        await set_job_progress(job.id, {file_type: "uploading"})
+        fmt = REQUIRED_FILE_TYPES.get(file_type, "XLSX")
+        # No input digest (PDF): key by the bytes, never overwrite the live object in place
+        digest = digest or hashlib.sha256(data).hexdigest()
+        storage_key = storage.generate_artifact_key(job.tenant_id, pkg.assessment_id, file_type, digest, fmt)
+        await storage.upload_bytes(storage_key, data, CONTENT_TYPES[fmt])
+        uploaded[file_type] = (fmt, _file_name(file_type, fmt), storage_key, len(data))
+        await set_job_progress(job.id, {file_type: "done"})
+
+    await generate_all_reports(
+        assessment=assessment,
+        tenant=tenant,
+        db=db,
+        include_ai=options.get("include_ai", True),
+        ai_tone=options.get("ai_tone") or "neutral",
+        on_artifact=_upload,
+        reuse_artifact=_reuse,
+    )
+
+    # Validate required files present (per spec: Validation_Rules_v1 section 7.2)
+    missing = set(REQUIRED_FILE_TYPES) - set(uploaded)
+    if missing:
+        raise ValueError(f"Required file types not generated: {missing}")
+
+    # Swap the package's file rows in the final transaction (committed with the job status).
+    # Superseded objects are removed only if no longer referenced — unchanged artifacts are reused.
+    existing_files = await db.execute(
+        select(ReportFile).where(ReportFile.package_id == pkg.id)
+    )
+    previous_keys = set()
+    for f in existing_files.scalars().all():
+        previous_keys.add(f.storage_key)
+        await db.delete(f)
+    await db.flush()
+
+    file_records = []
+    for file_type, (fmt, file_name, storage_key, size) in uploaded.items():
+        rf = ReportFile(
+            package_id=pkg.id,
+            tenant_id=job.tenant_id,
+            file_type=file_type,
+            format=fmt,
+            storage_key=storage_key,
+            file_name=file_name,
+            size_bytes=size,
+        )
+        db.add(rf)
+        await db.flush()
+        file_records.append(ReportFileItem(
+            id=rf.id, file_type=file_type, format=fmt, file_name=file_name, size_bytes=size,
+        ))
+
+    # Superseded objects are deleted only after this transaction commits (report_cleanup job)
+    stale_keys = previous_keys - {key for _, _, key, _ in uploaded.values()}
+    if stale_keys:
+        await enqueue_job(
+            db, job.tenant_id, REPORT_CLEANUP_JOB,
+            entity_type="report_package", entity_id=pkg.id,
+            payload={"storage_keys": sorted(stale_keys)},
+        )
+
+    # Transition to generated
+    now = datetime.now(timezone.utc)
+    pkg.status = "generated"
+    pkg.updated_at = now
+
+    await log_event(
+        db, "report_generation_completed",
+        tenant_id=job.tenant_id, user_id=job.requested_by_user_id,
+        entity_type="report_package", entity_id=pkg.id,
+        payload={"job_id": job.id, "file_count": len(file_records), "reused": sorted(reused)},
+    )
+
+    return GenerateReportPackageResponse(
+        report_package_id=pkg.id,
+        status="generated",
+        generated_at=now,
+        files=file_records,
+    ).model_dump(mode="json")
+
+
+@register_job_handler(REPORT_CLEANUP_JOB)
+async def execute_report_cleanup(job: BackgroundJob, db: AsyncSession) -> dict:
+    """Delete report objects superseded by a committed generation, unless a ReportFile points at them again."""
+    keys = set((job.payload or {}).get("storage_keys") or [])
+    if not keys:
+        return {"deleted": 0}
+    still_referenced = set((
+        await db.execute(select(ReportFile.storage_key).where(ReportFile.storage_key.in_(keys)))
+    ).scalars().all())
+    stale = sorted(keys - still_referenced)
+    for key in stale:
+        await storage.delete_object(key)
+    return {"deleted": len(stale), "kept": len(keys) - len(stale)}
@@ -0,0 +1,298 @@
+"""
+Report Snapshot — all rows a report package needs, loaded once.
+
+load_report_snapshot() fetches engine outputs, controls, evidence, aggregates and agent data
+for one assessment in a fixed handful of queries and returns an immutable ReportSnapshot.
+The five artifact builders (report_generator) and build_report_context()
+(report_context_builder) are pure functions of the snapshot — no further DB access.
+"""
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import select, desc, or_, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.models import (
+    Assessment, Tenant, ControlResult, Gap, Risk, RemediationAction,
+    EvidenceLink, EvidenceFile,
+)
+from app.db import loaders
+from app.models.ai_evidence import ControlEvidenceAggregate
+from app.models.ingest import IngestReceipt
+from app.services.reference_data import get_reference_cache
+
+
+@dataclass(frozen=True, slots=True)
+class ControlRow:
+    id: str
+    control_code: str
+    title: str
+    category: str
+    severity: str
+
+
+@dataclass(frozen=True, slots=True)
+class ControlResultRow:
+    control_id: str
+    status: str
+    severity: str
+    rationale: Optional[str]
+
+
+@dataclass(frozen=True, slots=True)
+class GapRow:
+    id: str
+    control_id: str
+    status_source: str
+    severity: str
+    description: str
+    recommended_remediation: Optional[str]
+
+
+@dataclass(frozen=True, slots=True)
+class RiskRow:
+    gap_id: str
+    severity: str
+    description: str
+    rationale: Optional[str]
+
+
+@dataclass(frozen=True, slots=True)
+class RemediationRow:
+    gap_id: str
+    priority: str
+    effort: str
+    remediation_type: str
+    description: str
+    dependency: Optional[str]
+    template_reference: Optional[str]
+
+
+@dataclass(frozen=True, slots=True)
+class AggregateRow:
+    status: str
+    evidence_count: int
+    avg_strength: Optional[float]
+    findings_summary: tuple
+
+
+@dataclass(frozen=True, slots=True)
+class ReportSnapshot:
+    tenant_id: str
+    tenant_name: str
+    assessment_id: str
+    submitted_at: Optional[datetime]
+    scope_note: str
+    controls: tuple[ControlRow, ...]                       # controlset, ordered by control_code
+    results: tuple[tuple[str, ControlResultRow], ...]      # (control_id, result), engine order
+    gaps: tuple[GapRow, ...]                               # severity desc, control_code
+    risks: tuple[RiskRow, ...]
+    remediations: tuple[RemediationRow, ...]
+    evidence_files: tuple[tuple[str, tuple[str, ...]], ...]  # (control_id, file names)
+    aggregates: tuple[tuple[str, AggregateRow], ...] = ()
+    agent_snapshot: Optional[dict] = None
+    previous_assessment: Optional[dict] = None
+
+    def controls_by_id(self) -> dict[str, ControlRow]:
+        return {c.id: c for c in self.controls}
+
+    def results_by_control(self) -> dict[str, ControlResultRow]:
+        return dict(self.results)
+
+    def gaps_by_id(self) -> dict[str, GapRow]:
+        return {g.id: g for g in self.gaps}
+
+    def evidence_by_control(self) -> dict[str, tuple[str, ...]]:
+        return dict(self.evidence_files)
+
+    def aggregates_by_control(self) -> dict[str, AggregateRow]:
+        return dict(self.aggregates)
+
+
+async def load_report_snapshot(
+    assessment_id: str,
+    tenant_id: str,
+    db: AsyncSession,
+    include_context: bool = True,
+) -> ReportSnapshot:
+    """
+    include_context=False skips the Claude-only data (evidence aggregates, agent receipt,
+    previous assessment) when the package is built without AI narrative.
+    """
+    # Identity map: no query when the caller (report job, route) already loaded these rows
+    assessment = await loaders.get_assessment(db, assessment_id)
+    if assessment is None:
+        raise ValueError(f"Assessment {assessment_id} not found")
+    # HIPAA multi-tenant isolation: snapshot only for one tenant
+    if str(assessment.tenant_id) != str(tenant_id):
+        raise ValueError(
+            f"Tenant isolation violation: assessment {assessment_id} "
+            f"belongs to tenant {assessment.tenant_id}, not {tenant_id}"
+        )
+    tenant = await loaders.get_tenant(db, tenant_id)
+
+    controls = tuple(
+        ControlRow(c.id, c.control_code, c.title, c.category, c.severity)
+        for c in (await get_reference_cache().controls(db, assessment.controlset_version_id)).controls
+    )
+    code_by_id = {c.id: c.control_code for c in controls}
+
+    results = tuple(
+        (cr.control_id, ControlResultRow(cr.control_id, cr.status, cr.severity, cr.rationale))
+        for cr in (
+            await db.execute(select(ControlResult).where(ControlResult.assessment_id == assessment_id))
+        ).scalars().all()
+    )
+
+    gap_rows = [
+        GapRow(g.id, g.control_id, g.status_source, g.severity, g.description, g.recommended_remediation)
+        for g in (
+            await db.execute(select(Gap).where(Gap.assessment_id == assessment_id))
+        ).scalars().all()
+    ]
+    # Same order as ORDER BY severity DESC, control_code
+    gap_rows.sort(key=lambda g: code_by_id.get(g.control_id, ""))
+    gap_rows.sort(key=lambda g: g.severity, reverse=True)
+
+    risks = tuple(
+        RiskRow(r.gap_id, r.severity, r.description, r.rationale)
+        for r in (
+            await db.execute(select(Risk).where(Risk.assessment_id == assessment_id))
+        ).scalars().all()
+    )
+    remediations = tuple(
+        RemediationRow(
+            r.gap_id, r.priority, r.effort, r.remediation_type, r.description,
+            r.dependency, r.template_reference,
+        )
+        for r in (
+            await db.execute(select(RemediationAction).where(RemediationAction.assessment_id == assessment_id))
+        ).scalars().all()
+    )
+
+    ev_map: dict[str, list[str]] = {}
+    for ctrl_id, fname in (
+        await db.execute(
+            select(EvidenceLink.control_id, EvidenceFile.file_name)
+            .join(EvidenceFile, EvidenceFile.id == EvidenceLink.evidence_file_id)
+            .where(EvidenceLink.assessment_id == assessment_id, EvidenceLink.control_id.is_not(None))
+        )
+    ).all():
+        ev_map.setdefault(ctrl_id, []).append(fname)
+
+    aggregates: tuple = ()
+    agent_snapshot = None
+    previous = None
+    if include_context:
+        aggregates = tuple(
+            (
+                str(a.control_id),
+                AggregateRow(a.status, a.evidence_count, a.avg_strength, tuple(a.findings_summary or ())),
+            )
+            for a in (
+                await db.execute(
+                    select(ControlEvidenceAggregate).where(
+                        ControlEvidenceAggregate.assessment_id == assessment_id,
+                        ControlEvidenceAggregate.tenant_id == tenant_id,
+                    )
+                )
+            ).scalars().all()
+        )
+        agent_snapshot = await _load_agent_snapshot(tenant, db)
+        previous = await _load_previous_assessment(assessment, db)
+
+    return ReportSnapshot(
+        tenant_id=tenant_id,
+        tenant_name=tenant.name if tenant else "Unknown",
+        assessment_id=assessment_id,
+        submitted_at=assessment.submitted_at,
+        scope_note=(assessment.metadata_ or {}).get(
+            "scope_note", "Full organizational scope — all ePHI systems and workflows."
+        ),
+        controls=controls,
+        results=results,
+        gaps=tuple(gap_rows),
+        risks=risks,
+        remediations=remediations,
+        evidence_files=tuple((cid, tuple(sorted(files))) for cid, files in ev_map.items()),
+        aggregates=aggregates,
+        agent_snapshot=agent_snapshot,
+        previous_assessment=previous,
+    )
+
+
+async def _load_agent_snapshot(tenant: Optional[Tenant], db: AsyncSession) -> Optional[dict]:
+    """Последние данные с агента (для блока «данные агента» в отчёте)."""
+    client_org_id = ((tenant.client_org_id if tenant else None) or "").strip()
+    if not client_org_id:
+        return None
+    receipt_row = (
+        await db.execute(
+            select(IngestReceipt)
+            .where(
+                IngestReceipt.client_org_id == client_org_id,
+                IngestReceipt.status == "ACCEPTED",
+                or_(
+                    IngestReceipt.manifest_payload.isnot(None),
+                    IngestReceipt.snapshot_data.isnot(None),
+                ),
+            )
+            .order_by(desc(IngestReceipt.received_at_utc))
+            .limit(1)
+        )
+    ).scalar_one_or_none()
+    if not receipt_row:
+        return None
+    return {
+        "receipt_id": receipt_row.receipt_id,
+        "received_at_utc": (
+            receipt_row.received_at_utc.isoformat()
+            if receipt_row.received_at_utc
+            else None
+        ),
+        "agent_version": receipt_row.agent_version,
+        "manifest_payload": receipt_row.manifest_payload,
+        "snapshot_data": receipt_row.snapshot_data,
+    }
+
+
+async def _load_previous_assessment(assessment: Assessment, db: AsyncSession) -> Optional[dict]:
+    """Предыдущий assessment (remediation delta): score + gap count in two queries."""
+    prev = (
+        await db.execute(
+            select(Assessment)
+            .where(
+                Assessment.tenant_id == assessment.tenant_id,
+                Assessment.id != assessment.id,
+            )
+            .order_by(desc(Assessment.created_at))
+            .limit(1)
+        )
+    ).scalar_one_or_none()
+    if not prev:
+        return None
+
+    prev_total, prev_pass = (
+        await db.execute(
+            select(
+                func.count(),
+                func.count().filter(ControlResult.status == "Pass"),
+            ).where(ControlResult.assessment_id == prev.id)
+        )
+    ).one()
+    prev_gaps = (
+        await db.execute(select(Gap.description).where(Gap.assessment_id == prev.id))
+    ).scalars().all()
+
+    return {
+        "assessment_id": str(prev.id),
+        "assessment_date": (
+            prev.submitted_at.isoformat()
+            if prev.submitted_at
+            else prev.created_at.isoformat()
+        ),
+        "score_percent": round(prev_pass / prev_total * 100) if prev_total else 0,
+        "total_gaps": len(prev_gaps),
+        "gap_descriptions": [d for d in prev_gaps[:8] if d],
+    }
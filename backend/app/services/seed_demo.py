@@ -9,6 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.core.auth import hash_password
+from app.services.engine import mark_controls_dirty
 from app.models.models import (
     Framework, ControlsetVersion, RulesetVersion,
     User, Tenant, TenantMember, Assessment, Question, Answer,
@@ -201,6 +202,7 @@ async def run_seed_demo_client(db: AsyncSession) -> dict:
     questions = {q.question_code: q for q in r.scalars().all()}
 
     created = 0
+    dirty_control_ids = set()
     for q_code, value in ANSWERS_BY_QUESTION_CODE.items():
         q = questions.get(q_code)
         if not q:
@@ -221,6 +223,7 @@ async def run_seed_demo_client(db: AsyncSession) -> dict:
                     updated_by_user_id=client_user.id,
                 )
             )
+            dirty_control_ids.add(q.control_id)
             created += 1
     await db.flush()
 
@@ -261,8 +264,12 @@ async def run_seed_demo_client(db: AsyncSession) -> dict:
                 control_id=ctrl.id,
             )
             db.add(link)
+            dirty_control_ids.add(ctrl.id)
         await db.flush()
 
+    # Same contract as the answer / evidence-link routes: the next engine run re-evaluates these
+    await mark_controls_dirty(db, tenant.id, assessment.id, dirty_control_ids, reason="seed")
+
     return {
         "tenant_id": tenant.id,
         "tenant_name": DEMO_TENANT_NAME,
@@ -23,7 +23,8 @@ from reportlab.platypus import (
     TableStyle,
 )
 
-from app.models.models import EvidenceFile, Control, Tenant
+from app.db import loaders
+from app.models.models import EvidenceFile
 from app.models.workflow import SelfAttestation, AuditChecklistItem, ControlRequiredEvidence
 from app.services import storage
 from app.services.audit import log_event
@@ -49,12 +50,8 @@ async def create_self_attestation(
     """
     now = datetime.now(timezone.utc)
 
-    tenant = (
-        await db.execute(select(Tenant).where(Tenant.id == tenant_id))
-    ).scalar_one_or_none()
-    control = (
-        await db.execute(select(Control).where(Control.id == control_id))
-    ).scalar_one_or_none()
+    tenant = await loaders.get_tenant(db, tenant_id)
+    control = await loaders.get_control(db, control_id)
     req_evidence = (
         await db.execute(
             select(ControlRequiredEvidence).where(
@@ -115,7 +112,7 @@ async def create_self_attestation(
 
     safe_name = f"{control.control_code}_{req_evidence.artifact_name}".replace(" ", "_")[:80]
     storage_key = f"attestations/{tenant_id}/{assessment_id}/{safe_name}_{str(attestation.id)[:8]}.pdf"
-    storage.upload_bytes(storage_key, pdf_bytes, "application/pdf")
+    await storage.upload_bytes(storage_key, pdf_bytes, "application/pdf")
 
     file_name = f"Self_Attestation_{safe_name}.pdf"
     evidence_file = EvidenceFile(
@@ -125,6 +122,7 @@ async def create_self_attestation(
         content_type="application/pdf",
         size_bytes=len(pdf_bytes),
         storage_key=storage_key,
+        sha256=cert_hash,
         tags=[control.control_code] if control.control_code else None,
         admin_comment=(
             f"Self-attested by {attested_by_name}"
@@ -2,15 +2,24 @@
 Storage service — MinIO / S3-compatible
 Generates presigned upload and download URLs.
 All file access goes through signed URLs — never direct.
+
+One boto3 client per process (thread-safe, pooled HTTP connections). Presigning is a local
+HMAC computation and stays synchronous; object I/O (upload/get/delete) is async and runs on
+a dedicated thread pool sized to the connection pool, so it never blocks the event loop.
 """
+import asyncio
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache, partial
+from typing import AsyncIterator
 import boto3
 from botocore.config import Config
 from botocore.exceptions import ClientError
 from app.core.config import settings
 
 
+@lru_cache(maxsize=1)
 def _get_client():
     return boto3.client(
         "s3",
@@ -18,10 +27,38 @@ def _get_client():
         aws_access_key_id=settings.STORAGE_ACCESS_KEY,
         aws_secret_access_key=settings.STORAGE_SECRET_KEY,
         region_name=settings.STORAGE_REGION,
-        config=Config(signature_version="s3v4"),
+        config=Config(
+            signature_version="s3v4",
+            max_pool_connections=settings.STORAGE_MAX_POOL_CONNECTIONS,
+            connect_timeout=settings.STORAGE_CONNECT_TIMEOUT,
+            read_timeout=settings.STORAGE_READ_TIMEOUT,
+            retries={"max_attempts": 3, "mode": "standard"},
+            tcp_keepalive=True,
+        ),
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_executor() -> ThreadPoolExecutor:
+    return ThreadPoolExecutor(
+        max_workers=settings.STORAGE_MAX_POOL_CONNECTIONS,
+        thread_name_prefix="storage",
     )
 
 
+async def _run(fn, *args, **kwargs):
+    """Run a blocking boto3 call on the storage thread pool."""
+    return await asyncio.get_running_loop().run_in_executor(
+        _get_executor(), partial(fn, *args, **kwargs)
+    )
+
+
+def shutdown() -> None:
+    if _get_executor.cache_info().currsize:
+        _get_executor().shutdown(wait=False)
+        _get_executor.cache_clear()
+
+
 def generate_storage_key(tenant_id: str, file_name: str) -> str:
     """Generate a unique storage key scoped to tenant."""
     ext = file_name.rsplit(".", 1)[-1].lower() if "." in file_name else "bin"
@@ -34,6 +71,11 @@ def generate_report_key(tenant_id: str, assessment_id: str, file_type: str, fmt:
     return f"reports/{tenant_id}/{assessment_id}/{file_type}.{fmt.lower()}"
 
 
+def generate_artifact_key(tenant_id: str, assessment_id: str, file_type: str, digest: str, fmt: str) -> str:
+    """Content-addressed storage key for a report artifact (digest = report_generator.artifact_digest)."""
+    return f"reports/{tenant_id}/{assessment_id}/{file_type}-{digest}.{fmt.lower()}"
+
+
 def generate_certificate_key(tenant_id: str, assignment_id: str) -> str:
     """Generate storage key for training certificate PDF."""
     return f"training/{tenant_id}/certificates/{assignment_id}.pdf"
@@ -74,19 +116,15 @@ def create_presigned_download_url(storage_key: str, file_name: str = None, expir
     return url
 
 
-def delete_object(storage_key: str) -> None:
-    """Delete object from storage."""
-    client = _get_client()
+def _delete_object_sync(storage_key: str) -> None:
     try:
-        client.delete_object(Bucket=settings.STORAGE_BUCKET, Key=storage_key)
+        _get_client().delete_object(Bucket=settings.STORAGE_BUCKET, Key=storage_key)
     except ClientError:
         pass  # non-blocking
 
 
-def upload_bytes(storage_key: str, data: bytes, content_type: str) -> None:
-    """Upload bytes directly from server (used for report generation)."""
-    client = _get_client()
-    client.put_object(
+def _upload_bytes_sync(storage_key: str, data: bytes, content_type: str) -> None:
+    _get_client().put_object(
         Bucket=settings.STORAGE_BUCKET,
         Key=storage_key,
         Body=data,
@@ -94,13 +132,91 @@ def upload_bytes(storage_key: str, data: bytes, content_type: str) -> None:
     )
 
 
-def get_object_bytes(storage_key: str) -> bytes:
-    """Fetch object from storage and return bytes (for proxy download)."""
-    client = _get_client()
-    resp = client.get_object(Bucket=settings.STORAGE_BUCKET, Key=storage_key)
+def _get_object_bytes_sync(storage_key: str) -> bytes:
+    resp = _get_client().get_object(Bucket=settings.STORAGE_BUCKET, Key=storage_key)
     return resp["Body"].read()
 
 
+def _head_object_sync(storage_key: str) -> dict | None:
+    try:
+        return _get_client().head_object(Bucket=settings.STORAGE_BUCKET, Key=storage_key)
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+            return None
+        raise
+
+
+def _upload_fileobj_sync(storage_key: str, fileobj, content_type: str) -> None:
+    _get_client().upload_fileobj(
+        fileobj, settings.STORAGE_BUCKET, storage_key,
+        ExtraArgs={"ContentType": content_type},
+    )
+
+
+async def delete_object(storage_key: str) -> None:
+    """Delete object from storage."""
+    await _run(_delete_object_sync, storage_key)
+
+
+async def upload_bytes(storage_key: str, data: bytes, content_type: str) -> None:
+    """Upload bytes directly from server (used for report generation)."""
+    await _run(_upload_bytes_sync, storage_key, data, content_type)
+
+
+async def get_object_bytes(storage_key: str) -> bytes:
+    """Fetch object from storage and return bytes (for proxy download)."""
+    return await _run(_get_object_bytes_sync, storage_key)
+
+
+async def head_object(storage_key: str) -> dict | None:
+    """Object metadata (ContentLength, ETag, LastModified, ContentType) or None if missing."""
+    return await _run(_head_object_sync, storage_key)
+
+
+async def upload_fileobj(storage_key: str, fileobj, content_type: str) -> None:
+    """Upload from a file-like object (multipart for large bodies, bounded memory)."""
+    await _run(_upload_fileobj_sync, storage_key, fileobj, content_type)
+
+
+async def open_object_stream(
+    storage_key: str,
+    byte_range: str | None = None,
+    if_match: str | None = None,
+    chunk_size: int = None,
+) -> tuple[dict, AsyncIterator[bytes]]:
+    """
+    GET an object and return (response metadata, async chunk iterator).
+    The request is made before returning, so storage errors surface before any
+    response headers are sent. byte_range is an HTTP Range value ("bytes=0-99");
+    if_match pins the read to the ETag seen by a preceding head_object().
+    """
+    params = {"Bucket": settings.STORAGE_BUCKET, "Key": storage_key}
+    if byte_range:
+        params["Range"] = byte_range
+    if if_match:
+        params["IfMatch"] = if_match
+    resp = await _run(_get_client().get_object, **params)
+    return resp, _iter_body(resp["Body"], chunk_size or settings.STORAGE_STREAM_CHUNK_BYTES)
+
+
+async def _iter_body(body, chunk_size: int) -> AsyncIterator[bytes]:
+    try:
+        while True:
+            chunk = await _run(body.read, chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    finally:
+        body.close()
+
+
+async def iter_object_chunks(storage_key: str, chunk_size: int = None) -> AsyncIterator[bytes]:
+    """Stream an object in chunks without loading it into memory."""
+    _, chunks = await open_object_stream(storage_key, chunk_size=chunk_size)
+    async for chunk in chunks:
+        yield chunk
+
+
 def get_presign_expiry_datetime(expires_in: int = None) -> datetime:
     expires_in = expires_in or settings.STORAGE_PRESIGN_EXPIRY
     return datetime.now(timezone.utc) + timedelta(seconds=expires_in)
@@ -8,8 +8,9 @@ Checks:
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
-from app.models.models import Assessment, Answer, Question
+from app.models.models import Assessment, Answer
 from app.core.config import settings
+from app.services.reference_data import get_reference_cache
 
 
 # Critical question codes that MUST be answered (per spec)
@@ -36,14 +37,9 @@ async def run_submit_gate(
     Raises HTTP 400 with structured payload if gate fails.
     Per spec: SubmitValidationError payload format.
     """
-    # ── Count active questions for this framework ──────────────────────────────
-    q_result = await db.execute(
-        select(func.count()).select_from(Question).where(
-            Question.framework_id == assessment.framework_id,
-            Question.is_active == True,
-        )
-    )
-    total_questions = q_result.scalar_one()
+    # ── Count active questions for this framework (reference cache) ────────────
+    questions = await get_reference_cache().questions(db, assessment.framework_id)
+    total_questions = questions.active_count
 
     if total_questions == 0:
         raise HTTPException(status_code=500, detail="No active questions found for framework")
@@ -61,15 +57,16 @@ async def run_submit_gate(
 
     # ── Check critical questions ───────────────────────────────────────────────
     # Get all answers for critical question codes
+    critical_ids = {
+        questions.by_code[code].id: code for code in CRITICAL_QUESTION_CODES if code in questions.by_code
+    }
     crit_result = await db.execute(
-        select(Question.question_code, Answer.value)
-        .join(Answer, Answer.question_id == Question.id)
-        .where(
+        select(Answer.question_id, Answer.value).where(
             Answer.assessment_id == assessment.id,
-            Question.question_code.in_(CRITICAL_QUESTION_CODES),
+            Answer.question_id.in_(list(critical_ids)),
         )
     )
-    answered_critical = {row.question_code: row.value for row in crit_result.all()}
+    answered_critical = {critical_ids[question_id]: value for question_id, value in crit_result.all()}
 
     missing_critical = []
     for code in CRITICAL_QUESTION_CODES:
@@ -0,0 +1,218 @@
+"""
+Workforce CSV import — streaming, chunked, set-based.
+The upload (Starlette spools large bodies to disk) is decoded and parsed incrementally; rows are
+validated in chunks of WORKFORCE_IMPORT_CHUNK_ROWS and each chunk is written with one
+INSERT … ON CONFLICT (tenant_id, email) DO UPDATE (unique index ix_employees_email_tenant).
+Created vs updated comes from RETURNING (xmax = 0 → inserted).
+
+Progress: the WorkforceImportLog row is created up front (status running) and its counters /
+processed_rows are committed after every chunk, so GET /workforce/import-logs/{id} can show
+progress of a large roster. Chunks already committed stay imported if a later one fails
+(status failed); re-running the same file is idempotent. Per-row errors are kept in
+WorkforceImportLog.errors (first WORKFORCE_IMPORT_MAX_ERRORS).
+If the process dies mid-import nothing can mark the log failed; fail_stale_imports() (called by
+the import-log endpoints) does it once updated_at is WORKFORCE_IMPORT_STALE_AFTER_SECONDS old.
+"""
+import codecs
+import csv
+from datetime import datetime, timedelta, timezone
+from typing import BinaryIO, Iterator, Optional
+
+from sqlalchemy import func, literal, literal_column, update
+from sqlalchemy.dialects.postgresql import JSONB, insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.workforce import Employee, WorkforceImportLog
+
+CSV_TEMPLATE_HEADERS = ["email", "first_name", "last_name", "department", "role_title"]
+_READ_BLOCK = 1024 * 1024
+
+
+def _detect_encoding(f: BinaryIO) -> str:
+    """utf-8-sig if the whole file decodes as UTF-8 (checked block by block), else latin-1."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    try:
+        while True:
+            block = f.read(_READ_BLOCK)
+            decoder.decode(block, final=not block)
+            if not block:
+                return "utf-8-sig"
+    except UnicodeDecodeError:
+        return "latin-1"
+    finally:
+        f.seek(0)
+
+
+def _iter_lines(f: BinaryIO, encoding: str) -> Iterator[str]:
+    """Decoded lines (with their "\\n") for csv.reader, one block in memory at a time."""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    pending = ""
+    while True:
+        block = f.read(_READ_BLOCK)
+        pending += decoder.decode(block, final=not block)
+        *lines, pending = pending.split("\n")
+        for line in lines:
+            yield line + "\n"
+        if not block:
+            break
+    if pending:
+        yield pending
+
+
+class WorkforceImportError(ValueError):
+    """The upload cannot be imported at all (e.g. missing columns)."""
+
+
+class _Importer:
+    def __init__(self, db: AsyncSession, log: WorkforceImportLog):
+        self.db = db
+        self.log = log
+        self.errors: list[dict] = []
+        self.error_count = 0
+
+    def error(self, row_num: int, message: str) -> None:
+        self.error_count += 1
+        if len(self.errors) < settings.WORKFORCE_IMPORT_MAX_ERRORS:
+            self.errors.append({"row": row_num, "error": message})
+
+    async def write_chunk(self, rows: list[dict], skipped: int) -> None:
+        """One upsert for the chunk; a repeated email keeps its last row (counted as an update)."""
+        created = updated = 0
+        by_email: dict[str, dict] = {}
+        for row in rows:
+            if row["email"] in by_email:
+                updated += 1
+            by_email[row["email"]] = row
+        if by_email:
+            stmt = pg_insert(Employee).values(
+                # Sorted: concurrent imports lock rows in the same order
+                [by_email[email] for email in sorted(by_email)]
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["tenant_id", "email"],
+                set_={
+                    "first_name": stmt.excluded.first_name,
+                    "last_name": stmt.excluded.last_name,
+                    "department": stmt.excluded.department,
+                    "role_title": stmt.excluded.role_title,
+                    "updated_at": func.now(),
+                },
+            ).returning(literal_column("(xmax = 0)").label("inserted"))
+            for inserted in (await self.db.execute(stmt)).scalars():
+                if inserted:
+                    created += 1
+                else:
+                    updated += 1
+
+        log = self.log
+        log.created_count += created
+        log.updated_count += updated
+        log.skipped_count += skipped
+        log.processed_rows += len(rows) + skipped
+        log.total_rows = log.processed_rows
+        log.errors = list(self.errors) or None
+        log.updated_at = datetime.now(timezone.utc)
+        await self.db.commit()
+
+
+async def import_employees_csv(
+    db: AsyncSession,
+    tenant_id: str,
+    imported_by: Optional[str],
+    filename: Optional[str],
+    f: BinaryIO,
+) -> WorkforceImportLog:
+    """Stream-import a roster CSV (columns CSV_TEMPLATE_HEADERS). Commits per chunk; returns the finished log."""
+    reader = csv.DictReader(_iter_lines(f, _detect_encoding(f)))
+    if not reader.fieldnames or set(reader.fieldnames) < set(CSV_TEMPLATE_HEADERS):
+        raise WorkforceImportError(
+            "CSV must include columns: email, first_name, last_name, department, role_title"
+        )
+
+    log = WorkforceImportLog(
+        tenant_id=tenant_id,
+        imported_by=imported_by,
+        filename=filename,
+        status="running",
+        total_rows=0,
+        processed_rows=0,
+        created_count=0,
+        updated_count=0,
+        skipped_count=0,
+        updated_at=datetime.now(timezone.utc),
+    )
+    db.add(log)
+    await db.commit()
+
+    log_id = log.id
+    importer = _Importer(db, log)
+    chunk_size = max(1, settings.WORKFORCE_IMPORT_CHUNK_ROWS)
+    try:
+        rows: list[dict] = []
+        skipped = 0
+        for row_num, row in enumerate(reader, start=2):
+            email = (row.get("email") or "").strip()
+            first_name = (row.get("first_name") or "").strip()
+            last_name = (row.get("last_name") or "").strip()
+            if not email or not first_name or not last_name:
+                skipped += 1
+                importer.error(row_num, "Missing email, first_name, or last_name")
+            else:
+                rows.append({
+                    "tenant_id": tenant_id,
+                    "email": email,
+                    "first_name": first_name,
+                    "last_name": last_name,
+                    "department": (row.get("department") or "").strip() or None,
+                    "role_title": (row.get("role_title") or "").strip() or None,
+                })
+            if len(rows) + skipped >= chunk_size:
+                await importer.write_chunk(rows, skipped)
+                rows, skipped = [], 0
+        if rows or skipped:
+            await importer.write_chunk(rows, skipped)
+    except BaseException as e:
+        # BaseException: a cancelled request (client gone, shutdown) must not leave the log running
+        await db.rollback()
+        await db.execute(
+            update(WorkforceImportLog)
+            .where(WorkforceImportLog.id == log_id)
+            .values(
+                status="failed",
+                errors=(importer.errors + [{"row": None, "error": f"Import aborted: {str(e)[:200]}"}]),
+                updated_at=datetime.now(timezone.utc),
+                finished_at=datetime.now(timezone.utc),
+            )
+        )
+        await db.commit()
+        raise
+
+    log.status = "completed"
+    log.finished_at = datetime.now(timezone.utc)
+    if importer.error_count > len(importer.errors):
+        log.errors = importer.errors + [
+            {"row": None, "error": f"{importer.error_count - len(importer.errors)} more row errors not shown"}
+        ]
+    await db.commit()
+    return log
+
+
+async def fail_stale_imports(db: AsyncSession, tenant_id: str) -> None:
+    """Mark running imports without progress for WORKFORCE_IMPORT_STALE_AFTER_SECONDS as failed (caller commits)."""
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=settings.WORKFORCE_IMPORT_STALE_AFTER_SECONDS)
+    note = [{"row": None, "error": "Import aborted: no progress (importing process stopped)"}]
+    await db.execute(
+        update(WorkforceImportLog)
+        .where(
+            WorkforceImportLog.tenant_id == tenant_id,
+            WorkforceImportLog.status == "running",
+            func.coalesce(WorkforceImportLog.updated_at, WorkforceImportLog.created_at) < cutoff,
+        )
+        .values(
+            status="failed",
+            errors=func.coalesce(WorkforceImportLog.errors, literal([], JSONB)).op("||")(literal(note, JSONB)),
+            finished_at=func.now(),
+        )
+        .execution_options(synchronize_session=False)
+    )
@@ -0,0 +1,37 @@
+"""Engine dirty-control tracking for incremental re-evaluation.
+
+Revision ID: 014_engine_dirty_controls
+Revises: 013_audit_workflow
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+
+_UUID = PG_UUID(as_uuid=False)
+
+revision: str = "014_engine_dirty_controls"
+down_revision: Union[str, None] = "013_audit_workflow"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "engine_dirty_controls",
+        sa.Column("id", _UUID, primary_key=True),
+        sa.Column("tenant_id", _UUID, sa.ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("assessment_id", _UUID, sa.ForeignKey("assessments.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("control_id", _UUID, sa.ForeignKey("controls.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("reason", sa.Text(), nullable=False),
+        sa.Column("marked_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_unique_constraint(
+        "uq_engine_dirty_control", "engine_dirty_controls", ["assessment_id", "control_id"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("engine_dirty_controls")
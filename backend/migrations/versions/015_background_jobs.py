@@ -0,0 +1,50 @@
+"""Background job queue (DB-backed engine runs).
+
+Revision ID: 015_background_jobs
+Revises: 014_engine_dirty_controls
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, JSONB
+
+_UUID = PG_UUID(as_uuid=False)
+
+revision: str = "015_background_jobs"
+down_revision: Union[str, None] = "014_engine_dirty_controls"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "background_jobs",
+        sa.Column("id", _UUID, primary_key=True),
+        sa.Column("tenant_id", _UUID, sa.ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("job_type", sa.Text(), nullable=False),
+        sa.Column("entity_type", sa.Text(), nullable=True),
+        sa.Column("entity_id", sa.Text(), nullable=True),
+        sa.Column("status", sa.Text(), nullable=False, server_default="queued"),
+        sa.Column("payload", JSONB(), nullable=True),
+        sa.Column("result", JSONB(), nullable=True),
+        sa.Column("progress", JSONB(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("attempts", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("max_attempts", sa.Integer(), nullable=False, server_default=sa.text("3")),
+        sa.Column("cancel_requested", sa.Boolean(), nullable=False, server_default=sa.false()),
+        sa.Column("requested_by_user_id", _UUID, sa.ForeignKey("users.id", ondelete="SET NULL"), nullable=True),
+        sa.Column("available_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("heartbeat_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index("ix_background_jobs_status_available", "background_jobs", ["status", "available_at"])
+    op.create_index("ix_background_jobs_tenant_status", "background_jobs", ["tenant_id", "status"])
+    op.create_index("ix_background_jobs_entity", "background_jobs", ["entity_type", "entity_id"])
+
+
+def downgrade() -> None:
+    op.drop_table("background_jobs")
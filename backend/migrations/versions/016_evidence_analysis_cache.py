@@ -0,0 +1,43 @@
+"""Evidence analysis result cache (Claude analyst).
+
+Revision ID: 016_evidence_analysis_cache
+Revises: 015_background_jobs
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, JSONB
+
+_UUID = PG_UUID(as_uuid=False)
+
+revision: str = "016_evidence_analysis_cache"
+down_revision: Union[str, None] = "015_background_jobs"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "evidence_analysis_cache",
+        sa.Column("cache_key", sa.Text(), primary_key=True),
+        sa.Column("tenant_id", _UUID, sa.ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("text_sha256", sa.Text(), nullable=False),
+        sa.Column("control_code", sa.Text(), nullable=False),
+        sa.Column("guidance_sha256", sa.Text(), nullable=False),
+        sa.Column("prompt_version", sa.Text(), nullable=False),
+        sa.Column("model", sa.Text(), nullable=False),
+        sa.Column("result_payload", JSONB(), nullable=False),
+        sa.Column("hit_count", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("last_used_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+    )
+    op.create_index("ix_evidence_analysis_cache_expires", "evidence_analysis_cache", ["expires_at"])
+    op.create_index("ix_evidence_analysis_cache_last_used", "evidence_analysis_cache", ["last_used_at"])
+    op.create_index("ix_evidence_analysis_cache_tenant", "evidence_analysis_cache", ["tenant_id"])
+
+
+def downgrade() -> None:
+    op.drop_table("evidence_analysis_cache")
@@ -0,0 +1,49 @@
+"""Extract-once evidence content (shared extraction per tenant + sha256).
+
+Revision ID: 017_evidence_content_extractions
+Revises: 016_evidence_analysis_cache
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID, JSONB
+
+_UUID = PG_UUID(as_uuid=False)
+
+revision: str = "017_evidence_content_extractions"
+down_revision: Union[str, None] = "016_evidence_analysis_cache"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "evidence_content_extractions",
+        sa.Column("id", _UUID, primary_key=True),
+        sa.Column("tenant_id", _UUID, sa.ForeignKey("tenants.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("sha256", sa.Text(), nullable=False),
+        sa.Column("content_type", sa.Text(), nullable=False),
+        sa.Column("status", sa.Text(), nullable=False, server_default="extract_pending"),
+        sa.Column("extraction_result", JSONB(), nullable=True),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+        sa.UniqueConstraint("tenant_id", "sha256", name="uq_evidence_content_extraction"),
+    )
+    op.create_index("ix_evidence_content_extractions_status", "evidence_content_extractions", ["status", "updated_at"])
+    op.add_column(
+        "evidence_extractions",
+        sa.Column(
+            "content_extraction_id", _UUID,
+            sa.ForeignKey("evidence_content_extractions.id", ondelete="SET NULL"), nullable=True,
+        ),
+    )
+    op.create_index("ix_evidence_extractions_content", "evidence_extractions", ["content_extraction_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_evidence_extractions_content", table_name="evidence_extractions")
+    op.drop_column("evidence_extractions", "content_extraction_id")
+    op.drop_table("evidence_content_extractions")
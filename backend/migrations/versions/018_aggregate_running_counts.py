@@ -0,0 +1,105 @@
+"""Running counts on control evidence aggregates (incremental maintenance).
+
+Revision ID: 018_aggregate_running_counts
+Revises: 017_evidence_content_extractions
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "018_aggregate_running_counts"
+down_revision: Union[str, None] = "017_evidence_content_extractions"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_COUNT_COLUMNS = ("validated_count", "weak_count", "mismatch_count", "unreadable_count", "strength_count")
+
+
+def upgrade() -> None:
+    for name in _COUNT_COLUMNS:
+        op.add_column(
+            "control_evidence_aggregates",
+            sa.Column(name, sa.Integer(), nullable=False, server_default="0"),
+        )
+    op.add_column(
+        "control_evidence_aggregates",
+        sa.Column("strength_sum", sa.Float(), nullable=False, server_default="0"),
+    )
+    # Backfill: full set-based recompute from existing analysis results. Pairs that have results
+    # but no aggregate row yet get one, so apply_result_deltas never starts them from zero.
+    # Status/score mirror evidence_aggregator.aggregate_status() and SCORE_MAP.
+    op.execute(
+        """
+        INSERT INTO control_evidence_aggregates (
+            id, tenant_id, assessment_id, control_id, status, score, evidence_count,
+            analysis_ids_used, avg_strength, findings_summary,
+            validated_count, weak_count, mismatch_count, unreadable_count,
+            strength_sum, strength_count, updated_at
+        )
+        SELECT gen_random_uuid(), c.tenant_id, c.assessment_id, c.control_id, s.status,
+               CASE s.status WHEN 'strong' THEN 100 WHEN 'adequate' THEN 75 WHEN 'weak' THEN 40 ELSE 10 END,
+               c.evidence_count, c.analysis_ids_used, c.avg_strength,
+               (
+                   SELECT coalesce(jsonb_agg(f.e ORDER BY f.n), '[]'::jsonb)
+                   FROM (
+                       SELECT to_jsonb(e.value #>> '{}') AS e,
+                              row_number() OVER (ORDER BY r.created_at, r.id, e.i) AS n
+                       FROM evidence_assessment_results r
+                       CROSS JOIN LATERAL jsonb_array_elements(
+                           CASE WHEN jsonb_typeof(r.result_payload -> 'findings') = 'array'
+                                THEN r.result_payload -> 'findings' ELSE '[]'::jsonb END
+                       ) WITH ORDINALITY AS e(value, i)
+                       WHERE r.assessment_id = c.assessment_id AND r.control_id = c.control_id
+                   ) f
+                   WHERE f.n <= 10
+               ),
+               c.validated_count, c.weak_count, c.mismatch_count, c.unreadable_count,
+               c.strength_sum, c.strength_count, now()
+        FROM (
+            SELECT tenant_id, assessment_id, control_id,
+                   count(*) AS evidence_count,
+                   jsonb_agg(id::text ORDER BY created_at, id) AS analysis_ids_used,
+                   count(*) FILTER (WHERE status = 'validated') AS validated_count,
+                   count(*) FILTER (WHERE status = 'weak') AS weak_count,
+                   count(*) FILTER (WHERE status = 'mismatch') AS mismatch_count,
+                   count(*) FILTER (WHERE status = 'unreadable') AS unreadable_count,
+                   coalesce(sum(overall_strength), 0) AS strength_sum,
+                   count(overall_strength) AS strength_count,
+                   coalesce(round(avg(overall_strength)::numeric, 3)::float, 0) AS avg_strength
+            FROM evidence_assessment_results
+            GROUP BY tenant_id, assessment_id, control_id
+        ) c
+        CROSS JOIN LATERAL (
+            SELECT CASE
+                WHEN c.mismatch_count > 0 THEN 'insufficient'
+                WHEN c.unreadable_count = c.evidence_count THEN 'insufficient'
+                WHEN c.validated_count = c.evidence_count AND c.avg_strength >= 0.7 THEN 'strong'
+                WHEN c.validated_count > 0 THEN 'adequate'
+                WHEN c.weak_count = c.evidence_count THEN 'weak'
+                ELSE 'insufficient'
+            END AS status
+        ) s
+        ON CONFLICT (assessment_id, control_id) DO UPDATE SET
+            status = excluded.status,
+            score = excluded.score,
+            evidence_count = excluded.evidence_count,
+            analysis_ids_used = excluded.analysis_ids_used,
+            avg_strength = excluded.avg_strength,
+            findings_summary = excluded.findings_summary,
+            validated_count = excluded.validated_count,
+            weak_count = excluded.weak_count,
+            mismatch_count = excluded.mismatch_count,
+            unreadable_count = excluded.unreadable_count,
+            strength_sum = excluded.strength_sum,
+            strength_count = excluded.strength_count,
+            updated_at = excluded.updated_at
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("control_evidence_aggregates", "strength_sum")
+    for name in reversed(_COUNT_COLUMNS):
+        op.drop_column("control_evidence_aggregates", name)
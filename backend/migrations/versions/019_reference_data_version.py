@@ -0,0 +1,29 @@
+"""Reference data version counter (invalidates in-process reference caches).
+
+Revision ID: 019_reference_data_version
+Revises: 018_aggregate_running_counts
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "019_reference_data_version"
+down_revision: Union[str, None] = "018_aggregate_running_counts"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "reference_data_version",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("version", sa.BigInteger(), nullable=False, server_default="1"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.execute("INSERT INTO reference_data_version (id, version) VALUES (1, 1)")
+
+
+def downgrade() -> None:
+    op.drop_table("reference_data_version")
@@ -0,0 +1,26 @@
+"""Optimistic version stamp on answers (batched autosave conflict detection).
+
+Revision ID: 020_answer_versions
+Revises: 019_reference_data_version
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "020_answer_versions"
+down_revision: Union[str, None] = "019_reference_data_version"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "answers",
+        sa.Column("version", sa.Integer(), nullable=False, server_default="1"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("answers", "version")
@@ -0,0 +1,38 @@
+"""Workforce CSV import progress (streaming chunked import).
+
+Revision ID: 021_workforce_import_progress
+Revises: 020_answer_versions
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "021_workforce_import_progress"
+down_revision: Union[str, None] = "020_answer_versions"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing logs were written after the import finished
+    op.add_column(
+        "workforce_import_logs",
+        sa.Column("status", sa.Text(), nullable=False, server_default="completed"),
+    )
+    op.add_column(
+        "workforce_import_logs",
+        sa.Column("processed_rows", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "workforce_import_logs",
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.execute("UPDATE workforce_import_logs SET processed_rows = total_rows, finished_at = created_at")
+
+
+def downgrade() -> None:
+    op.drop_column("workforce_import_logs", "finished_at")
+    op.drop_column("workforce_import_logs", "processed_rows")
+    op.drop_column("workforce_import_logs", "status")
@@ -0,0 +1,27 @@
+"""Workforce import last-progress timestamp (stale running imports are failed).
+
+Revision ID: 022_workforce_import_updated_at
+Revises: 021_workforce_import_progress
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "022_workforce_import_updated_at"
+down_revision: Union[str, None] = "021_workforce_import_progress"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "workforce_import_logs",
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.execute("UPDATE workforce_import_logs SET updated_at = COALESCE(finished_at, created_at)")
+
+
+def downgrade() -> None:
+    op.drop_column("workforce_import_logs", "updated_at")
@@ -0,0 +1,130 @@
+"""
+Benchmark — Claude evidence analyst against a local stub server.
+Starts a stub Anthropic Messages endpoint (fixed latency, a share of 429 responses with
+Retry-After), points ANTHROPIC_BASE_URL at it and runs analyze_evidence_batch() through the
+analyst scheduler. Shows wall time vs. the serial lower bound, plus scheduler counters.
+With --controls-per-doc K each document is linked to K controls; compare the request and
+token counts with CLAUDE_ANALYST_MAX_CONTROLS_PER_CALL=1 (one call per pair).
+
+No API key, database or network required.
+
+Run: docker compose exec backend python scripts/bench_claude_analyst.py [--items 40] [--controls-per-doc 4] [--latency 0.5] [--rate-limit-every 10]
+"""
+import argparse
+import asyncio
+import json
+import os
+import re
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import settings
+from app.services import claude_analyst
+
+ANALYST_RESULT = {
+    "status": "validated",
+    "overall_strength": 0.8,
+    "confidence": 0.9,
+    "findings": ["Policy covers scope and effective date."],
+    "recommended_next_step": "None.",
+    "document_type_detected": "policy",
+}
+
+
+def _stub_answer(prompt: str) -> str:
+    # Multi-control prompts list controls as "N. code — title"
+    listed = re.findall(r"^(\d+)\. ", prompt.split("Extracted document text")[0], flags=re.MULTILINE)
+    if not listed:
+        return json.dumps(ANALYST_RESULT)
+    return json.dumps({"results": [{"control_index": int(n), **ANALYST_RESULT} for n in listed]})
+
+
+def _start_stub(latency: float, rate_limit_every: int) -> ThreadingHTTPServer:
+    counter = {"n": 0}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def do_POST(self):
+            request = json.loads(self.rfile.read(int(self.headers.get("content-length") or 0)) or b"{}")
+            prompt = request["messages"][0]["content"] if request.get("messages") else ""
+            with lock:
+                counter["n"] += 1
+                n = counter["n"]
+            if rate_limit_every and n % rate_limit_every == 0:
+                body = json.dumps({"type": "error", "error": {"type": "rate_limit_error", "message": "stub"}}).encode()
+                self.send_response(429)
+                self.send_header("retry-after", "1")
+            else:
+                time.sleep(latency)
+                answer = _stub_answer(prompt)
+                body = json.dumps({
+                    "id": f"msg_{n}", "type": "message", "role": "assistant", "model": settings.LLM_MODEL,
+                    "content": [{"type": "text", "text": answer}],
+                    "stop_reason": "end_turn", "stop_sequence": None,
+                    "usage": {"input_tokens": len(prompt) // 4, "output_tokens": len(answer) // 4},
+                }).encode()
+                self.send_response(200)
+            self.send_header("content-type", "application/json")
+            self.send_header("content-length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+async def _run(items: int, controls_per_doc: int) -> tuple[float, list[dict]]:
+    batch = [
+        {
+            "extracted_text": (
+                f"Access Control Policy {i // controls_per_doc}. Effective date 2026-01-01. Scope: all ePHI systems. " * 40
+            ),
+            "control_code": f"164.312(a)({i % controls_per_doc})",
+            "control_title": "Access control",
+        }
+        for i in range(items)
+    ]
+    t0 = time.perf_counter()
+    results = await claude_analyst.analyze_evidence_batch(batch)
+    return time.perf_counter() - t0, results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--items", type=int, default=40)
+    parser.add_argument("--controls-per-doc", type=int, default=4, help="pairs sharing one document")
+    parser.add_argument("--latency", type=float, default=0.5, help="stub response latency, seconds")
+    parser.add_argument("--rate-limit-every", type=int, default=10, help="every Nth request gets 429 (0 = never)")
+    args = parser.parse_args()
+
+    server = _start_stub(args.latency, args.rate_limit_every)
+    settings.ANTHROPIC_BASE_URL = f"http://127.0.0.1:{server.server_address[1]}"
+    settings.ANTHROPIC_API_KEY = settings.ANTHROPIC_API_KEY or "stub-key"
+    settings.CLAUDE_ANALYST_ENABLED = True
+
+    try:
+        wall, results = asyncio.run(_run(args.items, max(1, args.controls_per_doc)))
+    finally:
+        server.shutdown()
+
+    ok = sum(1 for r in results if r["status"] == "validated")
+    stats = claude_analyst.get_analyst_scheduler().stats
+    print(
+        f"{args.items} analyses ({args.controls_per_doc} controls per document, "
+        f"{settings.CLAUDE_ANALYST_MAX_CONTROLS_PER_CALL} per call), latency {args.latency}s, concurrency {settings.CLAUDE_ANALYST_CONCURRENCY}, "
+        f"{settings.CLAUDE_ANALYST_REQUESTS_PER_MINUTE} req/min, {settings.CLAUDE_ANALYST_TOKENS_PER_MINUTE} tok/min"
+    )
+    print(f"wall {wall:.2f}s | serial lower bound {args.items * args.latency:.2f}s | validated {ok}/{args.items}")
+    print("scheduler:", json.dumps(stats))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,165 @@
+"""
+Benchmark — compliance engine write path.
+Measures DB round-trips and wall time of run_engine() as the number of controls grows,
+and compares it with the legacy per-row flush write path.
+
+Uses a synthetic framework/assessment created inside a transaction that is rolled back
+at the end, so the target database is left untouched.
+
+Run: docker compose exec backend python scripts/bench_engine.py [--sizes 10,40,160,640] [--repeat 3]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+import uuid
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
+from app.core.config import settings
+from app.models.models import (
+    Framework, ControlsetVersion, RulesetVersion, Control, Rule, Question,
+    User, Tenant, Assessment, Answer,
+    ControlResult, Gap, Risk, RemediationAction,
+)
+from app.services import engine as engine_service
+
+engine = create_async_engine(settings.DATABASE_URL, echo=False)
+SessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+CHOICES = ["Yes", "No", "Partial"]
+
+
+class RoundTripCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, *args, **kwargs):
+        self.count += 1
+
+
+async def _seed(db: AsyncSession, n_controls: int) -> Assessment:
+    tag = uuid.uuid4().hex[:8]
+    fw = Framework(code=f"BENCH-{tag}", name="Benchmark framework")
+    db.add(fw)
+    await db.flush()
+    csv = ControlsetVersion(framework_id=fw.id, version="bench", is_active=False)
+    rsv = RulesetVersion(framework_id=fw.id, version="bench", is_active=False)
+    user = User(email=f"bench-{tag}@example.invalid", password_hash="x")
+    tenant = Tenant(name=f"Bench {tag}")
+    db.add_all([csv, rsv, user, tenant])
+    await db.flush()
+
+    controls = []
+    for i in range(n_controls):
+        controls.append(Control(
+            framework_id=fw.id, controlset_version_id=csv.id,
+            control_code=f"X{i:04d}", title=f"Bench control {i}",
+            category="Administrative", severity=["Low", "Medium", "High", "Critical"][i % 4],
+        ))
+    db.add_all(controls)
+    await db.flush()
+
+    assessment = Assessment(
+        tenant_id=tenant.id, framework_id=fw.id,
+        controlset_version_id=csv.id, ruleset_version_id=rsv.id,
+        status="submitted", created_by_user_id=user.id,
+    )
+    db.add(assessment)
+    await db.flush()
+
+    for i, c in enumerate(controls):
+        q = Question(
+            framework_id=fw.id, control_id=c.id, question_code=f"X{i:04d}-Q1",
+            text="Bench question", answer_type="yes_no_partial",
+        )
+        db.add(q)
+        db.add(Rule(ruleset_version_id=rsv.id, control_id=c.id, pattern="PATTERN_2_PARTIAL"))
+        await db.flush()
+        db.add(Answer(
+            tenant_id=tenant.id, assessment_id=assessment.id,
+            question_id=q.id, value={"choice": CHOICES[i % len(CHOICES)]},
+        ))
+    await db.flush()
+    return assessment
+
+
+async def _legacy_write(assessment: Assessment, db: AsyncSession) -> None:
+    """
+    Old write path: one flush per ControlResult / Gap / Risk to obtain primary keys.
+    Re-writes the outputs of the previous batched run, so only the write cost is measured.
+    """
+    results = (await db.execute(
+        ControlResult.__table__.select().where(ControlResult.assessment_id == assessment.id)
+    )).all()
+    for model in (RemediationAction, Risk, Gap, ControlResult):
+        await db.execute(model.__table__.delete().where(model.assessment_id == assessment.id))
+    for row in results:
+        db.add(ControlResult(
+            tenant_id=row.tenant_id, assessment_id=row.assessment_id, control_id=row.control_id,
+            status=row.status, severity=row.severity, rationale=row.rationale,
+        ))
+        await db.flush()
+        if row.status != "Pass":
+            gap = Gap(
+                tenant_id=row.tenant_id, assessment_id=row.assessment_id, control_id=row.control_id,
+                status_source=row.status, severity=row.severity, description="bench",
+            )
+            db.add(gap)
+            await db.flush()
+            db.add(Risk(
+                tenant_id=row.tenant_id, assessment_id=row.assessment_id, gap_id=gap.id,
+                severity=row.severity, description="bench",
+            ))
+            await db.flush()
+            db.add(RemediationAction(
+                tenant_id=row.tenant_id, assessment_id=row.assessment_id, gap_id=gap.id,
+                priority=row.severity, effort="S", remediation_type="Process", description="bench",
+            ))
+    await db.flush()
+
+
+async def _measure(db: AsyncSession, fn, assessment: Assessment, repeat: int) -> tuple[int, float]:
+    counter = RoundTripCounter()
+    event.listen(engine.sync_engine, "before_cursor_execute", counter)
+    try:
+        timings = []
+        counts = []
+        for _ in range(repeat):
+            counter.count = 0
+            t0 = time.perf_counter()
+            await fn(assessment, db)
+            timings.append(time.perf_counter() - t0)
+            counts.append(counter.count)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", counter)
+    return counts[-1], statistics.median(timings)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10,40,160,640", help="comma-separated control counts")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+    sizes = [int(s) for s in args.sizes.split(",") if s.strip()]
+
+    print(f"{'controls':>9} | {'batched RT':>10} {'batched ms':>10} | {'per-row RT':>10} {'per-row ms':>10}")
+    print("-" * 60)
+    for n in sizes:
+        async with SessionLocal() as db:
+            try:
+                assessment = await _seed(db, n)
+                new_rt, new_t = await _measure(db, engine_service.run_engine, assessment, args.repeat)
+                old_rt, old_t = await _measure(db, _legacy_write, assessment, args.repeat)
+                print(f"{n:>9} | {new_rt:>10} {new_t * 1000:>10.1f} | {old_rt:>10} {old_t * 1000:>10.1f}")
+            finally:
+                await db.rollback()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
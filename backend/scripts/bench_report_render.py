@@ -0,0 +1,142 @@
+"""
+Benchmark — report artifact rendering.
+Renders the 5 package artifacts (executive summary PDF + 4 XLSX) from synthetic data
+for an N-control assessment, sequentially on one thread vs. in parallel in a
+process / thread pool (same executors as report_generator.run_renderer).
+
+No database or storage required — only the pure render_* functions are exercised.
+
+Run: docker compose exec backend python scripts/bench_report_render.py [--controls 40] [--pool-size 5] [--repeat 3]
+"""
+import argparse
+import asyncio
+import multiprocessing
+import os
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.report_generator import (
+    render_executive_summary, render_gap_register, render_risk_register,
+    render_roadmap, render_evidence_checklist, _template_narrative,
+)
+
+SEVERITIES = ["Low", "Medium", "High", "Critical"]
+STATUSES = ["Pass", "Fail", "Partial", "Unknown"]
+CATEGORIES = ["Administrative", "Physical", "Technical", "Vendor"]
+
+
+def _synthetic_jobs(n_controls: int) -> list[tuple]:
+    controls = [
+        {
+            "control_code": f"X{i:04d}",
+            "title": f"Benchmark control {i} — access management and audit logging",
+            "category": CATEGORIES[i % 4],
+            "severity": SEVERITIES[i % 4],
+            "status": STATUSES[i % 4],
+        }
+        for i in range(n_controls)
+    ]
+    failing = [c for c in controls if c["status"] != "Pass"]
+    desc = "Control is not fully implemented; documented procedure and technical enforcement are missing. " * 2
+
+    gaps = [
+        {**c, "status_source": c["status"], "description": desc,
+         "recommended_remediation": "Document and enforce the procedure.", "evidence_provided": i % 2 == 0}
+        for i, c in enumerate(failing)
+    ]
+    risks = [
+        {**c, "description": desc, "rationale": "Derived from gap.", "recommended_remediation": "Remediate."}
+        for c in failing
+    ]
+    actions = [
+        {**c, "priority": c["severity"], "effort": "M", "remediation_type": "Process", "description": desc,
+         "dependency": None, "template_reference": "TMPL_BENCH"}
+        for c in failing
+    ]
+    checklist = [
+        {**c, "evidence_type": "Policy", "files": [f"policy_{i}.pdf"] if i % 3 == 0 else []}
+        for i, c in enumerate(controls)
+    ]
+
+    class _T:
+        name = "Benchmark Clinic"
+
+    stats = {
+        "total": n_controls,
+        "pass": sum(1 for c in controls if c["status"] == "Pass"),
+        "fail": sum(1 for c in controls if c["status"] == "Fail"),
+        "partial": sum(1 for c in controls if c["status"] == "Partial"),
+        "unknown": sum(1 for c in controls if c["status"] == "Unknown"),
+        "gaps": len(gaps),
+    }
+    summary = {
+        "tenant_name": _T.name,
+        "submitted_at": datetime.now(timezone.utc),
+        "scope_note": "Full organizational scope — all ePHI systems and workflows.",
+        "stats": stats,
+        "narrative": _template_narrative(_T, None, stats, []),
+        "used_claude": False,
+        "top_gaps": [{"severity": g["severity"], "description": g["description"]} for g in gaps[:15]],
+    }
+    return [
+        (render_executive_summary, summary),
+        (render_gap_register, gaps),
+        (render_risk_register, risks),
+        (render_roadmap, actions),
+        (render_evidence_checklist, checklist),
+    ]
+
+
+def _sequential(jobs) -> int:
+    return sum(len(fn(data)) for fn, data in jobs)
+
+
+async def _parallel(executor, jobs) -> int:
+    loop = asyncio.get_running_loop()
+    results = await asyncio.gather(*(loop.run_in_executor(executor, fn, data) for fn, data in jobs))
+    return sum(len(r) for r in results)
+
+
+def _median_ms(fn, repeat: int) -> tuple[float, int]:
+    timings, size = [], 0
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        size = fn()
+        timings.append(time.perf_counter() - t0)
+    return statistics.median(timings) * 1000, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--controls", type=int, default=40)
+    parser.add_argument("--pool-size", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    jobs = _synthetic_jobs(args.controls)
+    _sequential(jobs)  # warm-up (font/style caches)
+
+    rows = [("sequential", *_median_ms(lambda: _sequential(jobs), args.repeat))]
+
+    with ThreadPoolExecutor(max_workers=args.pool_size) as tp:
+        rows.append(("thread pool", *_median_ms(lambda: asyncio.run(_parallel(tp, jobs)), args.repeat)))
+
+    with ProcessPoolExecutor(max_workers=args.pool_size, mp_context=multiprocessing.get_context("spawn")) as pp:
+        asyncio.run(_parallel(pp, jobs))  # warm-up: spawn workers + imports
+        rows.append(("process pool", *_median_ms(lambda: asyncio.run(_parallel(pp, jobs)), args.repeat)))
+
+    base = rows[0][1]
+    print(f"{args.controls} controls, pool size {args.pool_size}, cpu_count {os.cpu_count()}")
+    print(f"{'mode':>13} | {'wall ms':>8} | {'speedup':>7} | {'bytes':>8}")
+    print("-" * 46)
+    for name, ms, size in rows:
+        print(f"{name:>13} | {ms:>8.1f} | {base / ms:>6.2f}x | {size:>8}")
+
+
+if __name__ == "__main__":
+    main()
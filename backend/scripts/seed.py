@@ -27,6 +27,7 @@ from app.models.models import (
 )
 from app.data.control_mapping import CONTROL_CODE_TO_HIPAA_ID
 from app.models.training import TrainingModule, TrainingQuestion
+from app.services.reference_data import bump_reference_data_version
 
 engine = create_async_engine(settings.DATABASE_URL, echo=False)
 SessionLocal = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
@@ -452,6 +453,8 @@ async def seed():
         else:
             print(f"✓ Demo client: {demo_result['tenant_name']} (login: {demo_result['client_email']} / {demo_result['client_password']})")
 
+        # Running API/worker processes drop cached controls/rules/questions
+        await bump_reference_data_version(db)
         await db.commit()
         print("\n✅ Seed complete.")
         print(f"   Framework ID : {framework.id}")
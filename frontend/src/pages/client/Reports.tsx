@@ -150,19 +150,13 @@ export default function ClientReports() {
     if (!tenantId) return
     setDownloadingFile(packageId)
     try {
-      const filesRes = await reportsApi.listPackageFiles(tenantId, packageId)
-      const files = (filesRes.data || []) as ReportFileDTO[]
-      const execFile = files.find((f) => f.file_type === 'executive_summary') || files[0]
-      if (!execFile) {
-        toast.error('No files in this package.')
-        return
-      }
-      const res = await reportsApi.downloadFileStream(tenantId, execFile.id)
+      const res = await reportsApi.downloadBundle(tenantId, packageId)
       const blob = res.data as Blob
+      const pkg = packages.find((p) => p.id === packageId)
       const url = URL.createObjectURL(blob)
       const link = document.createElement('a')
       link.href = url
-      link.download = execFile.file_name || 'report.pdf'
+      link.download = `hipaa_report_package_v${pkg?.package_version ?? 1}.zip`
       link.click()
       URL.revokeObjectURL(url)
     } catch (e) {
@@ -7,7 +7,8 @@ import {
 } from 'lucide-react'
 import { engineApi, reportsApi, assessmentsApi } from '../../services/api'
 import {
-  ControlResultDTO, GapDTO, RiskDTO, RemediationActionDTO, AssessmentDTO
+  ControlResultDTO, GapDTO, RiskDTO, RemediationActionDTO, AssessmentDTO,
+  ReportGenerationJobDTO
 } from '../../types'
 import {
   PageLoader, SeverityBadge, StatusBadge, SectionHeader,
@@ -43,6 +44,7 @@ export default function EngineResults() {
   const [showReportModal, setShowReportModal] = useState(false)
   const [genLoading, setGenLoading] = useState(false)
   const [genError, setGenError] = useState('')
+  const [genProgress, setGenProgress] = useState('')
   const [includeAI, setIncludeAI] = useState(true)
   const [aiTone, setAiTone] = useState('neutral')
   const [expandedGap, setExpandedGap] = useState<string | null>(null)
@@ -81,16 +83,28 @@ export default function EngineResults() {
     try {
       const pkgRes = await reportsApi.createPackage(tenantId, assessmentId)
       const packageId = pkgRes.data.id
-      await reportsApi.generate(tenantId, packageId, {
+      const { data } = await reportsApi.generate(tenantId, packageId, {
         include_ai_summary: includeAI,
         ai_tone: aiTone,
       })
+      // Generation runs as a background job: poll progress until it finishes
+      let job: ReportGenerationJobDTO = data
+      while (job.status === 'queued' || job.status === 'running') {
+        const steps = Object.values(job.progress || {})
+        setGenProgress(`${steps.filter(s => s === 'done').length}/${steps.length || 6}`)
+        await new Promise(resolve => setTimeout(resolve, 1500))
+        job = (await reportsApi.generationStatus(tenantId, packageId, job.job_id)).data
+      }
+      if (job.status !== 'completed') {
+        throw new Error(job.error || `Report generation ${job.status}`)
+      }
       setShowReportModal(false)
       window.location.href = `/internal/tenants/${tenantId}/reports`
     } catch (e: any) {
       setGenError(getReportError(e))
     } finally {
       setGenLoading(false)
+      setGenProgress('')
     }
   }
 
@@ -427,7 +441,7 @@ export default function EngineResults() {
         <div className="flex gap-2 justify-end">
           <button onClick={() => setShowReportModal(false)} className="btn-secondary">Cancel</button>
           <button onClick={generateReport} disabled={genLoading} className="btn-primary">
-            {genLoading ? <><Spinner className="w-4 h-4" /> Generating…</> : <><FileText size={14} /> Generate</>}
+            {genLoading ? <><Spinner className="w-4 h-4" /> Generating… {genProgress}</> : <><FileText size={14} /> Generate</>}
           </button>
         </div>
       </Modal>
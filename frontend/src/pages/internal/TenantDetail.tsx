@@ -7,7 +7,7 @@ import {
 } from 'lucide-react'
 import { tenantsApi, assessmentsApi, frameworksApi, engineApi, reportsApi } from '../../services/api'
 import { TenantDTO, AssessmentDTO, TenantMemberDTO, FrameworkDTO } from '../../types'
-import type { ControlResultDTO, GapDTO, RemediationActionDTO } from '../../types'
+import type { ControlResultDTO, GapDTO, RemediationActionDTO, EngineRunResponse } from '../../types'
 import {
   PageLoader, StatusBadge, SeverityBadge, SectionHeader,
   EmptyState, MetricCard, Modal, Alert, Spinner
@@ -143,11 +143,25 @@ export default function TenantDetail() {
     }
   }
 
+  // Engine runs are queued server-side: poll status until the run finishes
+  const runEngineAndWait = async (assessmentId: string) => {
+    const { data } = await engineApi.run(tenantId!, assessmentId)
+    let run: EngineRunResponse = data
+    while (run.status === 'queued' || run.status === 'running') {
+      await new Promise(resolve => setTimeout(resolve, 1500))
+      run = (await engineApi.status(tenantId!, assessmentId, run.run_id)).data
+    }
+    if (run.status !== 'completed') {
+      throw new Error(run.error || `Engine run ${run.status}`)
+    }
+    return run
+  }
+
   const runEngine = async (assessmentId: string) => {
     if (!tenantId) return
     setRunningEngine(assessmentId)
     try {
-      await engineApi.run(tenantId, assessmentId)
+      await runEngineAndWait(assessmentId)
       toast.success('Compliance check complete')
       navigate(`/internal/tenants/${tenantId}/assessments/${assessmentId}/results`)
     } catch (e: any) {
@@ -165,7 +179,7 @@ export default function TenantDetail() {
       setAssessments(prev => prev.map(a => a.id === assessmentId ? { ...a, status: 'submitted', submitted_at: new Date().toISOString() } : a))
       setSubmittingId(null)
       setRunningEngine(assessmentId)
-      await engineApi.run(tenantId, assessmentId)
+      await runEngineAndWait(assessmentId)
       toast.success('Check complete')
       navigate(`/internal/tenants/${tenantId}/assessments/${assessmentId}/results`)
     } catch (e: any) {
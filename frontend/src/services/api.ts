@@ -124,6 +124,10 @@ export const evidenceApi = {
 export const engineApi = {
   run: (tenantId: string, assessmentId: string) =>
     api.post(`/tenants/${tenantId}/assessments/${assessmentId}/engine/run`),
+  status: (tenantId: string, assessmentId: string, runId: string) =>
+    api.get(`/tenants/${tenantId}/assessments/${assessmentId}/engine/status`, { params: { run_id: runId } }),
+  cancel: (tenantId: string, assessmentId: string, runId: string) =>
+    api.post(`/tenants/${tenantId}/assessments/${assessmentId}/engine/cancel`, null, { params: { run_id: runId } }),
   controls: (tenantId: string, assessmentId: string) =>
     api.get(`/tenants/${tenantId}/assessments/${assessmentId}/results/controls`),
   gaps: (tenantId: string, assessmentId: string) =>
@@ -142,6 +146,9 @@ export const reportsApi = {
     api.post(`/tenants/${tenantId}/assessments/${assessmentId}/reports/packages`, data || {}),
   generate: (tenantId: string, packageId: string, data: object) =>
     api.post(`/tenants/${tenantId}/reports/packages/${packageId}/generate`, data),
+  /** Background generation progress (poll until status is completed/failed). */
+  generationStatus: (tenantId: string, packageId: string, jobId: string) =>
+    api.get(`/tenants/${tenantId}/reports/packages/${packageId}/generation`, { params: { job_id: jobId } }),
   get: (tenantId: string, packageId: string) =>
     api.get(`/tenants/${tenantId}/reports/packages/${packageId}`),
   listPackageFiles: (tenantId: string, packageId: string) =>
@@ -150,6 +157,9 @@ export const reportsApi = {
     api.post(`/tenants/${tenantId}/reports/packages/${packageId}/publish`, data || {}),
   download: (tenantId: string, packageId: string) =>
     api.get(`/tenants/${tenantId}/reports/packages/${packageId}/download`),
+  /** ZIP of all package files, streamed through backend. */
+  downloadBundle: (tenantId: string, packageId: string) =>
+    api.get(`/tenants/${tenantId}/reports/packages/${packageId}/bundle`, { responseType: 'blob' }),
   /** Presigned URL (may not work from browser if MinIO host is internal). */
   downloadFile: (tenantId: string, fileId: string) =>
     api.get(`/tenants/${tenantId}/reports/files/${fileId}/download-url`),
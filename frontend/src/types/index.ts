@@ -174,15 +174,30 @@ export interface EvidenceLinkDTO {
 export type ControlStatus = 'Pass' | 'Partial' | 'Fail' | 'Unknown'
 export type Severity = 'Low' | 'Medium' | 'High' | 'Critical'
 
+export interface ReportGenerationJobDTO {
+  job_id: string
+  report_package_id: string
+  status: 'queued' | 'running' | 'completed' | 'failed' | 'cancelled'
+  progress: Record<string, string>
+  error: string | null
+  attempts: number
+  created_at: string | null
+  started_at: string | null
+  finished_at: string | null
+  result: Record<string, any> | null
+}
+
 export interface EngineRunResponse {
   run_id: string
   assessment_id: string
-  status: 'queued' | 'running' | 'completed' | 'failed'
+  status: 'queued' | 'running' | 'completed' | 'failed' | 'cancelled'
   started_at: string | null
   finished_at: string | null
   controlset_version_id: string
   ruleset_version_id: string
   error: string | null
+  attempts: number
+  stats: Record<string, any> | null
 }
 
 export interface ControlResultDTO {